@@ -251,7 +251,7 @@ def run_pipeline(source_file: Path, auto_mode: bool = False, skip_stages: set =
                  max_episodes: int = None, apply_mastering: bool = False,
                  peak_db: float = -3.0, rms_db: float = -20.0, review_output: bool = False,
                  review_output_dir: Path = None, use_preset_audio: bool = False,
-                 langs: str = None):
+                 langs: str = None, use_cache: bool = True):
     """
     Run complete pipeline with optional human review checkpoints
 
@@ -267,6 +267,7 @@ def run_pipeline(source_file: Path, auto_mode: bool = False, skip_stages: set =
         review_output_dir: Custom directory for review output (e.g., Google Drive path)
         use_preset_audio: If True, use preset voice_id from CSV and existing music files
         langs: Comma-separated list of languages to process (e.g., "korean,japanese")
+        use_cache: If False, stages 3a/4 ignore cached LLM responses (e.g. to retag episodes)
     """
     skip_stages = skip_stages or set()
     stats = PipelineStats()
@@ -369,6 +370,9 @@ def run_pipeline(source_file: Path, auto_mode: bool = False, skip_stages: set =
     # Convert comma-separated to space-separated for argparse nargs='+'
     langs_flag = f' --langs {langs.replace(",", " ")}' if langs else ''
 
+    # Stages 3a/4 reuse cached LLM responses unless disabled
+    cache_flag = '' if use_cache else ' --no-cache'
+
     def make_stages(series_folder):
         """Generate stage configurations with actual series_folder"""
         return [
@@ -433,7 +437,7 @@ def run_pipeline(source_file: Path, auto_mode: bool = False, skip_stages: set =
                 'description': 'Extract characters and tag speakers in dialogue',
                 'script': (f'python stage_03a_speaker_tagging.py "{series_folder}"' +
                           (f' --max-episodes {max_episodes}' if max_episodes else '') +
-                          langs_flag) if series_folder else None,
+                          langs_flag + cache_flag) if series_folder else None,
                 'log': 'stage_03a_speaker_tagging.log',
                 'output_dir': series_folder / '03a_speaker_tagged' if series_folder else None,
                 'review_prompt': 'Review speaker tagging results. Check character dictionary and tagged dialogues.',
@@ -445,7 +449,7 @@ def run_pipeline(source_file: Path, auto_mode: bool = False, skip_stages: set =
                 'description': 'Add emotion tags for expressive TTS per language',
                 'script': (f'python stage_04_tag_emotions.py "{series_folder}"' +
                           (f' --max-episodes {max_episodes}' if max_episodes else '') +
-                          langs_flag) if series_folder else None,
+                          langs_flag + cache_flag) if series_folder else None,
                 'log': 'stage_04_tag_emotions.log',
                 'output_dir': series_folder / '04_tagged' if series_folder else None,
                 'review_prompt': 'Review emotion tags for each language. Check tag placement and quality.',
@@ -870,6 +874,8 @@ Examples:
                         help='Use preset voice_id from CSV and existing music files (skip Voice Design API)')
     parser.add_argument('--langs', type=str, default=None,
                         help='Comma-separated list of languages to process (e.g., "korean,japanese")')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Call the LLM again in stages 3a/4 instead of reusing cached responses (e.g. to retag episodes)')
 
     args = parser.parse_args()
 
@@ -913,7 +919,8 @@ Examples:
         review_output=review_output,
         review_output_dir=review_output_dir,
         use_preset_audio=args.use_preset_audio,
-        langs=args.langs
+        langs=args.langs,
+        use_cache=not args.no_cache
     )
 
     # Handle return value (tuple in new version)
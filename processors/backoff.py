@@ -0,0 +1,147 @@
+"""
+Retry Backoff
+Delay calculation for retrying failed LLM requests: exponential backoff with
+random jitter, honoring a Retry-After header when the error carries one.
+Also provides an adaptive (AIMD) limit on concurrent LLM requests.
+"""
+
+import random
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+# First retry waits about this many seconds; each further retry doubles it
+BACKOFF_BASE_SECONDS = 2.0
+
+# Upper bound for a single wait (also caps Retry-After)
+BACKOFF_MAX_SECONDS = 60.0
+
+
+def _retry_after_seconds(error: Optional[BaseException]) -> Optional[float]:
+    """Seconds from an HTTP error's Retry-After header, if it has a numeric one"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        value = headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    error: Optional[BaseException] = None,
+    base: float = BACKOFF_BASE_SECONDS,
+    max_delay: float = BACKOFF_MAX_SECONDS
+) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt.
+
+    Jitter spreads out retries from concurrent workers that failed together
+    (e.g. all throttled by the same rate limit).
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        error: Exception raised by that attempt (checked for Retry-After)
+        base: Delay for the first retry, before jitter
+        max_delay: Maximum delay
+
+    Returns:
+        Delay in seconds
+    """
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        return min(max_delay, max(0.0, retry_after))
+
+    return min(max_delay, base * (2 ** attempt) + random.uniform(0, base))
+
+
+def is_rate_limit_error(error: Optional[BaseException]) -> bool:
+    """
+    Check whether an exception means the provider throttled the request
+    (HTTP 429 / Gemini ResourceExhausted / quota errors).
+    """
+    if error is None:
+        return False
+
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429 or getattr(error, 'code', None) == 429:
+        return True
+
+    message = f"{type(error).__name__}: {error}"
+    return any(marker in message for marker in ('429', 'ResourceExhausted', 'RESOURCE_EXHAUSTED', 'Too Many Requests', 'quota'))
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit on concurrent LLM requests shared by worker threads, adjusted by
+    AIMD (additive increase, multiplicative decrease).
+
+    - Every `increase_after` consecutive successful requests raise the limit
+      by one, up to max_limit
+    - A rate-limited request halves the limit (minimum 1)
+
+    Worker pools are sized to max_limit; the limiter decides how many of
+    those workers may have a request in flight at a time.
+    """
+
+    def __init__(self, max_limit: int, initial_limit: Optional[int] = None, increase_after: int = 10):
+        """
+        Args:
+            max_limit: Highest allowed number of concurrent requests
+            initial_limit: Starting limit (default: max_limit)
+            increase_after: Consecutive successes needed to raise the limit
+        """
+        self.max_limit = max(1, max_limit)
+        self.limit = min(self.max_limit, max(1, initial_limit or self.max_limit))
+        self.increase_after = max(1, increase_after)
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a request slot is free under the current limit"""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, succeeded: bool = True, rate_limited: bool = False) -> None:
+        """
+        Free a request slot and adjust the limit from the request outcome.
+
+        Args:
+            succeeded: The request completed without error
+            rate_limited: The request was throttled by the provider
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if rate_limited:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            elif succeeded:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold a request slot for the duration of the with-block. An exception
+        recognized by is_rate_limit_error counts as rate-limited; other
+        exceptions leave the limit unchanged.
+        """
+        self.acquire()
+        succeeded, rate_limited = False, False
+        try:
+            yield
+            succeeded = True
+        except BaseException as e:
+            rate_limited = is_rate_limit_error(e)
+            raise
+        finally:
+            self.release(succeeded, rate_limited)
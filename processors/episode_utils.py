@@ -1,10 +1,15 @@
 """
 Episode Title Utilities
 Normalizes episode titles to consistent formats for different target languages.
+Also provides fast listing of episode files in stage folders.
 """
 
+import os
 import re
-from typing import Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from processors.json_io import load_json
 
 
 # Korean number mappings
@@ -18,6 +23,145 @@ CHINESE_NUMS = {
 }
 
 
+# Episodes longer than this are never packed into a batched LLM request
+# (keeps batched output within model limits)
+MAX_BATCH_EPISODE_CHARS = 6000
+
+
+_EPISODE_NUMBER_PATTERN = re.compile(r'episode_(\d+)')
+
+
+def _episode_sort_key(path: Path) -> tuple:
+    """Sort by episode number, then name (episode_2 before episode_10)"""
+    match = _EPISODE_NUMBER_PATTERN.match(path.name)
+    return (int(match.group(1)) if match else float('inf'), path.name)
+
+
+def list_episode_files(folder: Path, suffix: str = '.json') -> List[Path]:
+    """
+    List episode files (episode_*.json) in a folder, sorted by episode number.
+
+    Like sorted(folder.glob('episode_*.json')) but uses a single os.scandir
+    pass (no Path.glob matching), which is cheaper on large or network-mounted
+    folders, and orders numerically, so episode_1000 follows episode_999
+    even though names are only zero-padded to 3 digits.
+
+    Args:
+        folder: Stage folder containing episode files
+        suffix: Episode file extension
+
+    Returns:
+        Sorted list of episode file paths (empty if folder does not exist)
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return sorted(
+                (
+                    folder / entry.name
+                    for entry in entries
+                    if entry.name.startswith('episode_') and entry.name.endswith(suffix) and entry.is_file()
+                ),
+                key=_episode_sort_key
+            )
+    except FileNotFoundError:
+        return []
+
+
+def group_episodes(episodes: List[Path], batch_size: int) -> List[List[Path]]:
+    """Split episodes into consecutive groups of batch_size (1 = no batching)"""
+    batch_size = max(1, batch_size)
+    return [episodes[i:i + batch_size] for i in range(0, len(episodes), batch_size)]
+
+
+def process_episode_batch(
+    episode_files: List[Path],
+    process_batch: Callable[[List[str]], Optional[List[str]]],
+    is_done: Optional[Callable[[Path], bool]] = None,
+    label: str = 'processing',
+    indent: str = '     '
+) -> tuple:
+    """
+    Send the short, not yet processed episodes of a group in one LLM request.
+
+    Episodes longer than MAX_BATCH_EPISODE_CHARS, already processed or
+    unreadable are left out for the caller to process individually.
+
+    Args:
+        episode_files: Episodes in the group
+        process_batch: Takes the episode texts and returns the outputs in the
+            same order, or None if the response could not be split
+        is_done: Returns True for episodes that are already processed
+        label: Name of the task, used in fallback messages
+        indent: Prefix for fallback messages
+
+    Returns:
+        Tuple of ({episode_file: (episode_data, output)}, messages);
+        the dict is empty if the batch could not be processed or parsed
+    """
+    loaded = []
+    for episode_file in episode_files:
+        if is_done and is_done(episode_file):
+            continue
+        try:
+            episode_data = load_json(episode_file)
+        except Exception:
+            continue
+        if len(episode_data.get('content', '')) <= MAX_BATCH_EPISODE_CHARS:
+            loaded.append((episode_file, episode_data))
+
+    if len(loaded) < 2:
+        return {}, []
+
+    try:
+        outputs = process_batch([episode_data['content'] for _, episode_data in loaded])
+    except Exception as e:
+        return {}, [f"{indent}⚠️  Batch {label} failed, processing individually: {e}"]
+
+    if outputs is None:
+        return {}, [f"{indent}⚠️  Batch response could not be split, processing individually"]
+
+    return {
+        episode_file: (episode_data, output)
+        for (episode_file, episode_data), output in zip(loaded, outputs)
+    }, []
+
+
+def process_episode_group(
+    episode_files: List[Path],
+    process_episode: Callable[[Path, Optional[tuple]], Any],
+    process_batch: Callable[[List[str]], Optional[List[str]]],
+    is_done: Optional[Callable[[Path], bool]] = None,
+    label: str = 'processing',
+    indent: str = '     '
+) -> tuple:
+    """
+    Process a group of episodes, sending the short ones in one batched request
+    and processing the rest (or all of them, if the batch fails) one by one.
+
+    Args:
+        episode_files: Episodes in the group
+        process_episode: Called as process_episode(episode_file, batch_result)
+            for every episode; batch_result is (episode_data, output) if the
+            episode was processed in the batch, else None
+        process_batch, is_done, label, indent: See process_episode_batch
+
+    Returns:
+        Tuple of (process_episode results in group order, batch messages)
+    """
+    batch_results: Dict[Path, tuple] = {}
+    messages: List[str] = []
+    if len(episode_files) > 1:
+        batch_results, messages = process_episode_batch(
+            episode_files, process_batch, is_done, label, indent
+        )
+
+    results = [
+        process_episode(episode_file, batch_results.get(episode_file))
+        for episode_file in episode_files
+    ]
+    return results, messages
+
+
 def korean_num_to_arabic(korean_str: str) -> Optional[int]:
     """
     Convert Korean number string to Arabic number.
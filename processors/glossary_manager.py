@@ -22,6 +22,41 @@ class GlossaryManager:
     - Ensure consistent translation of character names, locations, and technical terms
     """
 
+    # Loaded/saved instances per glossary file: {resolved_path: ((mtime_ns, size), manager)}
+    _instances: Dict[str, tuple] = {}
+
+    @classmethod
+    def from_path(cls, glossary_path: Path) -> 'GlossaryManager':
+        """
+        Load glossary from file, reusing the instance that last loaded or saved
+        it if the file has not changed on disk since (same mtime and size).
+
+        Args:
+            glossary_path: Path to existing glossary file
+
+        Returns:
+            GlossaryManager for the file
+        """
+        key = str(Path(glossary_path).resolve())
+        cached = cls._instances.get(key)
+        if cached and cached[0] == cls._file_signature(glossary_path):
+            return cached[1]
+
+        return cls(glossary_path=Path(glossary_path))
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[tuple]:
+        """(mtime_ns, size) of a file, or None if it does not exist"""
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _remember(self, path: Path) -> None:
+        """Register this instance as the current in-memory copy of path"""
+        GlossaryManager._instances[str(Path(path).resolve())] = (self._file_signature(path), self)
+
     def __init__(self, glossary_path: Optional[Path] = None):
         """
         Initialize GlossaryManager.
@@ -84,6 +119,7 @@ class GlossaryManager:
         with open(self.glossary_path, 'r', encoding='utf-8') as f:
             self.glossary_data = json.load(f)
 
+        self._remember(self.glossary_path)
         logger.info(f"Loaded glossary: {self.glossary_path}")
         return self.glossary_data
 
@@ -108,6 +144,7 @@ class GlossaryManager:
         with open(save_path, 'w', encoding='utf-8') as f:
             json.dump(self.glossary_data, f, ensure_ascii=False, indent=2)
 
+        self._remember(save_path)
         logger.info(f"Saved glossary: {save_path}")
 
         # Update internal path
@@ -0,0 +1,78 @@
+"""
+JSON I/O Utilities
+Load and save pipeline JSON files (episodes, reports, metadata).
+Uses orjson when installed, otherwise falls back to the standard json module.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Load a UTF-8 JSON file.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def save_json(data: Any, path: Union[str, Path]) -> None:
+    """
+    Save data as UTF-8 JSON with 2-space indentation.
+
+    Output matches json.dump(data, f, ensure_ascii=False, indent=2):
+    non-ASCII text (Korean, Japanese, Chinese) is written as-is. The file is
+    written in binary mode from one encoded buffer (no text-IO layer).
+
+    Args:
+        data: JSON-serializable data
+        path: Output file path
+    """
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(encoded)
+
+
+def json_tail_contains(path: Union[str, Path], text: str, tail_bytes: int = 4096) -> bool:
+    """
+    Check whether the end of a JSON file contains text, without parsing it.
+
+    Episode files keep the (small) metadata block after the (large) content,
+    so a metadata flag such as '"formatting_applied": true' can be found by
+    reading only the last few KB. A False result is not conclusive; callers
+    fall back to a full load when they need certainty.
+
+    Args:
+        path: JSON file path
+        text: Text to look for (as written by save_json/json.dump)
+        tail_bytes: Number of bytes read from the end of the file
+
+    Returns:
+        True if text occurs in the last tail_bytes of the file
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - tail_bytes))
+        return text.encode('utf-8') in f.read()
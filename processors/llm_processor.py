@@ -6,6 +6,9 @@ Handles TTS formatting, translation, and emotional tagging using Gemini or Qwen3
 import os
 import logging
 import time
+import hashlib
+import threading
+import datetime
 import requests
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -30,6 +33,9 @@ from processors.prompts import (
     TERM_TRANSLATION_PROMPT,
     TAIWAN_TERM_TRANSLATION_PROMPT,
     JAPANESE_TERM_TRANSLATION_PROMPT,
+    TERM_BATCH_TRANSLATION_PROMPT,
+    TAIWAN_TERM_BATCH_TRANSLATION_PROMPT,
+    JAPANESE_TERM_BATCH_TRANSLATION_PROMPT,
     AUDIO_NARRATOR_PROMPT,
     SERIES_SUMMARY_PROMPT,
     VOICE_CHARACTER_PROMPT,
@@ -49,6 +55,22 @@ from processors.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Placeholder used to split a rendered prompt into its stable prefix and the per-call text
+_PROMPT_TEXT_MARKER = '\x00__PROMPT_TEXT__\x00'
+
+# TTL for Gemini context caches holding the stable prompt prefix (instructions + glossary)
+PROMPT_CACHE_TTL_MINUTES = int(os.getenv('LLM_PROMPT_CACHE_TTL_MINUTES', '60'))
+
+# Keep-alive connections held open to the Ollama API (one per concurrent worker)
+QWEN_HTTP_POOL_SIZE = 32
+
+# Narration language names used in voice variable extraction prompts
+VOICE_LANGUAGE_NAMES = {
+    'korean': 'Korean',
+    'japanese': 'Japanese',
+    'taiwanese': 'Taiwanese Mandarin'
+}
+
 
 class LLMProcessor(BaseProcessor):
     """
@@ -70,6 +92,11 @@ class LLMProcessor(BaseProcessor):
         self.model_type = model_type or os.getenv('LLM_MODEL', 'gemini')
         self.logger.info(f"Initializing LLMProcessor with model: {self.model_type}")
 
+        # Prompt prefix caching (glossary + instructions reused across episodes)
+        self.prompt_cache_enabled = os.getenv('LLM_PROMPT_CACHE', 'true').lower() not in ('0', 'false', 'no')
+        self._prefix_models = {}  # prefix hash -> cached GenerativeModel (None if caching unavailable)
+        self._prefix_lock = threading.Lock()
+
         if self.model_type == 'qwen':
             self._init_qwen()
         else:
@@ -87,6 +114,13 @@ class LLMProcessor(BaseProcessor):
         # Fallback model for content that gets blocked by 2.5
         self.model_fallback = genai.GenerativeModel('gemini-2.0-flash')
 
+        # Speaker/emotion tagging can run on a smaller model (e.g. gemini-2.5-flash-lite)
+        self.tagging_model_name = os.getenv('GEMINI_TAGGING_MODEL', 'gemini-2.5-flash')
+        if self.tagging_model_name == self.model.model_name.split('/')[-1]:
+            self.model_tagging = self.model
+        else:
+            self.model_tagging = genai.GenerativeModel(self.tagging_model_name)
+
         # Safety settings for Gemini
         self.safety_settings = {
             HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
@@ -100,10 +134,23 @@ class LLMProcessor(BaseProcessor):
         self.ollama_api_key = os.getenv('OLLAMA_API_KEY')
         self.ollama_base_url = os.getenv('OLLAMA_BASE_URL', 'https://api.ollama.ai/v1')
         self.ollama_model = os.getenv('OLLAMA_MODEL', 'qwen3')
+        # Speaker/emotion tagging can run on a smaller model
+        self.tagging_model_name = os.getenv('OLLAMA_TAGGING_MODEL', self.ollama_model)
 
         if not self.ollama_api_key:
             raise ValueError("OLLAMA_API_KEY not found in environment variables")
 
+        # One HTTP session for all requests, so concurrent workers reuse
+        # keep-alive connections instead of a new TCP/TLS handshake per call
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.ollama_api_key}',
+            'Content-Type': 'application/json'
+        })
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=QWEN_HTTP_POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         self.logger.info(f"Qwen3 initialized: {self.ollama_base_url}, model: {self.ollama_model}")
 
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -148,12 +195,14 @@ class LLMProcessor(BaseProcessor):
                 target_lang = params.get('target_lang', 'english')
                 glossary = params.get('glossary')
                 use_pro_model = params.get('use_pro_model', True)  # Default to Pro for accuracy
+                on_chunk = params.get('on_chunk')  # Optional callback for streamed output
 
                 if glossary:
                     # Format glossary for prompt
-                    glossary_str = "\n".join([f"- {t['original']} → {t['translation']}" for t in glossary])
+                    glossary_str = self.format_glossary_terms(glossary)
                     output_text = self.translate_with_glossary(
-                        text, source_lang, target_lang, glossary_str, use_pro_model=use_pro_model
+                        text, source_lang, target_lang, glossary_str,
+                        use_pro_model=use_pro_model, on_chunk=on_chunk
                     )
                 else:
                     output_text = self.translate(text, source_lang, target_lang)
@@ -248,12 +297,7 @@ class LLMProcessor(BaseProcessor):
                 target_language = params.get('target_language', 'korean')
 
                 # Map internal language code to display name
-                language_display = {
-                    'korean': 'Korean',
-                    'japanese': 'Japanese',
-                    'taiwanese': 'Taiwanese Mandarin'
-                }
-                lang_name = language_display.get(target_language, 'Korean')
+                lang_name = VOICE_LANGUAGE_NAMES.get(target_language, 'Korean')
 
                 prompt = VOICE_VARIABLE_EXTRACTION_PROMPT.format(
                     series_summary=series_summary,
@@ -281,6 +325,19 @@ class LLMProcessor(BaseProcessor):
                 # Store parsed variables in metadata for easy access
                 metadata['voice_variables'] = variables if isinstance(variables, dict) else json.loads(output_text)
 
+            elif operation == 'extract_voice_variables_multi':
+                # Extract voice design variables for several languages in one request
+                import json
+
+                variables = self.extract_voice_variables_multi(
+                    params.get('series_summary', ''),
+                    params.get('genre', 'web novel'),
+                    params.get('target_languages', [])
+                )
+                output_text = json.dumps(variables, ensure_ascii=False)
+                # {language: variables}; languages the response missed are omitted
+                metadata['voice_variables'] = variables
+
             elif operation == 'extract_characters':
                 # Extract character dictionary from series text
                 output_text = self.extract_characters(text)
@@ -321,6 +378,38 @@ class LLMProcessor(BaseProcessor):
 
     def format_for_tts(self, text: str, language: str = 'korean') -> str:
         """Format text for TTS optimization"""
+        prompt = self._format_prompt_template(language).format(text=text)
+        return self._generate_content(prompt)
+
+    def format_episodes_batch(self, texts: list, language: str = 'korean') -> Optional[list]:
+        """
+        Format several short episodes for TTS in a single request.
+
+        Episodes are joined with <<EP n>> delimiters and the response is split
+        back on the same delimiters.
+
+        Args:
+            texts: Episode contents to format
+            language: Target language (korean, japanese, taiwanese)
+
+        Returns:
+            Formatted texts in input order, or None if the response could not
+            be split into exactly one non-empty part per episode
+        """
+        combined = "\n\n".join(f"<<EP {i}>>\n{text}" for i, text in enumerate(texts, 1))
+        batch_instructions = f"""
+
+[Batch Output Format]
+The text above contains {len(texts)} separate episodes, each starting with a <<EP n>> marker line.
+Format every episode and output each result after its own unchanged <<EP n>> marker line, in the same order.
+Do NOT merge, skip, or modify the markers."""
+
+        prompt = self._format_prompt_template(language).format(text=combined) + batch_instructions
+        response = self._generate_content(prompt)
+        return self._split_episode_batch_response(response, len(texts), 'formatting')
+
+    def _format_prompt_template(self, language: str) -> str:
+        """TTS formatting prompt template for a language"""
         language_lower = language.lower()
 
         if language_lower == 'korean':
@@ -334,8 +423,7 @@ class LLMProcessor(BaseProcessor):
             self.logger.warning(f"Unsupported language for formatting: {language}. Using Korean prompt.")
             prompt_template = TTS_FORMAT_PROMPT_KR
 
-        prompt = prompt_template.format(text=text)
-        return self._generate_content(prompt)
+        return prompt_template
 
     def detect_language(self, text: str) -> str:
         """
@@ -465,6 +553,100 @@ The segment appears in this context:
 
         return result
 
+    def translate_segments_batch(
+        self,
+        segments: list,
+        source_lang: str,
+        target_lang: str,
+        glossary: dict = None,
+        batch_size: int = 40
+    ) -> dict:
+        """
+        Translate many short segments with one LLM request per batch (for QA auto-fix).
+
+        Packs numbered segments into a single prompt instead of issuing one
+        request per segment. Segments missing from (or still Korean in) the
+        response are left out of the result so the caller can fall back to
+        translate_segment().
+
+        Args:
+            segments: List of (segment, context) tuples
+            source_lang: Source language (korean)
+            target_lang: Target language (japanese, taiwanese)
+            glossary: Glossary dict with 'terms' list
+            batch_size: Maximum segments per request
+
+        Returns:
+            Dict mapping segment -> translated segment
+        """
+        import re
+
+        lang_display = {
+            'korean': 'Korean',
+            'japanese': 'Japanese',
+            'taiwanese': 'Traditional Chinese (Taiwanese Mandarin)'
+        }
+        target_display = lang_display.get(target_lang, target_lang)
+        line_pattern = re.compile(r'^\[(\d+)\]\s*(.+)$', re.MULTILINE)
+        korean_pattern = re.compile(r'[\uAC00-\uD7AF]')
+
+        translations = {}
+
+        for start in range(0, len(segments), batch_size):
+            batch = segments[start:start + batch_size]
+
+            # Only include glossary terms relevant to this batch
+            glossary_section = ""
+            if glossary and glossary.get('terms'):
+                batch_text = ''.join(f"{seg}{ctx or ''}" for seg, ctx in batch).replace(' ', '')
+                relevant_terms = [
+                    f"- {term['original']} → {term['translation']}"
+                    for term in glossary['terms']
+                    if term.get('original') and term.get('translation')
+                    and term['original'].replace(' ', '') in batch_text
+                ]
+                if relevant_terms:
+                    glossary_section = "\n\n[Glossary - Use these translations]\n" + "\n".join(relevant_terms)
+
+            numbered = "\n".join(
+                f"[{i}] {seg}\n    (context: \"{ctx or ''}\")"
+                for i, (seg, ctx) in enumerate(batch, 1)
+            )
+
+            prompt = f"""[Task]
+Translate each numbered Korean text segment below to {target_display}.
+Each segment is followed by the context it appears in.
+
+[Korean segments to translate]
+{numbered}
+{glossary_section}
+
+[Translation Rules]
+1. Translate naturally into {target_display}
+2. Match the tone and style of each segment's context
+3. Do NOT include any Korean characters in your output
+4. Do NOT add explanations or notes
+5. Output exactly one line per segment in the form: [number] translated segment
+
+[Translated segments]"""
+
+            try:
+                response = self._generate_content(prompt, temperature=0.3)
+            except Exception as e:
+                self.logger.error(f"Batch segment translation failed: {e}")
+                continue
+
+            for match in line_pattern.finditer(response):
+                index = int(match.group(1)) - 1
+                if not 0 <= index < len(batch):
+                    continue
+                translated = match.group(2).strip().strip('"\'')
+                if translated and not korean_pattern.search(translated):
+                    translations[batch[index][0]] = translated
+
+        self.logger.info(f"Batch-translated {len(translations)}/{len(segments)} segments")
+        return translations
+
     def translate_title(
         self,
         title: str,
@@ -543,7 +725,7 @@ Translate the following episode title from {lang_display.get(source_lang, source
     def tag_emotions(self, text: str) -> str:
         """Add emotional tags"""
         prompt = EMOTIONAL_TAGGING_PROMPT.format(text=text)
-        result = self._generate_content(prompt)
+        result = self._generate_content_tagging(prompt)
 
         # Remove LLM preamble if present (e.g., "好的，AI語音導演就位..." or similar)
         result = self._clean_llm_preamble(result)
@@ -717,12 +899,7 @@ Translate the following episode title from {lang_display.get(source_lang, source
         import json
 
         # Use language-specific prompts for term translation
-        if target_lang == 'traditional_chinese':
-            prompt_template = TAIWAN_TERM_TRANSLATION_PROMPT
-        elif target_lang in ('japanese', 'jp'):
-            prompt_template = JAPANESE_TERM_TRANSLATION_PROMPT
-        else:
-            prompt_template = TERM_TRANSLATION_PROMPT
+        prompt_template = self._term_prompt_template(target_lang)
 
         prompt = prompt_template.format(
             term=term,
@@ -761,13 +938,91 @@ Translate the following episode title from {lang_display.get(source_lang, source
             self.logger.error(f"Term translation failed for '{term}': {e}")
             raise  # Don't fallback to original - let caller handle the error
 
+    @staticmethod
+    def _term_prompt_template(target_lang: str) -> str:
+        """Term translation prompt for a target language"""
+        if target_lang == 'traditional_chinese':
+            return TAIWAN_TERM_TRANSLATION_PROMPT
+        if target_lang in ('japanese', 'jp'):
+            return JAPANESE_TERM_TRANSLATION_PROMPT
+        return TERM_TRANSLATION_PROMPT
+
+    @staticmethod
+    def _term_batch_prompt_template(target_lang: str) -> str:
+        """Batch (numbered list) term translation prompt for a target language"""
+        if target_lang == 'traditional_chinese':
+            return TAIWAN_TERM_BATCH_TRANSLATION_PROMPT
+        if target_lang in ('japanese', 'jp'):
+            return JAPANESE_TERM_BATCH_TRANSLATION_PROMPT
+        return TERM_BATCH_TRANSLATION_PROMPT
+
+    def translate_terms_batch(
+        self,
+        terms: list,
+        source_lang: str,
+        target_lang: str,
+        category: str = 'term',
+        context: str = ''
+    ) -> Optional[list]:
+        """
+        Translate several terms in a single request.
+
+        Terms are sent as a numbered list in a batch prompt (same naming rules
+        as the single-term prompts) and the response is read back as one
+        "n. translation" line per term.
+
+        Args:
+            terms: Terms to translate
+            source_lang: Source language
+            target_lang: Target language
+            category: Term category (character, location, etc.)
+            context: Brief context for the terms
+
+        Returns:
+            Translations in input order (the original term where a translation
+            is too long, as in translate_term), or None if the response does not
+            contain exactly one non-empty line per term
+        """
+        import re
+
+        term_list = "\n".join(f"{i}. {term}" for i, term in enumerate(terms, 1))
+        prompt = self._term_batch_prompt_template(target_lang).format(
+            count=len(terms),
+            terms=term_list,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            category=category,
+            context=context or 'N/A'
+        )
+
+        response = self._generate_content(prompt, temperature=0.0)
+
+        results = {}
+        for match in re.finditer(r'^\s*(\d+)[.)]\s*(.*?)\s*$', response, flags=re.MULTILINE):
+            results[int(match.group(1))] = match.group(2).strip('"')
+
+        if sorted(results) != list(range(1, len(terms) + 1)) or not all(results.values()):
+            self.logger.warning(
+                f"Batch term response could not be split into {len(terms)} terms "
+                f"(found numbers: {sorted(results)})"
+            )
+            return None
+
+        # Same length check as translate_term (longer output is likely a script)
+        max_length = 100 if category == 'location' else 50
+        return [
+            results[i] if len(results[i]) <= max_length else term
+            for i, term in enumerate(terms, 1)
+        ]
+
     def translate_with_glossary(
         self,
         text: str,
         source_lang: str,
         target_lang: str,
         glossary: str,
-        use_pro_model: bool = False
+        use_pro_model: bool = False,
+        on_chunk=None
     ) -> str:
         """
         Translate text using glossary for consistency.
@@ -778,10 +1033,95 @@ Translate the following episode title from {lang_display.get(source_lang, source
             target_lang: Target language (korean, japanese, taiwanese/traditional_chinese)
             glossary: Formatted glossary string
             use_pro_model: If True, use Gemini 2.5 Pro for more accurate glossary adherence
+            on_chunk: Optional callback receiving output text as it streams in
 
         Returns:
             Translated text
         """
+        prefix, suffix = self._render_glossary_translation_prompt(source_lang, target_lang, glossary)
+        return self._generate_content_with_prefix(
+            prefix, text + suffix, temperature=0.2 if use_pro_model else 0.3,
+            use_pro_model=use_pro_model, on_chunk=on_chunk
+        )
+
+    @staticmethod
+    def format_glossary_terms(terms: list) -> str:
+        """Format glossary term dicts as prompt lines ("- original → translation")"""
+        return "\n".join([f"- {t['original']} → {t['translation']}" for t in terms])
+
+    def translate_episodes_batch(
+        self,
+        texts: list,
+        source_lang: str,
+        target_lang: str,
+        glossary: str,
+        use_pro_model: bool = False
+    ) -> Optional[list]:
+        """
+        Translate several short episodes in a single request.
+
+        Episodes are joined with <<EP n>> delimiters and the response is split
+        back on the same delimiters.
+
+        Args:
+            texts: Episode contents to translate
+            source_lang: Source language (korean, japanese)
+            target_lang: Target language (japanese, taiwanese/traditional_chinese)
+            glossary: Formatted glossary string
+            use_pro_model: If True, use Gemini 2.5 Pro
+
+        Returns:
+            Translated texts in input order, or None if the response could not
+            be split into exactly one non-empty part per episode
+        """
+        combined = "\n\n".join(f"<<EP {i}>>\n{text}" for i, text in enumerate(texts, 1))
+        batch_instructions = f"""
+
+[Batch Output Format]
+The text above contains {len(texts)} separate episodes, each starting with a <<EP n>> marker line.
+Translate every episode and output each translation after its own unchanged <<EP n>> marker line, in the same order.
+Do NOT merge, skip, or translate the markers."""
+
+        prefix, suffix = self._render_glossary_translation_prompt(source_lang, target_lang, glossary)
+        response = self._generate_content_with_prefix(
+            prefix, combined + suffix + batch_instructions,
+            temperature=0.2 if use_pro_model else 0.3, use_pro_model=use_pro_model
+        )
+        return self._split_episode_batch_response(response, len(texts), 'translation')
+
+    def _split_episode_batch_response(self, response: str, count: int, label: str) -> Optional[list]:
+        """
+        Split a batched response on its <<EP n>> marker lines.
+
+        Returns:
+            Episode texts in marker order, or None unless exactly markers
+            1..count are present with non-empty bodies
+        """
+        import re
+
+        # re.split with a capture group yields [preamble, n1, body1, n2, body2, ...]
+        parts = re.split(r'^\s*<<EP (\d+)>>\s*$', response, flags=re.MULTILINE)
+        results = {}
+        for number, body in zip(parts[1::2], parts[2::2]):
+            results[int(number)] = body.strip()
+
+        if sorted(results) != list(range(1, count + 1)) or not all(results.values()):
+            self.logger.warning(
+                f"Batch {label} response could not be split into {count} episodes "
+                f"(found markers: {sorted(results)})"
+            )
+            return None
+
+        return [results[i] for i in range(1, count + 1)]
+
+    def _render_glossary_translation_prompt(self, source_lang: str, target_lang: str, glossary: str) -> tuple:
+        """
+        Render the glossary translation prompt around the text to translate.
+
+        Returns:
+            (prefix, suffix) - prefix holds the instructions and glossary and is
+            stable for a series/language, so providers can cache it
+        """
         # Select prompt based on source and target language
         source_lower = source_lang.lower()
         target_lower = target_lang.lower()
@@ -799,15 +1139,70 @@ Translate the following episode title from {lang_display.get(source_lang, source
             # Korean source → other targets (default)
             prompt_template = GLOSSARY_TRANSLATION_PROMPT
 
-        prompt = prompt_template.format(
+        rendered = prompt_template.format(
             glossary=glossary,
             source_lang=source_lang,
             target_lang=target_lang,
-            text=text
+            text=_PROMPT_TEXT_MARKER
         )
-        if use_pro_model:
-            return self._generate_content_pro(prompt)
-        return self._generate_content(prompt)
+        prefix, suffix = rendered.split(_PROMPT_TEXT_MARKER, 1)
+        return prefix, suffix
+
+    def extract_voice_variables_multi(self, series_summary: str, genre: str, languages: list) -> dict:
+        """
+        Extract voice design variables for several narration languages in a
+        single request.
+
+        The single-language extraction prompt is sent once, with an output
+        format asking for one JSON object keyed by language code.
+
+        Args:
+            series_summary: Series synopsis
+            genre: Series genre
+            languages: Language codes ('korean', 'japanese', 'taiwanese')
+
+        Returns:
+            {language: variables} for each language whose entry parsed as a
+            JSON object; missing languages are omitted so callers can fall back
+            to the 'extract_voice_variables' operation for them
+        """
+        import json
+        import re
+
+        language_list = ", ".join(
+            f'"{lang}" ({VOICE_LANGUAGE_NAMES.get(lang, "Korean")})' for lang in languages
+        )
+        prompt = VOICE_VARIABLE_EXTRACTION_PROMPT.format(
+            series_summary=series_summary,
+            genre=genre,
+            target_language=", ".join(VOICE_LANGUAGE_NAMES.get(lang, 'Korean') for lang in languages)
+        ) + f"""
+
+[Batch Output Format]
+Design a separate narrator for each of these {len(languages)} audiobook languages: {language_list}.
+Output ONE JSON object whose keys are exactly those language codes, each mapped to the JSON object above for that language's narrator (with the matching nationality)."""
+
+        raw_output = self._generate_content(prompt, temperature=0.3)
+
+        # Remove markdown code blocks if present
+        if '```' in raw_output:
+            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', raw_output)
+            if json_match:
+                raw_output = json_match.group(1)
+
+        try:
+            parsed = json.loads(raw_output.strip())
+        except json.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            self.logger.warning("Failed to parse multi-language voice variables JSON")
+            return {}
+
+        variables = {lang: parsed[lang] for lang in languages if isinstance(parsed.get(lang), dict)}
+        missing = [lang for lang in languages if lang not in variables]
+        if missing:
+            self.logger.warning(f"Multi-language voice variables missing for: {', '.join(missing)}")
+        return variables
 
     def _get_default_voice_variables(self, language: str) -> dict:
         """
@@ -848,6 +1243,13 @@ Translate the following episode title from {lang_display.get(source_lang, source
         else:
             return self._generate_content_gemini(prompt, temperature)
 
+    def _generate_content_tagging(self, prompt: str, temperature: float = 0.3) -> str:
+        """Generate content with the tagging model (GEMINI_TAGGING_MODEL / OLLAMA_TAGGING_MODEL)"""
+        if self.model_type == 'qwen':
+            return self._generate_content_qwen(prompt, temperature, model=self.tagging_model_name)
+        else:
+            return self._generate_content_gemini(prompt, temperature, model=self.model_tagging)
+
     def _generate_content_pro(self, prompt: str, temperature: float = 0.2) -> str:
         """Generate content using Pro model for large context tasks"""
         if self.model_type == 'qwen':
@@ -856,10 +1258,170 @@ Translate the following episode title from {lang_display.get(source_lang, source
         else:
             return self._generate_content_gemini_pro(prompt, temperature)
 
-    def _generate_content_gemini(self, prompt: str, temperature: float = 0.3) -> str:
-        """Generate content using Gemini Flash with fallback to 1.5 for blocked content"""
+    def _generate_content_with_prefix(
+        self,
+        prefix: str,
+        content: str,
+        temperature: float = 0.3,
+        use_pro_model: bool = False,
+        on_chunk=None
+    ) -> str:
+        """
+        Generate content for a prompt made of a stable prefix and a varying tail.
+
+        - Gemini: the prefix is stored once as a context cache and reused
+        - Qwen (OpenAI-compatible): the prefix is sent as the system message so
+          the server's automatic prefix caching can reuse it
+
+        Falls back to a plain single-prompt call if caching is unavailable.
+        If on_chunk is given, the response is streamed and each text chunk is
+        passed to it as it arrives. A stream that fails before any chunk was
+        delivered is retried without streaming; one that fails later re-raises,
+        since on_chunk has already seen part of a response that will not be
+        returned (the caller's retry starts over with fresh state).
+        """
+        if on_chunk is not None:
+            delivered = False
+
+            def forward(chunk):
+                nonlocal delivered
+                delivered = True
+                on_chunk(chunk)
+
+            try:
+                return self._stream_content_with_prefix(prefix, content, temperature, use_pro_model, forward)
+            except Exception as e:
+                if delivered:
+                    raise
+                self.logger.warning(f"Streaming failed, retrying without streaming: {e}")
+
+        if not self.prompt_cache_enabled:
+            generate = self._generate_content_pro if use_pro_model else self._generate_content
+            return generate(prefix + content, temperature)
+
+        if self.model_type == 'qwen':
+            return self._generate_content_qwen(content, temperature, system_prompt=prefix)
+
+        cached_model = self._get_prefix_cached_model(prefix, use_pro_model)
+        if cached_model is not None:
+            try:
+                response = cached_model.generate_content(
+                    content,
+                    safety_settings=self.safety_settings,
+                    generation_config={'temperature': temperature}
+                )
+                return response.text.strip()
+            except Exception as e:
+                self.logger.warning(f"Cached prompt call failed, retrying without cache: {e}")
+
+        generate = self._generate_content_pro if use_pro_model else self._generate_content
+        return generate(prefix + content, temperature)
+
+    def _stream_content_with_prefix(
+        self,
+        prefix: str,
+        content: str,
+        temperature: float,
+        use_pro_model: bool,
+        on_chunk
+    ) -> str:
+        """Stream a prefix + content prompt, forwarding text chunks to on_chunk"""
+        chunks = []
+
+        if self.model_type == 'qwen':
+            import json
+
+            messages = [{'role': 'user', 'content': content}]
+            if self.prompt_cache_enabled:
+                messages.insert(0, {'role': 'system', 'content': prefix})
+            else:
+                messages[0]['content'] = prefix + content
+
+            payload = {
+                'model': self.ollama_model,
+                'messages': messages,
+                'temperature': temperature,
+                'stream': True
+            }
+
+            with self.session.post(
+                f'{self.ollama_base_url}/chat/completions',
+                json=payload,
+                timeout=120,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                # OpenAI-compatible SSE: "data: {...}" lines, terminated by "data: [DONE]"
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    delta = json.loads(data)['choices'][0].get('delta', {}).get('content')
+                    if delta:
+                        chunks.append(delta)
+                        on_chunk(delta)
+
+            return ''.join(chunks).strip()
+
+        model = None
+        if self.prompt_cache_enabled:
+            model = self._get_prefix_cached_model(prefix, use_pro_model)
+        if model is None:
+            model = self.model_pro if use_pro_model else self.model
+            content = prefix + content
+
+        response = model.generate_content(
+            content,
+            safety_settings=self.safety_settings,
+            generation_config={'temperature': temperature},
+            stream=True
+        )
+        for chunk in response:
+            text = chunk.text
+            if text:
+                chunks.append(text)
+                on_chunk(text)
+
+        return ''.join(chunks).strip()
+
+    def _get_prefix_cached_model(self, prefix: str, use_pro_model: bool = False):
+        """
+        Get (or create) a Gemini model bound to a context cache of the prefix.
+
+        Returns None when the prefix cannot be cached (e.g. below the provider's
+        minimum token count); the failure is remembered so it is not retried.
+        """
+        base_model = self.model_pro if use_pro_model else self.model
+        key = hashlib.sha256(f"{base_model.model_name}\n{prefix}".encode('utf-8')).hexdigest()
+
+        with self._prefix_lock:
+            if key in self._prefix_models:
+                return self._prefix_models[key]
+
+            cached_model = None
+            try:
+                from google.generativeai import caching
+
+                cache = caching.CachedContent.create(
+                    model=base_model.model_name,
+                    display_name=f"prefix-{key[:16]}",
+                    contents=[prefix],
+                    ttl=datetime.timedelta(minutes=PROMPT_CACHE_TTL_MINUTES)
+                )
+                cached_model = genai.GenerativeModel.from_cached_content(cached_content=cache)
+                self.logger.info(f"Created Gemini context cache for prompt prefix ({len(prefix):,} chars)")
+            except Exception as e:
+                self.logger.info(f"Prompt prefix caching unavailable, using plain prompts: {e}")
+
+            self._prefix_models[key] = cached_model
+            return cached_model
+
+    def _generate_content_gemini(self, prompt: str, temperature: float = 0.3, model=None) -> str:
+        """Generate content using Gemini Flash (or model) with fallback to 1.5 for blocked content"""
         try:
-            response = self.model.generate_content(
+            response = (model or self.model).generate_content(
                 prompt,
                 safety_settings=self.safety_settings,
                 generation_config={'temperature': temperature}
@@ -896,26 +1458,29 @@ Translate the following episode title from {lang_display.get(source_lang, source
             self.logger.error(f"Gemini Pro API error: {e}")
             raise
 
-    def _generate_content_qwen(self, prompt: str, temperature: float = 0.3) -> str:
+    def _generate_content_qwen(
+        self,
+        prompt: str,
+        temperature: float = 0.3,
+        system_prompt: str = None,
+        model: str = None
+    ) -> str:
         """Generate content using Qwen3 via Ollama API"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.ollama_api_key}',
-                'Content-Type': 'application/json'
-            }
+            messages = [{'role': 'user', 'content': prompt}]
+            if system_prompt:
+                # Stable prefix first so the server can reuse its prompt cache
+                messages.insert(0, {'role': 'system', 'content': system_prompt})
 
             payload = {
-                'model': self.ollama_model,
-                'messages': [
-                    {'role': 'user', 'content': prompt}
-                ],
+                'model': model or self.ollama_model,
+                'messages': messages,
                 'temperature': temperature,
                 'stream': False
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f'{self.ollama_base_url}/chat/completions',
-                headers=headers,
                 json=payload,
                 timeout=120
             )
@@ -987,12 +1552,55 @@ Translate the following episode title from {lang_display.get(source_lang, source
 
         Args:
             text: Episode text to tag
-            character_dict: Character dictionary with character info
+            character_dict: Character dictionary with character info, or the
+                dictionary already serialized to JSON
             language: Target language ('korean', 'japanese', 'taiwanese')
 
         Returns:
             Text with speaker tags applied
         """
+        prompt = self._speaker_tagging_prompt(text, character_dict, language)
+        result = self._generate_content_tagging(prompt, temperature=0.3)
+
+        # Clean LLM preamble if present
+        result = self._clean_llm_preamble(result)
+
+        return result
+
+    def tag_speakers_batch(self, texts: list, character_dict: dict, language: str = 'korean') -> Optional[list]:
+        """
+        Tag speakers in several short episodes in a single request, so the
+        character dictionary is sent once per batch instead of once per episode.
+
+        Episodes are joined with <<EP n>> delimiters and the response is split
+        back on the same delimiters.
+
+        Args:
+            texts: Episode texts to tag
+            character_dict: Character dictionary with character info
+            language: Target language ('korean', 'japanese', 'taiwanese')
+
+        Returns:
+            Tagged texts in input order, or None if the response could not
+            be split into exactly one non-empty part per episode
+        """
+        combined = "\n\n".join(f"<<EP {i}>>\n{text}" for i, text in enumerate(texts, 1))
+        batch_instructions = f"""
+
+[Batch Output Format]
+The text above contains {len(texts)} separate episodes, each starting with a <<EP n>> marker line.
+Tag speakers in every episode and output each result after its own unchanged <<EP n>> marker line, in the same order.
+Do NOT merge, skip, or modify the markers."""
+
+        prompt = self._speaker_tagging_prompt(combined, character_dict, language) + batch_instructions
+        response = self._generate_content_tagging(prompt, temperature=0.3)
+        tagged = self._split_episode_batch_response(response, len(texts), 'speaker tagging')
+        if tagged is None:
+            return None
+        return [self._clean_llm_preamble(text) for text in tagged]
+
+    def _speaker_tagging_prompt(self, text: str, character_dict, language: str) -> str:
+        """Render the speaker tagging prompt for a language"""
         import json
 
         # Select prompt based on language
@@ -1009,17 +1617,10 @@ Translate the following episode title from {lang_display.get(source_lang, source
         else:
             char_dict_str = json.dumps(character_dict, ensure_ascii=False, indent=2)
 
-        prompt = prompt_template.format(
+        return prompt_template.format(
             character_dict=char_dict_str,
             text=text
         )
 
-        result = self._generate_content(prompt, temperature=0.3)
-
-        # Clean LLM preamble if present
-        result = self._clean_llm_preamble(result)
-
-        return result
-
     # NOTE: translate_term method is defined at line ~679 with full parameters
     # (category, context). Do not duplicate here.
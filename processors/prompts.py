@@ -529,39 +529,8 @@ Translate the following text from {source_lang} to {target_lang} using the gloss
 # TERM TRANSLATION PROMPT (for individual glossary terms)
 # ==============================================================================
 
-TERM_TRANSLATION_PROMPT = """[Role]
-You are a professional translator specializing in terminology translation for localization.
-
-[Critical Requirements]
-1. Translate ONLY the single term provided - do NOT create scenarios, scripts, or dialogue
-2. Provide ONLY the direct translation - no explanations, no context, no examples
-3. Keep the translation concise and appropriate for the term category
-4. Do NOT generate creative content - this is strict terminology translation
-
-[Task]
-Translate this {category} from {source_lang} to {target_lang}:
-"{term}"
-
-Context: {context}
-
-Output ONLY the translated term (maximum 20 characters for most terms, 50 for locations):
-"""
-
-# Taiwan-specific term translation prompt
-TAIWAN_TERM_TRANSLATION_PROMPT = """[角色]
-你是專業的台灣本地化術語翻譯專家。
-
-[重要規則]
-1. 僅翻譯提供的單一術語 - 不要創作場景、劇本或對話
-2. 僅提供直接翻譯 - 不要解釋、不要情境說明、不要舉例
-3. 保持翻譯簡潔，符合術語類別
-4. 不要產生創意內容 - 這是嚴格的術語翻譯
-5. 使用台灣式繁體中文，避免中國大陸用語
-6. 禁止使用台文、台語、閩南語、客家話
-7. 禁止使用羅馬拼音或任何拼音系統（如 Kang-lâm、Tâi-pak 等）
-8. 所有翻譯必須使用繁體中文漢字
-
-[台灣用語原則]
+# Naming rules shared by the single-term and batch Taiwan/Japanese prompts
+_TAIWAN_TERM_NAMING_RULES = """[台灣用語原則]
 - 人名：使用台灣常見的對應漢字（如韓國名「현」用「賢」而非「炫」）
 - 地名：必須使用繁體中文漢字（如「강남」→「江南」，禁止「Kang-lâm」）
 - 一般術語：使用台灣慣用表達方式
@@ -579,26 +548,9 @@ TAIWAN_TERM_TRANSLATION_PROMPT = """[角色]
 - 이서연 → 李書妍
 - 서연 → 舒妍 ✗ (不一致，禁止)
 
-[任務]
-將此 {category} 從 {source_lang} 翻譯為 {target_lang}（台灣繁體中文）：
-"{term}"
-
-情境：{context}
-
-僅輸出翻譯後的術語（大部分術語最多20字，地點最多50字）：
 """
 
-# Japanese-specific term translation prompt
-JAPANESE_TERM_TRANSLATION_PROMPT = """[役割]
-あなたは韓日ローカライゼーション用語翻訳の専門家です。
-
-[重要規則]
-1. 提供された単一の用語のみを翻訳する - シナリオ、台本、対話を作成しない
-2. 直接翻訳のみを提供する - 説明、文脈、例を含めない
-3. 翻訳は簡潔に、用語カテゴリに適切に
-4. 創作コンテンツを生成しない - これは厳格な用語翻訳です
-
-[🚨 韓国人名表記ルール - 最重要]
+_JAPANESE_TERM_NAMING_RULES = """[🚨 韓国人名表記ルール - 最重要]
 韓国人の人名は必ずカタカナで表記する（漢字禁止）
 
 **カタカナ表記ルール:**
@@ -634,7 +586,60 @@ JAPANESE_TERM_TRANSLATION_PROMPT = """[役割]
 
 **例外:** 架空の地名（ファンタジー世界等）は用語集に従う
 
-[タスク]
+"""
+
+TERM_TRANSLATION_PROMPT = """[Role]
+You are a professional translator specializing in terminology translation for localization.
+
+[Critical Requirements]
+1. Translate ONLY the single term provided - do NOT create scenarios, scripts, or dialogue
+2. Provide ONLY the direct translation - no explanations, no context, no examples
+3. Keep the translation concise and appropriate for the term category
+4. Do NOT generate creative content - this is strict terminology translation
+
+[Task]
+Translate this {category} from {source_lang} to {target_lang}:
+"{term}"
+
+Context: {context}
+
+Output ONLY the translated term (maximum 20 characters for most terms, 50 for locations):
+"""
+
+# Taiwan-specific term translation prompt
+TAIWAN_TERM_TRANSLATION_PROMPT = """[角色]
+你是專業的台灣本地化術語翻譯專家。
+
+[重要規則]
+1. 僅翻譯提供的單一術語 - 不要創作場景、劇本或對話
+2. 僅提供直接翻譯 - 不要解釋、不要情境說明、不要舉例
+3. 保持翻譯簡潔，符合術語類別
+4. 不要產生創意內容 - 這是嚴格的術語翻譯
+5. 使用台灣式繁體中文，避免中國大陸用語
+6. 禁止使用台文、台語、閩南語、客家話
+7. 禁止使用羅馬拼音或任何拼音系統（如 Kang-lâm、Tâi-pak 等）
+8. 所有翻譯必須使用繁體中文漢字
+
+""" + _TAIWAN_TERM_NAMING_RULES + """[任務]
+將此 {category} 從 {source_lang} 翻譯為 {target_lang}（台灣繁體中文）：
+"{term}"
+
+情境：{context}
+
+僅輸出翻譯後的術語（大部分術語最多20字，地點最多50字）：
+"""
+
+# Japanese-specific term translation prompt
+JAPANESE_TERM_TRANSLATION_PROMPT = """[役割]
+あなたは韓日ローカライゼーション用語翻訳の専門家です。
+
+[重要規則]
+1. 提供された単一の用語のみを翻訳する - シナリオ、台本、対話を作成しない
+2. 直接翻訳のみを提供する - 説明、文脈、例を含めない
+3. 翻訳は簡潔に、用語カテゴリに適切に
+4. 創作コンテンツを生成しない - これは厳格な用語翻訳です
+
+""" + _JAPANESE_TERM_NAMING_RULES + """[タスク]
 この {category} を {source_lang} から {target_lang} に翻訳してください：
 "{term}"
 
@@ -643,6 +648,71 @@ JAPANESE_TERM_TRANSLATION_PROMPT = """[役割]
 翻訳された用語のみを出力（ほとんどの用語は最大20文字、場所は最大50文字）：
 """
 
+# Batch term translation prompts (numbered list in, one "n. translation" line per term out)
+TERM_BATCH_TRANSLATION_PROMPT = """[Role]
+You are a professional translator specializing in terminology translation for localization.
+
+[Critical Requirements]
+1. Translate each term in the numbered list on its own - do NOT create scenarios, scripts, or dialogue
+2. Provide ONLY the direct translations - no explanations, no context, no examples
+3. Keep each translation concise and appropriate for the term category
+4. Do NOT generate creative content - this is strict terminology translation
+
+[Task]
+Translate these {count} {category} terms from {source_lang} to {target_lang}:
+{terms}
+
+Context: {context}
+
+[Output Format]
+Output exactly one line per term in the form "n. translation", with the same numbers and order as above, and nothing else.
+Each translation: maximum 20 characters for most terms, 50 for locations.
+"""
+
+TAIWAN_TERM_BATCH_TRANSLATION_PROMPT = """[角色]
+你是專業的台灣本地化術語翻譯專家。
+
+[重要規則]
+1. 逐一翻譯編號清單中的每個術語 - 不要創作場景、劇本或對話
+2. 僅提供直接翻譯 - 不要解釋、不要情境說明、不要舉例
+3. 每個翻譯保持簡潔，符合術語類別
+4. 不要產生創意內容 - 這是嚴格的術語翻譯
+5. 使用台灣式繁體中文，避免中國大陸用語
+6. 禁止使用台文、台語、閩南語、客家話
+7. 禁止使用羅馬拼音或任何拼音系統（如 Kang-lâm、Tâi-pak 等）
+8. 所有翻譯必須使用繁體中文漢字
+
+""" + _TAIWAN_TERM_NAMING_RULES + """[任務]
+將以下 {count} 個 {category} 從 {source_lang} 翻譯為 {target_lang}（台灣繁體中文）：
+{terms}
+
+情境：{context}
+
+[輸出格式]
+每個術語輸出一行，格式為「n. 翻譯」，編號與順序與上方相同，不要輸出其他內容。
+每個翻譯：大部分術語最多20字，地點最多50字。
+"""
+
+JAPANESE_TERM_BATCH_TRANSLATION_PROMPT = """[役割]
+あなたは韓日ローカライゼーション用語翻訳の専門家です。
+
+[重要規則]
+1. 番号付きリストの各用語を個別に翻訳する - シナリオ、台本、対話を作成しない
+2. 直接翻訳のみを提供する - 説明、文脈、例を含めない
+3. 各翻訳は簡潔に、用語カテゴリに適切に
+4. 創作コンテンツを生成しない - これは厳格な用語翻訳です
+
+""" + _JAPANESE_TERM_NAMING_RULES + """[タスク]
+以下の {count} 個の {category} を {source_lang} から {target_lang} に翻訳してください：
+{terms}
+
+コンテキスト：{context}
+
+[出力形式]
+用語ごとに「n. 翻訳」の形式で1行ずつ、上記と同じ番号・順序で出力し、それ以外は出力しない。
+各翻訳：ほとんどの用語は最大20文字、場所は最大50文字。
+"""
+
 # ==============================================================================
 # TAIWAN-SPECIFIC TRANSLATION PROMPT
 # ==============================================================================
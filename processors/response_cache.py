@@ -0,0 +1,186 @@
+"""
+LLM Response Cache
+Content-addressed on-disk cache for LLMProcessor results, so reruns (after a
+partial failure, or with unchanged input) do not repeat LLM calls.
+
+Keys cover the model, the request and the prompt templates the operation
+renders, so editing a prompt invalidates its entries. Entries also expire
+after a maximum age.
+"""
+
+import os
+import time
+import json
+import hashlib
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from processors import prompts
+from processors.json_io import load_json, save_json
+
+# Cache location (override with LLM_RESPONSE_CACHE_DIR)
+DEFAULT_CACHE_DIR = Path(
+    os.getenv('LLM_RESPONSE_CACHE_DIR', str(Path.home() / '.series-pipeline' / 'cache'))
+)
+
+# Entries older than this are ignored (override with LLM_RESPONSE_CACHE_MAX_AGE_HOURS)
+DEFAULT_CACHE_MAX_AGE_SECONDS = float(os.getenv('LLM_RESPONSE_CACHE_MAX_AGE_HOURS', '168')) * 3600
+
+# Bump when prompt-building code in LLMProcessor changes (e.g. batch
+# instructions added to a template), which the template fingerprint cannot see
+PROMPT_VERSION = 1
+
+# Templates in processors.prompts rendered by each cached operation; other
+# operations are keyed on every template in the module
+_OPERATION_PROMPTS = {
+    'tag': ('EMOTIONAL_TAGGING_PROMPT',),
+    'tag_speakers': ('SPEAKER_TAGGING_PROMPT_KR', 'SPEAKER_TAGGING_PROMPT_JP', 'SPEAKER_TAGGING_PROMPT_TW'),
+    'tag_speakers_batch': ('SPEAKER_TAGGING_PROMPT_KR', 'SPEAKER_TAGGING_PROMPT_JP', 'SPEAKER_TAGGING_PROMPT_TW'),
+}
+
+
+@lru_cache(maxsize=None)
+def _prompt_fingerprint(operation: Optional[str]) -> str:
+    """sha256 of the prompt templates an operation renders"""
+    names = _OPERATION_PROMPTS.get(operation) or sorted(
+        name for name, value in vars(prompts).items()
+        if name.isupper() and isinstance(value, str)
+    )
+    digest = hashlib.sha256(str(PROMPT_VERSION).encode('utf-8'))
+    for name in names:
+        digest.update(name.encode('utf-8'))
+        digest.update(getattr(prompts, name).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def request_key(llm_processor, request: Dict[str, Any]) -> str:
+    """
+    Hash a request together with the model that will answer it and the
+    prompt templates its operation renders.
+
+    Args:
+        llm_processor: LLMProcessor that would run the request
+        request: Request description ({'text' or 'texts', 'operation', 'params'})
+
+    Returns:
+        sha256 hex digest
+    """
+    model = getattr(llm_processor, 'model_type', '')
+    if model == 'qwen':
+        model = f"qwen:{getattr(llm_processor, 'ollama_model', '')}"
+    # Tagging operations may be routed to a separate (smaller) model
+    model = f"{model}|tagging:{getattr(llm_processor, 'tagging_model_name', '')}"
+    payload = json.dumps(
+        {'model': model, 'prompt': _prompt_fingerprint(request.get('operation')), 'request': request},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key: str, cache_dir: Path) -> Path:
+    return Path(cache_dir) / key[:2] / f"{key}.json"
+
+
+def load_cached_response(
+    key: str,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    max_age: float = DEFAULT_CACHE_MAX_AGE_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """Return the cached result for key, or None if missing, expired or unreadable"""
+    path = _cache_path(key, cache_dir)
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return load_json(path)
+    except Exception:
+        return None
+
+
+def save_cached_response(key: str, result: Dict[str, Any], cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+    """
+    Store a result under key.
+
+    The file is written to a temporary name and renamed into place, so
+    concurrent workers never see a partially written entry.
+    """
+    path = _cache_path(key, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    os.close(fd)
+    try:
+        save_json(result, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def cached_call(
+    llm_processor,
+    request: Dict[str, Any],
+    call: Callable[[], Dict[str, Any]],
+    enabled: bool = True,
+    cache_dir: Path = DEFAULT_CACHE_DIR
+) -> Dict[str, Any]:
+    """
+    Run call() for a request, reusing a cached result when the same request
+    was answered by the same model, with the same prompts, before.
+
+    Results with an empty 'output' are neither returned from nor written to
+    the cache. Cache write failures are ignored (the result is still returned).
+
+    Args:
+        llm_processor: LLMProcessor that call() uses
+        request: Request description; must be JSON-serializable
+        call: Runs the request and returns a JSON-serializable {'output', ...} dict
+        enabled: If False, always call the LLM and leave the cache untouched
+        cache_dir: Cache root directory
+
+    Returns:
+        call() result
+    """
+    if not enabled:
+        return call()
+
+    key = request_key(llm_processor, request)
+    cached = load_cached_response(key, cache_dir)
+    if cached is not None and cached.get('output'):
+        return cached
+
+    result = call()
+    if result.get('output'):
+        try:
+            save_cached_response(key, result, cache_dir)
+        except Exception:
+            pass
+    return result
+
+
+def cached_execute(
+    llm_processor,
+    request: Dict[str, Any],
+    enabled: bool = True,
+    cache_dir: Path = DEFAULT_CACHE_DIR
+) -> Dict[str, Any]:
+    """
+    Run llm_processor.execute(request) through the cache (see cached_call).
+
+    Args:
+        llm_processor: LLMProcessor instance
+        request: execute() input; must be JSON-serializable
+        enabled: If False, always call the LLM and leave the cache untouched
+        cache_dir: Cache root directory
+
+    Returns:
+        execute() result ({'output', 'metadata'})
+    """
+    return cached_call(
+        llm_processor, request, lambda: llm_processor.execute(request),
+        enabled=enabled, cache_dir=cache_dir
+    )
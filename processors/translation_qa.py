@@ -6,12 +6,21 @@ Validates translation quality by checking:
 """
 
 import re
+import queue
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Optional: Aho-Corasick automaton for single-pass glossary term search
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # Unicode ranges for language detection
 UNICODE_RANGES = {
@@ -22,6 +31,20 @@ UNICODE_RANGES = {
     'katakana': (0x30A0, 0x30FF),    # Japanese Katakana
 }
 
+# Character-class patterns built from UNICODE_RANGES once at import time and
+# shared by all validators (the regex engine scans each class as a lookup table)
+SCRIPT_PATTERNS = {
+    name: re.compile(f'[{chr(low)}-{chr(high)}]+')
+    for name, (low, high) in UNICODE_RANGES.items()
+}
+
+# Korean syllable runs
+KOREAN_PATTERN = SCRIPT_PATTERNS['korean']
+
+# Language-mixing errors collected per episode before the scan stops early
+# (onomatopoeia warnings do not count toward the limit)
+DEFAULT_MAX_ISSUES_PER_EPISODE = 20
+
 
 # Korean onomatopoeia/mimetic words that might intentionally remain untranslated
 # These are style choices - marked as warnings instead of errors
@@ -181,11 +204,73 @@ class TranslationQAValidator:
                         'original': original,
                         'translation': translation,
                         'context': term.get('context', ''),
-                        'known_wrong_variants': variants
+                        'known_wrong_variants': variants,
+                        # Expanded once here instead of per validated episode
+                        'similar_alternatives': self._get_similar_alternatives(translation)
                     })
 
-    def validate(self, text: str, episode_number: int = None) -> QAResult:
-        """Run all validation checks on translated text"""
+        # One automaton over untranslated originals + known wrong variants, so each
+        # episode is scanned once regardless of glossary size
+        self._term_automaton = None
+        if AHOCORASICK_AVAILABLE and (self.term_map or self.known_variants):
+            automaton = ahocorasick.Automaton()
+            for key in set(self.term_map) | set(self.known_variants):
+                automaton.add_word(key, key)
+            automaton.make_automaton()
+            self._term_automaton = automaton
+
+    def _find_glossary_occurrences(self, text: str) -> tuple:
+        """
+        Locate glossary originals and known wrong variants in text.
+
+        Returns:
+            (found_originals, variant_positions) - set of term_map keys present in
+            text, and {variant: [start positions]} of non-overlapping occurrences
+        """
+        if self._term_automaton is None:
+            found = {original for original in self.term_map if original in text}
+            variant_positions = {}
+            for variant in self.known_variants:
+                pos = text.find(variant)
+                while pos != -1:
+                    variant_positions.setdefault(variant, []).append(pos)
+                    pos = text.find(variant, pos + len(variant))  # Move past this occurrence
+            return found, variant_positions
+
+        found = set()
+        all_starts = {}
+        for end_idx, key in self._term_automaton.iter(text):
+            if key in self.term_map:
+                found.add(key)
+            if key in self.known_variants:
+                all_starts.setdefault(key, []).append(end_idx - len(key) + 1)
+
+        # Keep non-overlapping occurrences, matching str.find() scanning
+        variant_positions = {}
+        for variant, starts in all_starts.items():
+            kept = []
+            next_free = 0
+            for start in sorted(starts):
+                if start >= next_free:
+                    kept.append(start)
+                    next_free = start + len(variant)
+            variant_positions[variant] = kept
+        return found, variant_positions
+
+    def validate(
+        self,
+        text: str,
+        episode_number: int = None,
+        max_issues_per_episode: Optional[int] = DEFAULT_MAX_ISSUES_PER_EPISODE
+    ) -> QAResult:
+        """
+        Run all validation checks on translated text
+
+        Args:
+            max_issues_per_episode: Stop the language-mixing scan after this
+                many errors (None = report all). Any error already fails the
+                episode, and auto-fix retry passes pick up the rest.
+        """
         issues = []
 
         # Skip all translation checks if source == target (no translation occurred)
@@ -198,7 +283,7 @@ class TranslationQAValidator:
             )
 
         # Check for source language mixing
-        issues.extend(self.check_language_mixing(text))
+        issues.extend(self.check_language_mixing(text, max_issues=max_issues_per_episode))
 
         # Check glossary consistency
         issues.extend(self.check_glossary_consistency(text))
@@ -211,24 +296,23 @@ class TranslationQAValidator:
             episode_number=episode_number
         )
 
-    def check_language_mixing(self, text: str) -> list:
+    def check_language_mixing(self, text: str, max_issues: Optional[int] = None) -> list:
         """
         Detect source language (Korean) appearing in target text.
-        Returns list of QAIssue.
+        Returns list of QAIssue (at most max_issues errors, if given; the
+        scan stops at that error, so warnings after it are not reported).
 
         Onomatopoeia and mimetic words are marked as warnings (style choices),
         while other Korean text is marked as errors (translation failures).
         """
         issues = []
+        error_count = 0
 
         if self.source_lang != 'korean':
             return issues
 
-        # Korean syllable pattern
-        korean_pattern = re.compile(r'[\uAC00-\uD7AF]+')
-
         # Find all Korean text in the translation
-        for match in korean_pattern.finditer(text):
+        for match in KOREAN_PATTERN.finditer(text):
             korean_text = match.group()
             position = match.start()
 
@@ -254,6 +338,13 @@ class TranslationQAValidator:
                 message=message
             ))
 
+            # Only errors count toward the limit: warnings alone must never
+            # stop the scan before an untranslated sentence is found
+            if severity == 'error':
+                error_count += 1
+                if max_issues is not None and error_count >= max_issues:
+                    break
+
         return issues
 
     def check_glossary_consistency(self, text: str) -> list:
@@ -264,10 +355,11 @@ class TranslationQAValidator:
         - Known wrong variants (explicitly defined in glossary)
         """
         issues = []
+        found_originals, variant_positions = self._find_glossary_occurrences(text)
 
         # Check for untranslated terms
         for original, expected in self.term_map.items():
-            if original in text:
+            if original in found_originals:
                 issues.append(QAIssue(
                     type='untranslated_term',
                     severity='error',
@@ -278,36 +370,27 @@ class TranslationQAValidator:
 
         # Check for known wrong variants (e.g., アイドゥン instead of アイデン)
         for wrong_variant, correct_translation in self.known_variants.items():
-            if wrong_variant in text:
-                # Find all occurrences
-                pos = 0
-                while True:
-                    pos = text.find(wrong_variant, pos)
-                    if pos == -1:
-                        break
-
-                    # Get context
-                    start = max(0, pos - 20)
-                    end = min(len(text), pos + len(wrong_variant) + 20)
-                    context = text[start:end]
+            for pos in variant_positions.get(wrong_variant, []):
+                # Get context
+                start = max(0, pos - 20)
+                end = min(len(text), pos + len(wrong_variant) + 20)
+                context = text[start:end]
 
-                    issues.append(QAIssue(
-                        type='glossary_mismatch',
-                        severity='error',
-                        text=wrong_variant,
-                        expected=correct_translation,
-                        position=pos,
-                        context=context,
-                        message=f'잘못된 번역 변형: "{wrong_variant}" → "{correct_translation}" 사용 필요'
-                    ))
-                    pos += len(wrong_variant)  # Move past this occurrence
+                issues.append(QAIssue(
+                    type='glossary_mismatch',
+                    severity='error',
+                    text=wrong_variant,
+                    expected=correct_translation,
+                    position=pos,
+                    context=context,
+                    message=f'잘못된 번역 변형: "{wrong_variant}" → "{correct_translation}" 사용 필요'
+                ))
 
         # Check for similar character substitutions in character names
         for term in self.char_terms:
             expected = term['translation']
-            alternatives = self._get_similar_alternatives(expected)
 
-            for alt in alternatives:
+            for alt in term['similar_alternatives']:
                 if alt in text and alt != expected:
                     # Find position and context
                     pos = text.find(alt)
@@ -343,7 +426,7 @@ class TranslationQAValidator:
 
         return list(alternatives)
 
-    def auto_fix(self, text: str, issues: list, llm_processor=None) -> tuple:
+    def auto_fix(self, text: str, issues: list, llm_processor=None, segment_translations: dict = None) -> tuple:
         """
         Attempt to automatically fix translation issues.
 
@@ -352,6 +435,11 @@ class TranslationQAValidator:
         - language_mixing: LLM-based re-translation (requires llm_processor)
         - untranslated_term: LLM-based re-translation (requires llm_processor)
 
+        Args:
+            segment_translations: Optional pre-translated {korean_segment: translation}
+                map (e.g. from a batched LLM call). Segments found here skip the
+                per-segment LLM call.
+
         Returns (fixed_text, fixed_count, unfixed_issues)
         """
         fixed_text = text
@@ -381,9 +469,9 @@ class TranslationQAValidator:
                 unfixed_issues.append(issue)
 
         # Process language_mixing issues with LLM
-        if language_mixing_issues and llm_processor:
+        if language_mixing_issues and (llm_processor or segment_translations):
             fixed_text, mixing_fixed_count, mixing_unfixed = self._fix_language_mixing(
-                fixed_text, language_mixing_issues, llm_processor
+                fixed_text, language_mixing_issues, llm_processor, segment_translations
             )
             fixed_count += mixing_fixed_count
             unfixed_issues.extend(mixing_unfixed)
@@ -393,7 +481,17 @@ class TranslationQAValidator:
 
         return fixed_text, fixed_count, unfixed_issues
 
-    def _fix_language_mixing(self, text: str, issues: list, llm_processor) -> tuple:
+    @property
+    def llm_target_language(self) -> str:
+        """Target language code as expected by LLMProcessor"""
+        target_lang_map = {
+            'japanese': 'japanese',
+            'traditional_chinese': 'taiwanese',
+            'taiwanese': 'taiwanese'
+        }
+        return target_lang_map.get(self.target_lang, self.target_lang)
+
+    def _fix_language_mixing(self, text: str, issues: list, llm_processor, segment_translations: dict = None) -> tuple:
         """
         Fix language mixing issues by re-translating Korean segments.
 
@@ -401,6 +499,7 @@ class TranslationQAValidator:
             text: Text containing Korean segments
             issues: List of language_mixing QAIssue
             llm_processor: LLMProcessor instance for translation
+            segment_translations: Optional pre-translated {korean_segment: translation} map
 
         Returns:
             (fixed_text, fixed_count, unfixed_issues)
@@ -408,14 +507,9 @@ class TranslationQAValidator:
         fixed_text = text
         fixed_count = 0
         unfixed_issues = []
+        segment_translations = segment_translations or {}
 
-        # Map target language
-        target_lang_map = {
-            'japanese': 'japanese',
-            'traditional_chinese': 'taiwanese',
-            'taiwanese': 'taiwanese'
-        }
-        target = target_lang_map.get(self.target_lang, self.target_lang)
+        target = self.llm_target_language
 
         # Process each Korean segment
         for issue in issues:
@@ -426,6 +520,18 @@ class TranslationQAValidator:
             if korean_text not in fixed_text:
                 continue
 
+            # Use batched translation when available
+            if korean_text in segment_translations:
+                translated = segment_translations[korean_text]
+                fixed_text = fixed_text.replace(korean_text, translated, 1)
+                fixed_count += 1
+                logger.info(f"Auto-fixed language mixing (batch): {korean_text} → {translated}")
+                continue
+
+            if not llm_processor:
+                unfixed_issues.append(issue)
+                continue
+
             try:
                 # Create targeted translation prompt
                 result = llm_processor.execute({
@@ -444,8 +550,7 @@ class TranslationQAValidator:
                     translated = result['output'].strip()
 
                     # Validate: ensure translation doesn't contain Korean
-                    korean_pattern = re.compile(r'[\uAC00-\uD7AF]+')
-                    if not korean_pattern.search(translated):
+                    if not KOREAN_PATTERN.search(translated):
                         fixed_text = fixed_text.replace(korean_text, translated, 1)
                         fixed_count += 1
                         logger.info(f"Auto-fixed language mixing: {korean_text} → {translated}")
@@ -463,6 +568,53 @@ class TranslationQAValidator:
         return fixed_text, fixed_count, unfixed_issues
 
 
+class StreamingQAChecker:
+    """
+    Checks a streamed translation for language mixing while it is generated.
+
+    Text chunks are buffered and complete paragraphs (split on blank lines)
+    are handed to a background thread, so the regex scan overlaps with the
+    network-bound LLM stream instead of running after it.
+
+    Usage:
+        checker = StreamingQAChecker(validator)
+        llm_processor.translate_with_glossary(..., on_chunk=checker.feed)
+        issues = checker.close()
+    """
+
+    def __init__(self, validator: 'TranslationQAValidator'):
+        self.validator = validator
+        self.issues = []
+        self._buffer = ''
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def feed(self, chunk: str):
+        """Add streamed text; queue every completed paragraph for checking"""
+        self._buffer += chunk
+        while '\n\n' in self._buffer:
+            paragraph, self._buffer = self._buffer.split('\n\n', 1)
+            if paragraph.strip():
+                self._queue.put(paragraph)
+
+    def close(self) -> list:
+        """Check the remaining text and return all language_mixing QAIssues"""
+        if self._buffer.strip():
+            self._queue.put(self._buffer)
+        self._buffer = ''
+        self._queue.put(None)
+        self._thread.join()
+        return self.issues
+
+    def _worker(self):
+        while True:
+            paragraph = self._queue.get()
+            if paragraph is None:
+                break
+            self.issues.extend(self.validator.check_language_mixing(paragraph))
+
+
 def validate_episode(
     content: str,
     episode_number: int,
@@ -529,3 +681,23 @@ def batch_validate(
         'total_issues': total_issues,
         'pass_rate': passed_count / len(episodes) if episodes else 0
     }
+
+
+# Tests
+if __name__ == '__main__':
+    validator = TranslationQAValidator(source_lang='korean', target_lang='traditional_chinese')
+
+    # Onomatopoeia warnings before an untranslated sentence must not hide it
+    text = '他笑了。깔깔 ' * DEFAULT_MAX_ISSUES_PER_EPISODE + '\n她說：안녕하세요 여러분'
+    capped = validator.validate(text)
+    uncapped = validator.validate(text, max_issues_per_episode=None)
+    print("Testing language-mixing cap (warnings then error):")
+    for label, result in (('capped', capped), ('uncapped', uncapped)):
+        status = "✓" if (not result.passed and result.error_count == 2) else "✗"
+        print(f"  {status} {label}: passed={result.passed}, errors={result.error_count}, warnings={result.warning_count}")
+
+    # The cap still stops the scan after max_issues errors
+    many_errors = '안녕 ' * 50
+    result = validator.validate(many_errors, max_issues_per_episode=5)
+    status = "✓" if result.error_count == 5 else "✗"
+    print(f"  {status} 50 errors capped at 5: errors={result.error_count}")
@@ -8,11 +8,18 @@ import sys
 import json
 import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict
 from tqdm import tqdm
-from processors.llm_processor import LLMProcessor
 from processors.glossary_manager import GlossaryManager
+from processors.translation_qa import TranslationQAValidator, StreamingQAChecker
+from processors.json_io import load_json, json_tail_contains
+from processors.episode_utils import list_episode_files, group_episodes, process_episode_batch
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime (google-generativeai is slow to import)
+    from processors.llm_processor import LLMProcessor
 
 
 def enforce_name_consistency(terms: List[Dict], target_lang: str) -> List[Dict]:
@@ -232,6 +239,9 @@ LANGUAGE_DISPLAY = {
     'taiwanese': '🇹🇼 Taiwanese'
 }
 
+# Short episodes packed into one translation request (1 = no batching)
+DEFAULT_BATCH_SIZE = 3
+
 
 def _copy_korean_episodes(series_folder: Path, episodes: List[Path]) -> int:
     """
@@ -281,14 +291,14 @@ def _generate_glossary_for_language(
     glossary_file = series_folder / f'glossary_{target_lang}.json'
 
     if glossary_file.exists():
-        glossary_manager = GlossaryManager(glossary_path=glossary_file)
-        print(f"     📚 Loaded existing glossary: {len(glossary_manager.get_all_terms())} terms")
+        glossary_manager = GlossaryManager.from_path(glossary_file)
+        tqdm.write(f"     📚 Loaded existing {target_lang} glossary: {len(glossary_manager.get_all_terms())} terms")
         return glossary_file, glossary_manager
 
     glossary_manager = GlossaryManager()
 
-    print(f"     📚 Creating comprehensive glossary from full series...")
-    print(f"        🔍 Scanning {len(episodes)} episodes...")
+    tqdm.write(f"     📚 Creating comprehensive {target_lang} glossary from full series...")
+    tqdm.write(f"        🔍 Scanning {len(episodes)} episodes...")
 
     # Load all episode contents
     all_contents = []
@@ -298,16 +308,16 @@ def _generate_glossary_for_language(
             all_contents.append(ep_data['content'])
 
     total_chars = sum(len(c) for c in all_contents)
-    print(f"        📊 Total content: {total_chars:,} characters")
+    tqdm.write(f"        📊 Total content: {total_chars:,} characters")
 
     # Extract terms from full series
-    print(f"        ⏳ Extracting terms...")
+    tqdm.write(f"        ⏳ Extracting terms...")
     terms = llm_processor.extract_terms_from_full_series(all_contents)
-    print(f"        📝 Extracted {len(terms)} terms")
+    tqdm.write(f"        📝 Extracted {len(terms)} terms")
 
     # Translate each term
-    print(f"        🌏 Translating {len(terms)} terms to {target_lang}...")
-    with tqdm(total=len(terms), desc="           Terms", bar_format='{desc}: {n}/{total}|{bar}|') as term_pbar:
+    tqdm.write(f"        🌏 Translating {len(terms)} terms to {target_lang}...")
+    with tqdm(total=len(terms), desc=f"           Terms ({target_lang})", bar_format='{desc}: {n}/{total}|{bar}|') as term_pbar:
         for term in terms:
             try:
                 term_translation = llm_processor.translate_term(
@@ -347,7 +357,7 @@ def _generate_glossary_for_language(
     glossary_manager.glossary_data['created_date'] = datetime.now().isoformat()
 
     glossary_manager.save(glossary_file)
-    print(f"        💾 Saved glossary: {len(glossary_manager.get_all_terms())} terms")
+    tqdm.write(f"        💾 Saved {target_lang} glossary: {len(glossary_manager.get_all_terms())} terms")
 
     return glossary_file, glossary_manager
 
@@ -369,22 +379,150 @@ def _generate_glossary_csv_for_language(
     csv_path = review_gen.generate_glossary_csv(glossary_file, target_language=target_lang)
 
     if csv_path:
-        print(f"        📊 Exported glossary CSV: {csv_path}")
+        tqdm.write(f"        📊 Exported glossary CSV: {csv_path}")
 
     return csv_path
 
 
+def _prepare_glossary_for_language(
+    series_folder: Path,
+    target_lang: str,
+    source_language: str,
+    episodes: List[Path],
+    llm_processor: 'LLMProcessor'
+) -> tuple[Path, 'GlossaryManager', Optional[Path]]:
+    """
+    Generate glossary JSON for one language, then its CSV.
+
+    The CSV only depends on the same language's JSON, so each language
+    runs this chain independently of the others (messages go through
+    tqdm.write so concurrent languages don't interleave within a line).
+
+    Returns:
+        Tuple of (glossary_file_path, GlossaryManager, csv_path)
+    """
+    glossary_file, glossary_manager = _generate_glossary_for_language(
+        series_folder, target_lang, source_language, episodes, llm_processor
+    )
+
+    # Check if CSV already exists
+    from processors.review_generator import ReviewGenerator
+    review_gen = ReviewGenerator(series_folder)
+    expected_csv = review_gen.review_dir / f'glossary_{target_lang}.csv'
+
+    if expected_csv.exists():
+        tqdm.write(f"        📊 CSV already exists: {expected_csv}")
+        csv_path = expected_csv
+    else:
+        csv_path = _generate_glossary_csv_for_language(
+            series_folder, glossary_file, target_lang
+        )
+
+    return glossary_file, glossary_manager, csv_path
+
+
+def _translate_text_with_retry(
+    content: str,
+    target_lang: str,
+    source_language: str,
+    glossary_terms: List[Dict],
+    llm_processor: 'LLMProcessor',
+    pbar: tqdm,
+    validator: Optional[TranslationQAValidator] = None
+) -> str:
+    """
+    Translate one episode's content, retrying transient API failures.
+
+    If a validator is given, the translation is streamed and checked for
+    language mixing paragraph by paragraph while it is being generated.
+
+    Returns:
+        Translated text
+    """
+    max_retries = 3
+    retry_delay = 10
+
+    for attempt in range(max_retries):
+        checker = StreamingQAChecker(validator) if validator else None
+        try:
+            translate_result = llm_processor.execute({
+                'text': content,
+                'operation': 'translate',
+                'params': {
+                    'source_lang': source_language,
+                    'target_lang': target_lang,
+                    'glossary': glossary_terms,
+                    'on_chunk': checker.feed if checker else None
+                }
+            })
+            if checker:
+                mixing_errors = [i for i in checker.close() if i.severity == 'error']
+                if mixing_errors:
+                    pbar.write(f"        ⚠️  {len(mixing_errors)} untranslated segments detected (fix with Stage 2A --auto-fix)")
+            return translate_result['output']
+        except Exception as e:
+            if checker:
+                checker.close()
+            if attempt < max_retries - 1:
+                pbar.write(f"        ⚠️  Retry {attempt + 1}/{max_retries}: {e}")
+                time.sleep(retry_delay)
+            else:
+                raise
+
+    raise Exception("Translation failed after retries")
+
+
+def _translate_episode_batch(
+    episode_files: List[Path],
+    target_lang: str,
+    source_language: str,
+    glossary_terms: List[Dict],
+    llm_processor: 'LLMProcessor',
+    pbar: tqdm
+) -> Dict[Path, tuple]:
+    """
+    Translate several short episodes in one LLM request.
+
+    Episodes too long to batch are left out and translated individually
+    by the caller.
+
+    Returns:
+        {episode_file: (episode_data, translated_text)} for the batched episodes;
+        empty if the batch could not be translated or parsed
+    """
+    batch_results, messages = process_episode_batch(
+        episode_files,
+        lambda texts: llm_processor.translate_episodes_batch(
+            texts,
+            source_lang=source_language,
+            target_lang=target_lang,
+            glossary=llm_processor.format_glossary_terms(glossary_terms),
+            use_pro_model=True
+        ),
+        label='translation',
+        indent='        '
+    )
+    for message in messages:
+        pbar.write(message)
+    return batch_results
+
+
 def _translate_episodes_for_language(
     series_folder: Path,
     target_lang: str,
     source_language: str,
     episodes: List[Path],
     glossary_manager: 'GlossaryManager',
-    llm_processor: 'LLMProcessor'
+    llm_processor: 'LLMProcessor',
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> bool:
     """
     Translate episodes for one language.
 
+    Args:
+        batch_size: Number of short episodes packed into one LLM request
+            (1 = one request per episode)
+
     Returns:
         True if successful
     """
@@ -394,96 +532,102 @@ def _translate_episodes_for_language(
     failed_episodes = []
     skipped_episodes = []
     processed_count = 0
+    glossary_terms = glossary_manager.get_all_terms()
+
+    # Language mixing check run on the translation stream as it arrives
+    stream_validator = TranslationQAValidator(
+        source_lang=source_language,
+        target_lang=target_lang,
+        glossary={'terms': glossary_terms}
+    )
+
+    # Written after the content in the metadata block, so a tail scan finds it
+    done_marker = f'"translated_to": {json.dumps(target_lang)}'
 
     with tqdm(total=len(episodes), desc=f"     {target_lang}", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar:
+        pending_episodes = []
         for episode_file in episodes:
             output_file = target_folder / episode_file.name
 
-            # Skip if already processed
+            # Skip if already processed (full parse only if the tail scan misses)
             if output_file.exists():
                 try:
-                    with open(output_file, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                        if existing_data.get('metadata', {}).get('translated_to') == target_lang:
-                            skipped_episodes.append(episode_file.name)
-                            pbar.update(1)
-                            continue
+                    if json_tail_contains(output_file, done_marker):
+                        translated_to = target_lang
+                    else:
+                        translated_to = load_json(output_file).get('metadata', {}).get('translated_to')
+                    if translated_to == target_lang:
+                        skipped_episodes.append(episode_file.name)
+                        pbar.update(1)
+                        continue
                 except Exception:
                     pass
 
-            try:
-                # Load episode
-                with open(episode_file, 'r', encoding='utf-8') as f:
-                    episode_data = json.load(f)
-
-                content = episode_data['content']
-                original_title = episode_data.get('title', '')
-
-                # Translate with retry logic
-                max_retries = 3
-                retry_delay = 10
-                translated_text = None
-
-                for attempt in range(max_retries):
-                    try:
-                        translate_result = llm_processor.execute({
-                            'text': content,
-                            'operation': 'translate',
-                            'params': {
-                                'source_lang': source_language,
-                                'target_lang': target_lang,
-                                'glossary': glossary_manager.get_all_terms()
-                            }
-                        })
-                        translated_text = translate_result['output']
-                        break
-                    except Exception as e:
-                        if attempt < max_retries - 1:
-                            pbar.write(f"        ⚠️  Retry {attempt + 1}/{max_retries}: {e}")
-                            time.sleep(retry_delay)
-                        else:
-                            raise
-
-                if translated_text is None:
-                    raise Exception("Translation failed after retries")
-
-                # Translate title if present
-                translated_title = original_title
-                if original_title and source_language != target_lang:
-                    try:
-                        title_result = llm_processor.execute({
-                            'text': original_title,
-                            'operation': 'translate_title',
-                            'params': {
-                                'source_lang': source_language,
-                                'target_lang': target_lang,
-                                'glossary': glossary_manager.get_all_terms()
-                            }
-                        })
-                        translated_title = title_result['output']
-                    except Exception as e:
-                        pbar.write(f"        ⚠️  Title translation failed: {e}")
-
-                # Save translated episode
-                episode_data['content'] = translated_text
-                episode_data['title'] = translated_title
-                episode_data['metadata']['translated_to'] = target_lang
-                episode_data['metadata']['source_language'] = source_language
-                episode_data['metadata']['translation_type'] = 'llm'
-                episode_data['metadata']['glossary_used'] = True
-                if original_title != translated_title:
-                    episode_data['metadata']['original_title'] = original_title
-
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(episode_data, f, ensure_ascii=False, indent=2)
-
-                processed_count += 1
-                pbar.update(1)
+            pending_episodes.append(episode_file)
 
-            except Exception as e:
-                pbar.write(f"        ❌ Failed {episode_file.name}: {e}")
-                failed_episodes.append((episode_file.name, str(e)))
-                pbar.update(1)
+        for chunk in group_episodes(pending_episodes, batch_size):
+            batch_results = {}
+            if len(chunk) > 1:
+                batch_results = _translate_episode_batch(
+                    chunk, target_lang, source_language, glossary_terms, llm_processor, pbar
+                )
+
+            for episode_file in chunk:
+                output_file = target_folder / episode_file.name
+
+                try:
+                    if episode_file in batch_results:
+                        episode_data, translated_text = batch_results[episode_file]
+                    else:
+                        # Load episode
+                        with open(episode_file, 'r', encoding='utf-8') as f:
+                            episode_data = json.load(f)
+
+                        translated_text = _translate_text_with_retry(
+                            episode_data['content'], target_lang, source_language,
+                            glossary_terms, llm_processor, pbar,
+                            validator=stream_validator
+                        )
+
+                    original_title = episode_data.get('title', '')
+
+                    # Translate title if present
+                    translated_title = original_title
+                    if original_title and source_language != target_lang:
+                        try:
+                            title_result = llm_processor.execute({
+                                'text': original_title,
+                                'operation': 'translate_title',
+                                'params': {
+                                    'source_lang': source_language,
+                                    'target_lang': target_lang,
+                                    'glossary': glossary_terms
+                                }
+                            })
+                            translated_title = title_result['output']
+                        except Exception as e:
+                            pbar.write(f"        ⚠️  Title translation failed: {e}")
+
+                    # Save translated episode
+                    episode_data['content'] = translated_text
+                    episode_data['title'] = translated_title
+                    episode_data['metadata']['translated_to'] = target_lang
+                    episode_data['metadata']['source_language'] = source_language
+                    episode_data['metadata']['translation_type'] = 'llm'
+                    episode_data['metadata']['glossary_used'] = True
+                    if original_title != translated_title:
+                        episode_data['metadata']['original_title'] = original_title
+
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        json.dump(episode_data, f, ensure_ascii=False, indent=2)
+
+                    processed_count += 1
+                    pbar.update(1)
+
+                except Exception as e:
+                    pbar.write(f"        ❌ Failed {episode_file.name}: {e}")
+                    failed_episodes.append((episode_file.name, str(e)))
+                    pbar.update(1)
 
     # Print summary
     print(f"        ✅ Processed: {processed_count}, Skipped: {len(skipped_episodes)}, Failed: {len(failed_episodes)}")
@@ -544,7 +688,7 @@ def _glossary_review_checkpoint(
                 print(f"  📥 자동 동기화됨: {synced}개 언어")
             for lang in languages:
                 glossary_file = series_folder / f'glossary_{lang}.json'
-                glossary_managers[lang] = GlossaryManager(glossary_path=glossary_file)
+                glossary_managers[lang] = GlossaryManager.from_path(glossary_file)
                 print(f"  📚 Reloaded {lang} glossary: {len(glossary_managers[lang].get_all_terms())} terms")
             print("  용어집을 다시 로드했습니다. 계속 검토해주세요.")
         else:
@@ -662,7 +806,7 @@ def _sync_csv_to_json_if_modified(
                     json.dump(existing_data, f, ensure_ascii=False, indent=2)
 
                 # Reload glossary manager
-                glossary_managers[lang] = GlossaryManager(glossary_path=json_path)
+                glossary_managers[lang] = GlossaryManager.from_path(json_path)
                 print(f"     ✅ 동기화 완료: {len(terms)} terms → {json_path.name}")
                 synced_count += 1
 
@@ -677,14 +821,15 @@ def run_stage_2(
     target_languages: Optional[List[str]] = None,
     glossary_only: bool = False,
     review_glossary: bool = False,
-    max_episodes: int = None
+    max_episodes: int = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
 ):
     """
     Run Stage 2: Multi-Language Translation (Phase-based workflow)
 
     Restructured workflow:
-    1. Phase 1: Generate ALL glossary JSONs (non-Korean languages)
-    2. Phase 2: Generate ALL glossary CSVs
+    1. Phase 1-2: Generate glossary JSON and then CSV for each non-Korean
+       language (languages run concurrently)
     3. Phase 3: Human review checkpoint (if review_glossary=True)
     4. Phase 4: Translate ALL languages
 
@@ -694,6 +839,7 @@ def run_stage_2(
         glossary_only: If True, only generate glossary and exit (no translation)
         review_glossary: If True, pause after glossary generation for human review
         max_episodes: Maximum number of episodes to process (None = all)
+        batch_size: Number of short episodes translated per LLM request
     """
     if target_languages is None:
         target_languages = TARGET_LANGUAGES
@@ -717,8 +863,7 @@ def run_stage_2(
         print(f"❌ Series metadata not found: {metadata_file}")
         return False
 
-    with open(metadata_file, 'r', encoding='utf-8') as f:
-        series_metadata = json.load(f)
+    series_metadata = load_json(metadata_file)
 
     source_language = series_metadata.get('source_language', 'korean')
     print(f"📖 Source language: {source_language}")
@@ -726,7 +871,7 @@ def run_stage_2(
     print()
 
     # Get all episode files
-    episodes = sorted(stage_01_split.glob('episode_*.json'))
+    episodes = list_episode_files(stage_01_split)
 
     if not episodes:
         print(f"❌ No episode files found in {stage_01_split}")
@@ -742,6 +887,7 @@ def run_stage_2(
     print(f"📊 Episodes to translate: {len(episodes)}")
     print()
 
+    from processors.llm_processor import LLMProcessor
     llm_processor = LLMProcessor()
 
     # Filter out Korean (no glossary/translation needed - just copy)
@@ -765,55 +911,39 @@ def run_stage_2(
         return True
 
     # ═══════════════════════════════════════════════════════════════════════════
-    # PHASE 1: Generate ALL glossary JSONs
+    # PHASE 1-2: Generate glossary JSON → CSV for each language
     # ═══════════════════════════════════════════════════════════════════════════
     print("=" * 60)
-    print("  PHASE 1: Generating Glossary JSONs")
+    print("  PHASE 1-2: Generating Glossaries (JSON → CSV)")
     print("=" * 60)
     print()
 
     glossary_managers: Dict[str, GlossaryManager] = {}
     glossary_files: Dict[str, Path] = {}
+    csv_paths: Dict[str, Optional[Path]] = {}
 
-    for target_lang in non_korean_langs:
-        emoji = '🇯🇵' if target_lang == 'japanese' else '🇹🇼'
-        print(f"  {emoji} {target_lang.upper()}")
+    # Each language's CSV starts as soon as its own JSON is ready instead of
+    # waiting for every language's JSON; all chains finish before the review.
+    with ThreadPoolExecutor(max_workers=len(non_korean_langs)) as executor:
+        futures = {
+            target_lang: executor.submit(
+                _prepare_glossary_for_language,
+                series_folder, target_lang, source_language, episodes, llm_processor
+            )
+            for target_lang in non_korean_langs
+        }
 
-        glossary_file, manager = _generate_glossary_for_language(
-            series_folder, target_lang, source_language, episodes, llm_processor
-        )
-        glossary_managers[target_lang] = manager
-        glossary_files[target_lang] = glossary_file
-        print()
+        for target_lang in non_korean_langs:
+            glossary_file, manager, csv_path = futures[target_lang].result()
+            glossary_managers[target_lang] = manager
+            glossary_files[target_lang] = glossary_file
+            csv_paths[target_lang] = csv_path
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # PHASE 2: Generate ALL glossary CSVs
-    # ═══════════════════════════════════════════════════════════════════════════
-    print("=" * 60)
-    print("  PHASE 2: Generating Glossary CSVs")
-    print("=" * 60)
     print()
-
-    csv_paths: Dict[str, Optional[Path]] = {}
-
     for target_lang in non_korean_langs:
         emoji = '🇯🇵' if target_lang == 'japanese' else '🇹🇼'
-        print(f"  {emoji} {target_lang.upper()}")
-
-        # Check if CSV already exists
-        from processors.review_generator import ReviewGenerator
-        review_gen = ReviewGenerator(series_folder)
-        expected_csv = review_gen.review_dir / f'glossary_{target_lang}.csv'
-
-        if expected_csv.exists():
-            csv_paths[target_lang] = expected_csv
-            print(f"        📊 CSV already exists: {expected_csv}")
-        else:
-            csv_path = _generate_glossary_csv_for_language(
-                series_folder, glossary_files[target_lang], target_lang
-            )
-            csv_paths[target_lang] = csv_path
-        print()
+        print(f"  {emoji} {target_lang.upper()}: {len(glossary_managers[target_lang].get_all_terms())} terms")
+    print()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Handle glossary_only mode - exit after generating all glossaries
@@ -839,10 +969,10 @@ def run_stage_2(
         if not proceed:
             return False
 
-        # Reload glossaries after potential human edits
+        # Reload glossaries after potential human edits (unchanged files are reused)
         for target_lang in non_korean_langs:
             glossary_file = series_folder / f'glossary_{target_lang}.json'
-            glossary_managers[target_lang] = GlossaryManager(glossary_path=glossary_file)
+            glossary_managers[target_lang] = GlossaryManager.from_path(glossary_file)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PHASE 4: Translate ALL languages
@@ -861,7 +991,8 @@ def run_stage_2(
 
         success = _translate_episodes_for_language(
             series_folder, target_lang, source_language,
-            episodes, glossary_managers[target_lang], llm_processor
+            episodes, glossary_managers[target_lang], llm_processor,
+            batch_size=batch_size
         )
         if not success:
             overall_success = False
@@ -939,6 +1070,12 @@ Workflow:
         default=None,
         help='Maximum number of episodes to process'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'Short episodes translated per LLM request (default: {DEFAULT_BATCH_SIZE}, 1 = no batching)'
+    )
 
     args = parser.parse_args()
     series_folder = Path(args.series_folder)
@@ -955,6 +1092,7 @@ Workflow:
         target_languages=args.langs,
         glossary_only=args.glossary_only,
         review_glossary=review_glossary,
-        max_episodes=args.max_episodes
+        max_episodes=args.max_episodes,
+        batch_size=args.batch_size
     )
     sys.exit(0 if success else 1)
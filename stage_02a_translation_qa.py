@@ -4,14 +4,18 @@ Stage 2A: Translation QA
 Validate translation quality by checking language mixing, glossary consistency, and character name accuracy
 """
 
+import io
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
-from tqdm import tqdm
-from processors.translation_qa import TranslationQAValidator, batch_validate, QAResult
-from processors.glossary_manager import GlossaryManager
-from processors.llm_processor import LLMProcessor
+from typing import TYPE_CHECKING, Optional, List
+from processors.json_io import load_json, save_json
+from processors.episode_utils import list_episode_files
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep CLI startup fast
+    from processors.llm_processor import LLMProcessor
+    from processors.translation_qa import TranslationQAValidator
 
 # Language configurations
 LANGUAGE_CONFIG = {
@@ -35,6 +39,155 @@ LANGUAGE_CONFIG = {
     }
 }
 
+# Default number of episodes validated/auto-fixed concurrently (LLM round-trips dominate)
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Threads used to read episode JSON files before validation
+EPISODE_LOAD_WORKERS = 16
+
+# Per-episode progress messages are written in batches of this many episodes
+PROGRESS_FLUSH_EVERY = 16
+
+# qa_summary.txt templates (formatted with str.format_map)
+_SUMMARY_RULE = "=" * 60
+_SUMMARY_HEADER_TEMPLATE = (
+    _SUMMARY_RULE + "\n"
+    "Translation QA Report: {series_name}\n"
+    + _SUMMARY_RULE + "\n"
+    "\n"
+    "Status: {status}\n"
+    "Total Episodes: {total_episodes}\n"
+    "Total Errors: {total_errors}\n"
+    "Total Warnings: {total_warnings}\n"
+    "Glossary Terms: {glossary_term_count}\n"
+    "\n"
+)
+_LANGUAGE_HEADER_TEMPLATE = "-" * 40 + "\n{lang} [{status}]\n  Errors: {error_count}, Warnings: {warning_count}"
+_EPISODE_TEMPLATE = "    Episode {episode_number:03d}: {error_count} errors, {warning_count} warnings"
+_ISSUE_TEMPLATE = "      [{severity}] {message}"
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, used to detect changes since it was cached"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_episode(episode_file: Path, episode_cache: dict) -> tuple:
+    """
+    Read one episode JSON file, reusing the cached copy if the file is unchanged.
+
+    Returns:
+        Tuple of (episode_file, episode_data or None, error or None)
+    """
+    try:
+        signature = _file_signature(episode_file)
+        cached = episode_cache.get(episode_file)
+        if cached and signature is not None and cached[0] == signature:
+            return episode_file, cached[1], None
+
+        episode_data = load_json(episode_file)
+        episode_cache[episode_file] = (signature, episode_data)
+        return episode_file, episode_data, None
+    except Exception as e:
+        return episode_file, None, e
+
+
+def _load_episodes(episodes: List[Path], episode_cache: dict) -> list:
+    """
+    Read all episode files on a thread pool (I/O releases the GIL).
+
+    Args:
+        episodes: Episode file paths
+        episode_cache: {episode_file: (file_signature, episode_data)} kept across
+            retry passes so unchanged files are read only once
+
+    Returns:
+        List of (episode_file, episode_data or None, error or None) in input order
+    """
+    with ThreadPoolExecutor(max_workers=EPISODE_LOAD_WORKERS) as executor:
+        return list(executor.map(lambda episode_file: _load_episode(episode_file, episode_cache), episodes))
+
+
+def _process_episode(
+    episode_file: Path,
+    episode_data: dict,
+    validator: 'TranslationQAValidator',
+    auto_fix: bool,
+    llm_processor: Optional['LLMProcessor'],
+    segment_translations: Optional[dict] = None
+) -> tuple:
+    """
+    Validate (and optionally auto-fix) a single loaded episode.
+
+    Runs on a worker thread, so progress messages are returned to the caller
+    instead of being written to the progress bar directly.
+
+    Returns:
+        Tuple of (QAResult or None, fixed_count, messages)
+    """
+    messages = []
+
+    try:
+        episode_num = episode_data.get('episode_number', 0)
+        content = episode_data.get('content', '')
+
+        # Validate
+        result = validator.validate(content, episode_num)
+        fixed = 0
+
+        # Auto-fix if enabled
+        if auto_fix and result.issues:
+            fixed_content, fixed_count, remaining = validator.auto_fix(
+                content, result.issues, llm_processor=llm_processor,
+                segment_translations=segment_translations
+            )
+            if fixed_count > 0:
+                # episode_data is the shared cached copy: update it only once
+                # the fix is on disk, so a failed save is re-validated as broken
+                save_json({**episode_data, 'content': fixed_content}, episode_file)
+                episode_data['content'] = fixed_content
+                fixed = fixed_count
+                messages.append(f"      ✅ Episode {episode_num:03d}: Fixed {fixed_count} issues")
+
+        # Report critical issues
+        if result.error_count > 0:
+            messages.append(f"      ❌ Episode {episode_num:03d}: {result.error_count} errors, {result.warning_count} warnings")
+
+        return result, fixed, messages
+
+    except Exception as e:
+        messages.append(f"      ❌ Failed to process {episode_file.name}: {e}")
+        return None, 0, messages
+
+
+def _write_text(text: str, path: Path):
+    """Write a UTF-8 text file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _collect_mixing_segments(loaded_episodes: list, validator: 'TranslationQAValidator') -> list:
+    """
+    Collect unique language-mixing segments across all loaded episodes.
+
+    Returns:
+        List of (korean_segment, context) tuples, first context wins
+    """
+    segments = {}
+    for _, episode_data, _ in loaded_episodes:
+        if episode_data is None:
+            continue
+
+        for issue in validator.check_language_mixing(episode_data.get('content', '')):
+            if issue.severity == 'error' and issue.text not in segments:
+                segments[issue.text] = issue.context or ''
+
+    return list(segments.items())
+
 
 def run_stage_2a(
     series_folder: Path,
@@ -42,7 +195,9 @@ def run_stage_2a(
     auto_fix: bool = False,
     max_episodes: Optional[int] = None,
     fail_on_error: bool = False,
-    max_retries: int = 5
+    max_retries: int = 5,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    batch_fix: bool = False
 ) -> bool:
     """
     Run Stage 2A: Translation QA
@@ -54,6 +209,9 @@ def run_stage_2a(
         max_retries: Maximum retry attempts for auto-fix (default: 5)
         max_episodes: Limit number of episodes to validate
         fail_on_error: Return False if any errors found
+        max_concurrency: Number of episodes processed in parallel (default: 10)
+        batch_fix: Re-translate language-mixing segments of all episodes in
+            batched LLM requests instead of one request per segment
 
     Returns:
         True if QA passed (or no critical errors), False otherwise
@@ -94,9 +252,14 @@ def run_stage_2a(
     print(f"📁 Series: {series_folder.name}")
     print(f"🌏 Languages to validate: {', '.join(languages_to_validate)}")
     if auto_fix:
-        print(f"🔧 Auto-fix: Enabled")
+        print(f"🔧 Auto-fix: Enabled" + (" (batched)" if batch_fix else ""))
     print()
 
+    # Heavy modules are imported here so --help and early exits stay fast
+    from tqdm import tqdm
+    from processors.translation_qa import TranslationQAValidator
+    from processors.glossary_manager import GlossaryManager
+
     # Load glossary if available (check for language-specific glossaries)
     glossary = {'terms': []}
 
@@ -105,7 +268,7 @@ def run_stage_2a(
         glossary_file = series_folder / f'glossary_{lang}.json'
         if glossary_file.exists():
             try:
-                glossary_manager = GlossaryManager(glossary_file)
+                glossary_manager = GlossaryManager.from_path(glossary_file)
                 loaded = glossary_manager.glossary_data
                 if loaded.get('terms'):
                     glossary['terms'].extend(loaded['terms'])
@@ -129,6 +292,7 @@ def run_stage_2a(
     llm_processor = None
     if auto_fix:
         try:
+            from processors.llm_processor import LLMProcessor
             llm_processor = LLMProcessor()
             print(f"🤖 LLM Processor initialized for auto-fix")
         except Exception as e:
@@ -140,13 +304,14 @@ def run_stage_2a(
     total_errors = 0
     total_warnings = 0
     total_fixed = 0
+    total_episodes = 0
 
     for lang in languages_to_validate:
         config = LANGUAGE_CONFIG[lang]
         emoji = config['emoji']
 
         lang_dir = stage_02_translated / lang
-        episodes = sorted(lang_dir.glob('episode_*.json'))
+        episodes = list_episode_files(lang_dir)
 
         if max_episodes:
             episodes = episodes[:max_episodes]
@@ -155,6 +320,22 @@ def run_stage_2a(
             print(f"   ⚠️  No episodes found for {lang}")
             continue
 
+        # Initialize validator (independent of retry state, so built once per language)
+        # Skip language mixing check if source == target (e.g., Korean)
+        skip_lang_mixing = config.get('skip_language_mixing', False)
+        validator = TranslationQAValidator(
+            source_lang=config['source_lang'],
+            target_lang=config['target_lang'],
+            glossary=glossary,
+            skip_language_mixing=skip_lang_mixing
+        )
+
+        # Loaded episode data shared across retry passes
+        episode_cache = {}
+
+        # Latest QA result per episode, merged across retry passes
+        episode_results = {}
+
         # Retry loop for auto-fix
         retry_count = 0
         lang_passed = False
@@ -172,60 +353,89 @@ def run_stage_2a(
                 print(f"{emoji} Validating: {lang.upper()}")
                 print("=" * 40)
 
-            # Initialize validator
-            # Skip language mixing check if source == target (e.g., Korean)
-            skip_lang_mixing = config.get('skip_language_mixing', False)
-            validator = TranslationQAValidator(
-                source_lang=config['source_lang'],
-                target_lang=config['target_lang'],
-                glossary=glossary,
-                skip_language_mixing=skip_lang_mixing
-            )
-
-            lang_results = []
-            lang_errors = 0
-            lang_warnings = 0
             lang_fixed = 0
 
-            with tqdm(total=len(episodes), desc=f"   Checking",
-                      bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar:
-                for episode_file in episodes:
-                    try:
-                        with open(episode_file, 'r', encoding='utf-8') as f:
-                            episode_data = json.load(f)
-
-                        episode_num = episode_data.get('episode_number', 0)
-                        content = episode_data.get('content', '')
-
-                        # Validate
-                        result = validator.validate(content, episode_num)
-                        lang_results.append(result)
-
-                        # Count issues
-                        lang_errors += result.error_count
-                        lang_warnings += result.warning_count
-
-                        # Auto-fix if enabled
-                        if auto_fix and result.issues:
-                            fixed_content, fixed_count, remaining = validator.auto_fix(
-                                content, result.issues, llm_processor=llm_processor
-                            )
-                            if fixed_count > 0:
-                                episode_data['content'] = fixed_content
-                                with open(episode_file, 'w', encoding='utf-8') as f:
-                                    json.dump(episode_data, f, ensure_ascii=False, indent=2)
-                                lang_fixed += fixed_count
-                                pbar.write(f"      ✅ Episode {episode_num:03d}: Fixed {fixed_count} issues")
-
-                        # Report critical issues
-                        if result.error_count > 0:
-                            pbar.write(f"      ❌ Episode {episode_num:03d}: {result.error_count} errors, {result.warning_count} warnings")
-
-                    except Exception as e:
-                        pbar.write(f"      ❌ Failed to process {episode_file.name}: {e}")
+            # Retries only re-check episodes that still had errors; passing
+            # episodes keep their previous result
+            if retry_count == 1:
+                pending_episodes = episodes
+            else:
+                pending_episodes = [
+                    e for e in episodes
+                    if e not in episode_results or episode_results[e].error_count > 0
+                ]
+                print(f"   Re-checking {len(pending_episodes)}/{len(episodes)} episodes with errors")
+
+            # Read all episodes up front so validation works on in-memory data
+            loaded_episodes = _load_episodes(pending_episodes, episode_cache)
+
+            # Batch mode: translate all language-mixing segments up front so the
+            # per-episode auto-fix only needs per-segment calls for leftovers
+            segment_translations = None
+            if auto_fix and batch_fix and llm_processor and not skip_lang_mixing:
+                segments = _collect_mixing_segments(loaded_episodes, validator)
+                if segments:
+                    print(f"   📦 Batch-translating {len(segments)} mixed-language segments...")
+                    segment_translations = llm_processor.translate_segments_batch(
+                        segments,
+                        source_lang=config['source_lang'],
+                        target_lang=validator.llm_target_language,
+                        glossary=glossary
+                    )
+                    print(f"   📦 Batch-translated {len(segment_translations)}/{len(segments)} segments")
+
+            # Episodes are independent, so validate/auto-fix them concurrently.
+            # Progress messages are deferred and written in batches; the bar itself
+            # is only drawn on a terminal (plain count in logs instead).
+            pending_writes = []
+            show_bar = sys.stdout.isatty()
+            with tqdm(total=len(pending_episodes), desc=f"   Checking", disable=not show_bar,
+                      bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar, \
+                    ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+                futures = {}
+                for idx, (episode_file, episode_data, load_error) in enumerate(loaded_episodes):
+                    if load_error is not None:
+                        pending_writes.append(f"      ❌ Failed to process {episode_file.name}: {load_error}")
+                        episode_results.pop(episode_file, None)
+                        pbar.update(1)
+                        continue
+                    future = executor.submit(
+                        _process_episode, episode_file, episode_data, validator,
+                        auto_fix, llm_processor, segment_translations
+                    )
+                    futures[future] = idx
+                for completed, future in enumerate(as_completed(futures), 1):
+                    result, fixed_count, messages = future.result()
+                    pending_writes.extend(messages)
+                    if pending_writes and completed % PROGRESS_FLUSH_EVERY == 0:
+                        pbar.write('\n'.join(pending_writes))
+                        pending_writes.clear()
+
+                    episode_file, episode_data, _ = loaded_episodes[futures[future]]
+                    if fixed_count > 0:
+                        # Auto-fix updated the cached data in place and rewrote the file;
+                        # refresh the signature so the next pass skips re-reading it
+                        episode_cache[episode_file] = (_file_signature(episode_file), episode_data)
+
+                    if result is not None:
+                        episode_results[episode_file] = result
+                        lang_fixed += fixed_count
+                    else:
+                        episode_results.pop(episode_file, None)
 
                     pbar.update(1)
 
+                if pending_writes:
+                    pbar.write('\n'.join(pending_writes))
+
+            if not show_bar:
+                print(f"   Checking: {len(pending_episodes)}/{len(pending_episodes)}")
+
+            # Aggregate over all episodes (re-checked + carried over), in episode order
+            lang_results = [episode_results[e] for e in episodes if e in episode_results]
+            lang_errors = sum(r.error_count for r in lang_results)
+            lang_warnings = sum(r.warning_count for r in lang_results)
+
             cumulative_fixed += lang_fixed
 
             # Check if passed
@@ -264,6 +474,7 @@ def run_stage_2a(
         total_errors += lang_errors
         total_warnings += lang_warnings
         total_fixed += cumulative_fixed
+        total_episodes += len(lang_results)
 
     # Generate detailed report
     print()
@@ -271,15 +482,33 @@ def run_stage_2a(
     print()
     print("📋 Generating QA Report...")
 
-    report = generate_qa_report(series_folder.name, all_results, glossary)
+    # Totals were accumulated per language above; the report walk also renders
+    # the per-language text so the summary doesn't walk the results again
+    summary = {
+        'total_errors': total_errors,
+        'total_warnings': total_warnings,
+        'total_episodes': total_episodes,
+        'passed': all(data['passed'] for data in all_results.values())
+    }
+    language_lines = []
+    report = generate_qa_report(
+        series_folder.name, all_results, glossary,
+        summary=summary, language_lines=language_lines
+    )
     report_file = qa_output_dir / 'qa_report.json'
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
 
     # Generate human-readable summary
     summary_file = qa_output_dir / 'qa_summary.txt'
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(generate_text_summary(report))
+    summary_text = generate_text_summary(report, language_lines=language_lines)
+
+    # The two files are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [
+            executor.submit(save_json, report, report_file),
+            executor.submit(_write_text, summary_text, summary_file),
+        ]
+        for write in writes:
+            write.result()
 
     print(f"   ✅ Report saved: {report_file.name}")
     print(f"   ✅ Summary saved: {summary_file.name}")
@@ -313,13 +542,27 @@ def run_stage_2a(
     return True
 
 
-def generate_qa_report(series_name: str, all_results: dict, glossary: dict) -> dict:
-    """Generate detailed QA report as JSON"""
+def generate_qa_report(
+    series_name: str,
+    all_results: dict,
+    glossary: dict,
+    summary: Optional[dict] = None,
+    language_lines: Optional[List[str]] = None
+) -> dict:
+    """
+    Generate detailed QA report as JSON
+
+    Args:
+        summary: Pre-computed totals (total_errors, total_warnings,
+            total_episodes, passed); computed from all_results if omitted
+        language_lines: If given, the per-language section of the text
+            summary is appended to it while the results are walked
+    """
     report = {
         'series_name': series_name,
         'glossary_term_count': len(glossary.get('terms', [])),
         'languages': {},
-        'summary': {
+        'summary': dict(summary) if summary is not None else {
             'total_errors': 0,
             'total_warnings': 0,
             'total_episodes': 0,
@@ -336,6 +579,9 @@ def generate_qa_report(series_name: str, all_results: dict, glossary: dict) -> d
             'episodes': []
         }
 
+        if language_lines is not None:
+            _append_language_summary(language_lines, lang, lang_report)
+
         for result in data['results']:
             if result.issues:
                 ep_report = {
@@ -356,54 +602,80 @@ def generate_qa_report(series_name: str, all_results: dict, glossary: dict) -> d
                     ]
                 }
                 lang_report['episodes'].append(ep_report)
+                if language_lines is not None:
+                    _append_episode_summary(
+                        language_lines, ep_report, first=len(lang_report['episodes']) == 1
+                    )
+
+        if language_lines is not None:
+            language_lines.append("")
 
         report['languages'][lang] = lang_report
-        report['summary']['total_errors'] += data['error_count']
-        report['summary']['total_warnings'] += data['warning_count']
-        report['summary']['total_episodes'] += len(data['results'])
-        if not data['passed']:
-            report['summary']['passed'] = False
+        if summary is None:
+            report['summary']['total_errors'] += data['error_count']
+            report['summary']['total_warnings'] += data['warning_count']
+            report['summary']['total_episodes'] += len(data['results'])
+            if not data['passed']:
+                report['summary']['passed'] = False
 
     return report
 
 
-def generate_text_summary(report: dict) -> str:
-    """Generate human-readable text summary"""
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"Translation QA Report: {report['series_name']}")
-    lines.append("=" * 60)
-    lines.append("")
+def _append_language_summary(lines: List[str], lang: str, lang_report: dict):
+    """Append the header of one language's section of the text summary"""
+    lines.append(_LANGUAGE_HEADER_TEMPLATE.format(
+        lang=lang.upper(),
+        status="PASS" if lang_report['passed'] else "FAIL",
+        error_count=lang_report['error_count'],
+        warning_count=lang_report['warning_count']
+    ))
+
 
-    # Overall summary
+def _append_episode_summary(lines: List[str], ep: dict, first: bool):
+    """Append one episode-with-issues block of the text summary"""
+    if first:
+        lines.append(f"  Episodes with issues:")
+    lines.append(_EPISODE_TEMPLATE.format_map(ep))
+    for issue in ep['issues'][:3]:  # Show first 3 issues
+        lines.append(_ISSUE_TEMPLATE.format(severity=issue['severity'].upper(), message=issue['message']))
+    if len(ep['issues']) > 3:
+        lines.append(f"      ... and {len(ep['issues']) - 3} more issues")
+
+
+def generate_text_summary(report: dict, language_lines: Optional[List[str]] = None) -> str:
+    """
+    Generate human-readable text summary
+
+    Args:
+        language_lines: Per-language section already rendered by
+            generate_qa_report (rendered from the report if omitted)
+    """
     summary = report['summary']
-    status = "PASSED" if summary['passed'] else "FAILED"
-    lines.append(f"Status: {status}")
-    lines.append(f"Total Episodes: {summary['total_episodes']}")
-    lines.append(f"Total Errors: {summary['total_errors']}")
-    lines.append(f"Total Warnings: {summary['total_warnings']}")
-    lines.append(f"Glossary Terms: {report['glossary_term_count']}")
-    lines.append("")
+    out = io.StringIO()
+    out.write(_SUMMARY_HEADER_TEMPLATE.format(
+        series_name=report['series_name'],
+        status="PASSED" if summary['passed'] else "FAILED",
+        total_episodes=summary['total_episodes'],
+        total_errors=summary['total_errors'],
+        total_warnings=summary['total_warnings'],
+        glossary_term_count=report['glossary_term_count']
+    ))
 
     # Per-language details
-    for lang, data in report['languages'].items():
-        lines.append("-" * 40)
-        status = "PASS" if data['passed'] else "FAIL"
-        lines.append(f"{lang.upper()} [{status}]")
-        lines.append(f"  Errors: {data['error_count']}, Warnings: {data['warning_count']}")
-
-        if data['episodes']:
-            lines.append(f"  Episodes with issues:")
-            for ep in data['episodes']:
-                lines.append(f"    Episode {ep['episode_number']:03d}: {ep['error_count']} errors, {ep['warning_count']} warnings")
-                for issue in ep['issues'][:3]:  # Show first 3 issues
-                    lines.append(f"      [{issue['severity'].upper()}] {issue['message']}")
-                if len(ep['issues']) > 3:
-                    lines.append(f"      ... and {len(ep['issues']) - 3} more issues")
-        lines.append("")
-
-    lines.append("=" * 60)
-    return "\n".join(lines)
+    if language_lines is None:
+        language_lines = []
+        for lang, data in report['languages'].items():
+            _append_language_summary(language_lines, lang, data)
+            for idx, ep in enumerate(data['episodes']):
+                _append_episode_summary(language_lines, ep, first=idx == 0)
+            language_lines.append("")
+
+    for line in language_lines:
+        out.write(line)
+        out.write("\n")
+
+    out.write(_SUMMARY_RULE)
+    return out.getvalue()
 
 
 if __name__ == '__main__':
@@ -438,6 +710,7 @@ Auto-fix:
   3. Untranslated terms (using glossary translations)
 
   Language mixing auto-fix uses LLM to re-translate Korean segments.
+  Add --batch-fix to send all segments in a few batched requests.
 """
     )
 
@@ -451,6 +724,10 @@ Auto-fix:
                         help='Maximum number of episodes to validate')
     parser.add_argument('--max-retries', type=int, default=5,
                         help='Maximum retry attempts for auto-fix (default: 5)')
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f'Episodes processed in parallel (default: {DEFAULT_MAX_CONCURRENCY})')
+    parser.add_argument('--batch-fix', action='store_true',
+                        help='With --auto-fix, re-translate mixed-language segments in batched LLM requests')
     parser.add_argument('--strict', action='store_true',
                         help='Return non-zero exit code if errors found')
 
@@ -468,6 +745,8 @@ Auto-fix:
         auto_fix=args.auto_fix,
         max_episodes=args.max_episodes,
         fail_on_error=args.strict,
-        max_retries=args.max_retries
+        max_retries=args.max_retries,
+        max_concurrency=args.max_concurrency,
+        batch_fix=args.batch_fix
     )
     sys.exit(0 if success else 1)
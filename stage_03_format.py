@@ -5,18 +5,28 @@ Format translated text for optimal TTS synthesis per target language
 """
 
 import sys
-import json
 import time
 import re
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 from tqdm import tqdm
 from processors.llm_processor import LLMProcessor
-from processors.episode_utils import arabic_to_chinese
+from processors.episode_utils import (
+    arabic_to_chinese, list_episode_files, group_episodes, process_episode_group
+)
+from processors.json_io import load_json, save_json, json_tail_contains
 
 # Target languages
 TARGET_LANGUAGES = ['korean', 'japanese', 'taiwanese']
 
+# Default number of episodes formatted concurrently (LLM round-trips dominate)
+DEFAULT_FORMAT_WORKERS = 8
+
+# Default number of short episodes formatted per LLM request
+DEFAULT_FORMAT_BATCH_SIZE = 3
+
 # Language display names
 LANGUAGE_DISPLAY = {
     'korean': '🇰🇷 Korean',
@@ -24,6 +34,14 @@ LANGUAGE_DISPLAY = {
     'taiwanese': '🇹🇼 Taiwanese'
 }
 
+# Fallback episode titles when none can be extracted or generated
+DEFAULT_TITLE_FORMATS = {
+    'korean': "에피소드 {n}",
+    'japanese': "エピソード {n}",
+    'taiwanese': "第{n}集",
+}
+DEFAULT_TITLE_FORMAT = "Episode {n}"
+
 # Korean number words
 KOREAN_NUMBER_WORDS = {
     1: '일', 2: '이', 3: '삼', 4: '사', 5: '오',
@@ -31,35 +49,30 @@ KOREAN_NUMBER_WORDS = {
 }
 
 
+def _build_korean_number_table() -> dict:
+    """Korean number words for 1-99 (11 → 십일, 20 → 이십, 21 → 이십일)"""
+    table = dict(KOREAN_NUMBER_WORDS)
+    for num in range(11, 100):
+        tens, ones = divmod(num, 10)
+        prefix = '' if tens == 1 else KOREAN_NUMBER_WORDS[tens]
+        table[num] = f"{prefix}십{KOREAN_NUMBER_WORDS.get(ones, '')}"
+    return table
+
+
+# Precomputed once at import: {1: '일', ..., 99: '구십구'}
+_KOREAN_NUMBER_TABLE = _build_korean_number_table()
+
+
 def arabic_to_korean(num: int) -> str:
     """
     Convert Arabic number to Korean number word.
 
     Examples:
         1 → 일, 10 → 십, 11 → 십일, 21 → 이십일, 50 → 오십
-    """
-    if num <= 0:
-        return str(num)
-
-    if num <= 10:
-        return KOREAN_NUMBER_WORDS[num]
-
-    if num < 20:
-        # 11-19: 십일, 십이, ...
-        ones = num % 10
-        return f"십{KOREAN_NUMBER_WORDS[ones]}" if ones > 0 else "십"
-
-    if num < 100:
-        # 20-99
-        tens = num // 10
-        ones = num % 10
-        result = f"{KOREAN_NUMBER_WORDS[tens]}십"
-        if ones > 0:
-            result += KOREAN_NUMBER_WORDS[ones]
-        return result
 
-    # For numbers >= 100, just return Arabic
-    return str(num)
+    Numbers outside 1-99 are returned as Arabic digits.
+    """
+    return _KOREAN_NUMBER_TABLE.get(num, str(num))
 
 # Episode title patterns by language
 EPISODE_PATTERNS = {
@@ -77,6 +90,98 @@ EPISODE_PATTERNS = {
     ]
 }
 
+# Compiled once at import: {language: [(pattern, num_group, title_group), ...]}
+# (CJK and digits only, so no re.IGNORECASE)
+_EPISODE_PATTERNS_COMPILED = {
+    lang: [
+        (re.compile(pattern, re.MULTILINE), num_group, title_group)
+        for pattern, num_group, title_group in plist
+    ]
+    for lang, plist in EPISODE_PATTERNS.items()
+}
+
+# Korean number words
+_KOREAN_NUMBERS = r'(?:일|이|삼|사|오|육|칠|팔|구|십|백|천|' + \
+                  r'하나|둘|셋|넷|다섯|여섯|일곱|여덟|아홉|열|' + \
+                  r'[일이삼사오육칠팔구십백천]+)'
+
+# Hiragana characters used in number readings
+_HIRAGANA_NUMBER_CHARS = 'いちにさんしよんごろくしちななはちきゅうくじゅうひゃくせん'
+
+# Japanese hiragana numbers (for LLM-converted headers like だいいっしゅう, だいよんしゅう)
+# Includes all readings: いち(1), に(2), さん(3), し/よん(4), ご(5), ろく(6), しち/なな(7), はち(8), きゅう/く(9), じゅう(10)
+_HIRAGANA_NUMBERS = r'(?:いち|に|さん|し|よん|ご|ろく|しち|なな|はち|きゅう|く|じゅう|' + \
+                    r'ひゃく|せん|いっ|にっ|さっ|よっ|ごっ|ろっ|しっ|はっ|きゅっ|' + \
+                    r'[' + _HIRAGANA_NUMBER_CHARS + r']+)'
+
+# Japanese number words
+_JAPANESE_NUMBERS = r'(?:一|二|三|四|五|六|七|八|九|十|百|千|[一二三四五六七八九十百千]+)'
+
+# Episode header patterns removed by clean_header_for_tts (no '^': they are
+# applied with match() at an explicit position)
+_REMOVAL_PATTERN_BODIES = {
+    # "Episode 일." or "Episode 1." with optional title; ASCII case classes
+    # instead of re.IGNORECASE, which would also apply Unicode case folding
+    'episode': r'[Ee][Pp][Ii][Ss][Oo][Dd][Ee]\s+(?:\d+|' + _KOREAN_NUMBERS + r')\s*[.。]?\s*(?:[^\n]+[.。])?\s*\n+',
+    # "에피소드 일." or "에피소드 1." with optional title
+    'korean_episode': r'에피소드\s*(?:\d+|' + _KOREAN_NUMBERS + r')(?:화)?\s*[.。]?\s*(?:[^\n]+[.。])?\s*\n+',
+    # "1화." or "제1화." with optional title
+    'korean_hwa': r'(?:제)?(?:\d+)화\s*[.。:]\s*(?:[^\n]+[.。])?\s*\n+',
+    # "第1話" or "第一話" with optional title (kanji)
+    'kanji_wa': r'第(?:\d+|' + _JAPANESE_NUMBERS + r')話\s*[.。]?\s*(?:[^\n]+[.。。])?\s*\n+',
+    # "第1集" with optional title (kanji)
+    'kanji_ji': r'第(?:\d+|' + _JAPANESE_NUMBERS + r')集\s*[.。]?\s*(?:[^\n]+[.。。])?\s*\n+',
+    # Hiragana episode headers (LLM-converted): "だいいっしゅう。" "だいにしゅう。" etc.
+    'hiragana_dai': r'だい' + _HIRAGANA_NUMBERS + r'(?:しゅう|わ|か)\s*[.。]?\s*\n+',
+    # Generic hiragana chapter patterns
+    'hiragana': r'(?:だい)?(?:' + _HIRAGANA_NUMBERS + r')(?:しゅう|わ|か|ばん)\s*[.。]?\s*\n+',
+}
+
+# Header patterns that can occur in each language's text. "Episode" is kept
+# for every language because Stage 1 prefixes every source episode with it.
+_REMOVAL_PATTERNS_BY_LANGUAGE = {
+    'korean': ('episode', 'korean_episode', 'korean_hwa'),
+    'japanese': ('episode', 'kanji_wa', 'hiragana_dai', 'hiragana'),
+    'taiwanese': ('episode', 'kanji_wa', 'kanji_ji'),
+}
+
+
+def _compile_header_pattern(names) -> re.Pattern:
+    """Fuse header patterns into one alternation (tried in _REMOVAL_PATTERN_BODIES order)"""
+    return re.compile('|'.join(
+        f'(?:{body})' for name, body in _REMOVAL_PATTERN_BODIES.items() if name in names
+    ))
+
+
+# Headers only ever lead the content, so these are matched at the start
+# (no MULTILINE scan of the body); other languages try every pattern
+_COMBINED_HEADER_RE = _compile_header_pattern(_REMOVAL_PATTERN_BODIES)
+_HEADER_RE_BY_LANGUAGE = {
+    language: _compile_header_pattern(names)
+    for language, names in _REMOVAL_PATTERNS_BY_LANGUAGE.items()
+}
+
+# Characters each header pattern can start with (besides digits, for "1화").
+# Text starting with anything else cannot have a header, so the regex is not
+# even tried.
+_REMOVAL_PATTERN_FIRST_CHARS = {
+    'episode': 'Ee',
+    'korean_episode': '에',
+    'korean_hwa': '제',
+    'kanji_wa': '第',
+    'kanji_ji': '第',
+    'hiragana_dai': 'だ',
+    'hiragana': 'だ' + _HIRAGANA_NUMBER_CHARS,
+}
+_HEADER_FIRST_CHARS = frozenset(''.join(_REMOVAL_PATTERN_FIRST_CHARS.values()))
+_HEADER_FIRST_CHARS_BY_LANGUAGE = {
+    language: frozenset(''.join(_REMOVAL_PATTERN_FIRST_CHARS[name] for name in names))
+    for language, names in _REMOVAL_PATTERNS_BY_LANGUAGE.items()
+}
+
+# Whitespace skipped before and between headers
+_HEADER_WHITESPACE = frozenset('\n\r\t ')
+
 
 def extract_title_from_content(content: str, language: str) -> tuple:
     """
@@ -85,11 +190,11 @@ def extract_title_from_content(content: str, language: str) -> tuple:
     Returns:
         Tuple of (title, episode_number) or (None, None)
     """
-    patterns = EPISODE_PATTERNS.get(language, EPISODE_PATTERNS['korean'])
-    search_text = content[:500]
+    patterns = _EPISODE_PATTERNS_COMPILED.get(language, _EPISODE_PATTERNS_COMPILED['korean'])
 
+    # Only the first 500 characters are searched (endpos, no prefix copy)
     for pattern, num_group, title_group in patterns:
-        match = re.search(pattern, search_text, re.MULTILINE | re.IGNORECASE)
+        match = pattern.search(content, 0, 500)
         if match:
             episode_num = int(match.group(num_group))
             title = match.group(title_group).strip()
@@ -100,6 +205,22 @@ def extract_title_from_content(content: str, language: str) -> tuple:
     return None, None
 
 
+# Per-language header prefix template, text after the title, and episode number converter
+_EPISODE_HEADER_FORMATS = {
+    'korean': ("Episode {num}. ", ".\n\n", arabic_to_korean),
+    'japanese': ("第{num}話。", "。\n\n", str),
+    'taiwanese': ("第{num}集。", "。\n\n", arabic_to_chinese),
+}
+_DEFAULT_EPISODE_HEADER_FORMAT = ("Episode {num}. ", ".\n\n", str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _episode_header_parts(episode_number: int, language: str) -> tuple:
+    """Header text before and after the title, e.g. ("Episode 사. ", ".\n\n")"""
+    prefix, suffix, to_number = _EPISODE_HEADER_FORMATS.get(language, _DEFAULT_EPISODE_HEADER_FORMAT)
+    return prefix.format(num=to_number(episode_number)), suffix
+
+
 def format_episode_header(episode_number: int, title: str, language: str) -> str:
     """
     Create TTS-friendly episode header based on language.
@@ -109,16 +230,37 @@ def format_episode_header(episode_number: int, title: str, language: str) -> str
         japanese:  "第1話。제목。"
         taiwanese: "第一集。제목。"
     """
-    if language == 'korean':
-        korean_num = arabic_to_korean(episode_number)
-        return f"Episode {korean_num}. {title}.\n\n"
-    elif language == 'japanese':
-        return f"第{episode_number}話。{title}。\n\n"
-    elif language == 'taiwanese':
-        chinese_num = arabic_to_chinese(episode_number)
-        return f"第{chinese_num}集。{title}。\n\n"
-    else:
-        return f"Episode {episode_number}. {title}.\n\n"
+    prefix, suffix = _episode_header_parts(episode_number, language)
+    return f"{prefix}{title}{suffix}"
+
+
+def _skip_header_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos"""
+    end = len(text)
+    while pos < end and text[pos] in _HEADER_WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _strip_episode_headers(text: str, language: str) -> str:
+    """
+    Remove leading whitespace and episode headers from the start of text.
+    Only the start of the text is examined, never the rest of the body.
+
+    The scan advances an index and slices once at the end. The character at
+    the index is checked against the language's header first characters
+    before the header regex is tried, so header-less text (the common case
+    for LLM output) costs a single set lookup.
+    """
+    header_re = _HEADER_RE_BY_LANGUAGE.get(language, _COMBINED_HEADER_RE)
+    first_chars = _HEADER_FIRST_CHARS_BY_LANGUAGE.get(language, _HEADER_FIRST_CHARS)
+    pos = _skip_header_whitespace(text, 0)
+    while pos < len(text) and (text[pos] in first_chars or text[pos].isdigit()):
+        match = header_re.match(text, pos)
+        if not match:
+            break
+        pos = _skip_header_whitespace(text, match.end())
+    return text[pos:]
 
 
 def clean_header_for_tts(content: str, episode_number: int, title: str, language: str) -> str:
@@ -130,51 +272,9 @@ def clean_header_for_tts(content: str, episode_number: int, title: str, language
         Input:  "4화. 제목.\n\n에피소드 사화.\n\n본문..."
         Output: "Episode 사. 제목.\n\n본문..."
     """
-    cleaned = content
-
-    # Korean number words
-    korean_numbers = r'(?:일|이|삼|사|오|육|칠|팔|구|십|백|천|' + \
-                     r'하나|둘|셋|넷|다섯|여섯|일곱|여덟|아홉|열|' + \
-                     r'[일이삼사오육칠팔구십백천]+)'
-
-    # Japanese hiragana numbers (for LLM-converted headers like だいいっしゅう, だいよんしゅう)
-    # Includes all readings: いち(1), に(2), さん(3), し/よん(4), ご(5), ろく(6), しち/なな(7), はち(8), きゅう/く(9), じゅう(10)
-    hiragana_numbers = r'(?:いち|に|さん|し|よん|ご|ろく|しち|なな|はち|きゅう|く|じゅう|' + \
-                       r'ひゃく|せん|いっ|にっ|さっ|よっ|ごっ|ろっ|しっ|はっ|きゅっ|' + \
-                       r'[いちにさんしよんごろくしちななはちきゅうくじゅうひゃくせん]+)'
-
-    # Japanese number words
-    japanese_numbers = r'(?:一|二|三|四|五|六|七|八|九|十|百|千|[一二三四五六七八九十百千]+)'
-
-    # Remove ALL episode header patterns (may appear multiple times due to LLM formatting)
-    # Apply repeatedly until no more matches
-
-    patterns_to_remove = [
-        # "Episode 일." or "Episode 1." with optional title
-        r'^Episode\s+(?:\d+|' + korean_numbers + r')\s*[.。]?\s*(?:[^\n]+[.。])?\s*\n+',
-        # "에피소드 일." or "에피소드 1." with optional title
-        r'^에피소드\s*(?:\d+|' + korean_numbers + r')(?:화)?\s*[.。]?\s*(?:[^\n]+[.。])?\s*\n+',
-        # "1화." or "제1화." with optional title
-        r'^(?:제)?(?:\d+)화\s*[.。:]\s*(?:[^\n]+[.。])?\s*\n+',
-        # "第1話" or "第一話" with optional title (kanji)
-        r'^第(?:\d+|' + japanese_numbers + r')話\s*[.。]?\s*(?:[^\n]+[.。。])?\s*\n+',
-        # "第1集" with optional title (kanji)
-        r'^第(?:\d+|' + japanese_numbers + r')集\s*[.。]?\s*(?:[^\n]+[.。。])?\s*\n+',
-        # Hiragana episode headers (LLM-converted): "だいいっしゅう。" "だいにしゅう。" etc.
-        r'^だい' + hiragana_numbers + r'(?:しゅう|わ|か)\s*[.。]?\s*\n+',
-        # Generic hiragana chapter patterns
-        r'^(?:だい)?(?:' + hiragana_numbers + r')(?:しゅう|わ|か|ばん)\s*[.。]?\s*\n+',
-    ]
-
-    # Apply each pattern removal repeatedly
-    for pattern in patterns_to_remove:
-        prev_cleaned = None
-        while prev_cleaned != cleaned:
-            prev_cleaned = cleaned
-            cleaned = re.sub(pattern, '', cleaned, count=1, flags=re.IGNORECASE | re.MULTILINE)
-
-    # Remove leading whitespace
-    cleaned = cleaned.lstrip('\n\r\t ')
+    # Remove leading whitespace and ALL leading episode headers
+    # (may appear multiple times due to LLM formatting)
+    cleaned = _strip_episode_headers(content, language)
 
     # Add standardized header based on language
     tts_header = format_episode_header(episode_number, title, language)
@@ -183,10 +283,178 @@ def clean_header_for_tts(content: str, episode_number: int, title: str, language
     return cleaned
 
 
+def _is_formatted(output_file: Path) -> bool:
+    """Check whether an output episode already has formatting applied"""
+    if not output_file.exists():
+        return False
+    try:
+        # The flag is near the end of the file, so a tail scan usually
+        # answers without parsing the whole episode
+        if json_tail_contains(output_file, '"formatting_applied": true'):
+            return True
+        existing_data = load_json(output_file)
+        return bool(existing_data.get('metadata', {}).get('formatting_applied'))
+    except Exception:
+        return False
+
+
+def _format_episode_group(
+    episode_files: List[Path],
+    target_folder: Path,
+    series_folder: Path,
+    target_lang: str,
+    llm_processor: LLMProcessor
+) -> tuple:
+    """
+    Format a group of episodes, sending the short, not yet formatted ones in
+    one batched request and formatting the rest one by one.
+
+    Returns:
+        Tuple of (_format_episode results in group order, batch messages)
+    """
+    return process_episode_group(
+        episode_files,
+        lambda episode_file, batch_result: _format_episode(
+            episode_file, target_folder, series_folder, target_lang, llm_processor,
+            batch_result=batch_result
+        ),
+        lambda texts: llm_processor.format_episodes_batch(texts, language=target_lang),
+        is_done=lambda episode_file: _is_formatted(target_folder / episode_file.name),
+        label='formatting'
+    )
+
+
+def _format_episode(
+    episode_file: Path,
+    target_folder: Path,
+    series_folder: Path,
+    target_lang: str,
+    llm_processor: LLMProcessor,
+    batch_result: Optional[tuple] = None
+) -> tuple:
+    """
+    Format one episode for TTS and save it to target_folder.
+
+    Runs in a worker thread; progress messages are returned instead of
+    printed so the caller can write them from the main thread.
+
+    Args:
+        batch_result: (episode_data, formatted_text) if the episode was
+            already formatted in a batched request
+
+    Returns:
+        Tuple of (episode_name, status, error, messages) where status is
+        'processed', 'skipped' or 'failed'
+    """
+    messages = []
+    output_file = target_folder / episode_file.name
+
+    # Skip if already processed
+    if batch_result is None and _is_formatted(output_file):
+        messages.append(f"     ⏭️  Skipped {episode_file.name}")
+        return episode_file.name, 'skipped', None, messages
+
+    try:
+        # Load episode
+        if batch_result is not None:
+            episode_data, formatted_text = batch_result
+        else:
+            episode_data, formatted_text = load_json(episode_file), None
+
+        content = episode_data['content']
+        series_name = episode_data.get('metadata', {}).get('series_name', series_folder.name)
+        episode_number = episode_data.get('episode_number', 1)
+        current_title = episode_data.get('title')
+
+        # Format for TTS with retry logic (unless formatted in a batch)
+        max_retries = 3
+        retry_delay = 10
+
+        if formatted_text is None:
+            for attempt in range(max_retries):
+                try:
+                    format_result = llm_processor.execute({
+                        'text': content,
+                        'operation': 'format',
+                        'params': {'language': target_lang}
+                    })
+                    formatted_text = format_result['output']
+                    break
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        messages.append(f"     ⚠️  Retry {attempt + 1}/{max_retries} ({episode_file.name}): {e}")
+                        time.sleep(retry_delay)
+                    else:
+                        raise
+
+        if formatted_text is None:
+            raise Exception("Formatting failed after retries")
+
+        # Handle title
+        final_title = None
+        title_source = None
+
+        if current_title:
+            final_title = current_title
+            title_source = 'existing'
+        else:
+            # Try to extract title
+            extracted_title, _ = extract_title_from_content(content, target_lang)
+            if extracted_title:
+                final_title = extracted_title
+                title_source = 'extracted'
+            else:
+                # Generate title using LLM
+                for attempt in range(max_retries):
+                    try:
+                        title_result = llm_processor.execute({
+                            'text': formatted_text,
+                            'operation': 'generate_title',
+                            'params': {
+                                'series_name': series_name,
+                                'episode_number': episode_number,
+                                'language': target_lang
+                            }
+                        })
+                        final_title = title_result['output']
+                        title_source = 'generated'
+                        break
+                    except Exception:
+                        if attempt == max_retries - 1:
+                            # Default title by language
+                            final_title = DEFAULT_TITLE_FORMATS.get(
+                                target_lang, DEFAULT_TITLE_FORMAT
+                            ).format(n=episode_number)
+                            title_source = 'default'
+
+        # Clean header for TTS-friendly format
+        if final_title:
+            formatted_text = clean_header_for_tts(
+                formatted_text, episode_number, final_title, target_lang
+            )
+
+        # Save formatted episode
+        episode_data['content'] = formatted_text
+        episode_data['title'] = final_title
+        episode_data['metadata']['formatting_applied'] = True
+        episode_data['metadata']['formatting_language'] = target_lang
+        episode_data['metadata']['title'] = final_title
+        episode_data['metadata']['title_source'] = title_source
+
+        save_json(episode_data, output_file)
+
+    except Exception as e:
+        return episode_file.name, 'failed', str(e), messages
+
+    return episode_file.name, 'processed', None, messages
+
+
 def run_stage_3(
     series_folder: Path,
     target_languages: Optional[List[str]] = None,
-    max_episodes: int = None
+    max_episodes: int = None,
+    max_workers: int = DEFAULT_FORMAT_WORKERS,
+    batch_size: int = DEFAULT_FORMAT_BATCH_SIZE
 ):
     """
     Run Stage 3: TTS Formatting for each target language
@@ -195,6 +463,8 @@ def run_stage_3(
         series_folder: Path to series folder
         target_languages: List of target languages (default: all 3)
         max_episodes: Maximum number of episodes to process (None = all)
+        max_workers: Number of episodes formatted in parallel (default: 8)
+        batch_size: Number of short episodes formatted per LLM request (default: 3)
     """
     if target_languages is None:
         target_languages = TARGET_LANGUAGES
@@ -237,7 +507,7 @@ def run_stage_3(
         target_folder.mkdir(parents=True, exist_ok=True)
 
         # Get all episode files
-        episodes = sorted(source_folder.glob('episode_*.json'))
+        episodes = list_episode_files(source_folder)
 
         if not episodes:
             print(f"  ⚠️  No episode files found in {source_folder}")
@@ -256,123 +526,37 @@ def run_stage_3(
         skipped_episodes = []
         processed_count = 0
 
-        with tqdm(total=len(episodes), desc="  Formatting", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar:
-            for episode_file in episodes:
-                output_file = target_folder / episode_file.name
-
-                # Skip if already processed
-                if output_file.exists():
-                    try:
-                        with open(output_file, 'r', encoding='utf-8') as f:
-                            existing_data = json.load(f)
-                            if existing_data.get('metadata', {}).get('formatting_applied'):
-                                pbar.write(f"     ⏭️  Skipped {episode_file.name}")
-                                skipped_episodes.append(episode_file.name)
-                                pbar.update(1)
-                                continue
-                    except Exception:
-                        pass
-
-                try:
-                    # Load episode
-                    with open(episode_file, 'r', encoding='utf-8') as f:
-                        episode_data = json.load(f)
-
-                    content = episode_data['content']
-                    series_name = episode_data.get('metadata', {}).get('series_name', series_folder.name)
-                    episode_number = episode_data.get('episode_number', 1)
-                    current_title = episode_data.get('title')
-
-                    # Format for TTS with retry logic
-                    max_retries = 3
-                    retry_delay = 10
-                    formatted_text = None
-
-                    for attempt in range(max_retries):
-                        try:
-                            format_result = llm_processor.execute({
-                                'text': content,
-                                'operation': 'format',
-                                'params': {'language': target_lang}
-                            })
-                            formatted_text = format_result['output']
-                            break
-                        except Exception as e:
-                            if attempt < max_retries - 1:
-                                pbar.write(f"     ⚠️  Retry {attempt + 1}/{max_retries}: {e}")
-                                time.sleep(retry_delay)
-                            else:
-                                raise
-
-                    if formatted_text is None:
-                        raise Exception("Formatting failed after retries")
-
-                    # Handle title
-                    final_title = None
-                    title_source = None
-
-                    if current_title:
-                        final_title = current_title
-                        title_source = 'existing'
+        # Episode groups are independent, so format them concurrently; short
+        # episodes within a group share one LLM request
+        groups = group_episodes(episodes, batch_size)
+
+        with tqdm(total=len(episodes), desc="  Formatting", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar, \
+                ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    _format_episode_group, group, target_folder, series_folder,
+                    target_lang, llm_processor
+                )
+                for group in groups
+            ]
+
+            for future in as_completed(futures):
+                results, batch_messages = future.result()
+                for message in batch_messages:
+                    pbar.write(message)
+
+                for name, status, error, messages in results:
+                    for message in messages:
+                        pbar.write(message)
+
+                    if status == 'skipped':
+                        skipped_episodes.append(name)
+                    elif status == 'failed':
+                        pbar.write(f"     ❌ Failed {name}: {error}")
+                        failed_episodes.append((name, error))
                     else:
-                        # Try to extract title
-                        extracted_title, _ = extract_title_from_content(content, target_lang)
-                        if extracted_title:
-                            final_title = extracted_title
-                            title_source = 'extracted'
-                        else:
-                            # Generate title using LLM
-                            for attempt in range(max_retries):
-                                try:
-                                    title_result = llm_processor.execute({
-                                        'text': formatted_text,
-                                        'operation': 'generate_title',
-                                        'params': {
-                                            'series_name': series_name,
-                                            'episode_number': episode_number,
-                                            'language': target_lang
-                                        }
-                                    })
-                                    final_title = title_result['output']
-                                    title_source = 'generated'
-                                    break
-                                except Exception:
-                                    if attempt == max_retries - 1:
-                                        # Default title by language
-                                        if target_lang == 'korean':
-                                            final_title = f"에피소드 {episode_number}"
-                                        elif target_lang == 'japanese':
-                                            final_title = f"エピソード {episode_number}"
-                                        elif target_lang == 'taiwanese':
-                                            final_title = f"第{episode_number}集"
-                                        else:
-                                            final_title = f"Episode {episode_number}"
-                                        title_source = 'default'
-
-                    # Clean header for TTS-friendly format
-                    if final_title:
-                        formatted_text = clean_header_for_tts(
-                            formatted_text, episode_number, final_title, target_lang
-                        )
-
-                    # Save formatted episode
-                    episode_data['content'] = formatted_text
-                    episode_data['title'] = final_title
-                    episode_data['metadata']['formatting_applied'] = True
-                    episode_data['metadata']['formatting_language'] = target_lang
-                    episode_data['metadata']['title'] = final_title
-                    episode_data['metadata']['title_source'] = title_source
-
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(episode_data, f, ensure_ascii=False, indent=2)
-
-                    processed_count += 1
-                    pbar.set_postfix_str(f"{episode_file.name}")
-                    pbar.update(1)
-
-                except Exception as e:
-                    pbar.write(f"     ❌ Failed {episode_file.name}: {e}")
-                    failed_episodes.append((episode_file.name, str(e)))
+                        processed_count += 1
+                        pbar.set_postfix_str(name)
                     pbar.update(1)
 
         # Summary for this language
@@ -437,6 +621,18 @@ This stage:
         default=None,
         help='Maximum number of episodes to process'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_FORMAT_WORKERS,
+        help=f'Number of episodes formatted in parallel (default: {DEFAULT_FORMAT_WORKERS})'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_FORMAT_BATCH_SIZE,
+        help=f'Short episodes formatted per LLM request, 1 disables batching (default: {DEFAULT_FORMAT_BATCH_SIZE})'
+    )
 
     args = parser.parse_args()
     series_folder = Path(args.series_folder)
@@ -445,5 +641,11 @@ This stage:
         print(f"❌ Series folder not found: {series_folder}")
         sys.exit(1)
 
-    success = run_stage_3(series_folder, target_languages=args.langs, max_episodes=args.max_episodes)
+    success = run_stage_3(
+        series_folder,
+        target_languages=args.langs,
+        max_episodes=args.max_episodes,
+        max_workers=args.workers,
+        batch_size=args.batch_size
+    )
     sys.exit(0 if success else 1)
@@ -8,13 +8,21 @@ Add speaker tags to formatted text using character dictionary.
 2. Apply speaker tags per language using glossary for name mapping
 """
 
+import re
 import sys
 import json
 import time
+import functools
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Dict
 from tqdm import tqdm
 from processors.llm_processor import LLMProcessor
+from processors.json_io import load_json, save_json, json_tail_contains
+from processors.episode_utils import group_episodes, process_episode_group
+from processors.response_cache import cached_call, cached_execute
+from processors.backoff import backoff_delay, AdaptiveConcurrencyLimiter
 
 # Target languages
 TARGET_LANGUAGES = ['korean', 'japanese', 'taiwanese']
@@ -26,10 +34,82 @@ LANGUAGE_DISPLAY = {
     'taiwanese': '🇹🇼 Taiwanese'
 }
 
+# Threads used to read episode files for character extraction
+EPISODE_LOAD_WORKERS = 16
+
+# Concurrent per-name LLM requests when batch speaker translation fails
+SPEAKER_TRANSLATION_WORKERS = 8
+
+# Episodes speaker-tagged concurrently (each is one network-bound LLM request)
+DEFAULT_TAG_WORKERS = 8
+
+# Default number of short episodes speaker-tagged per LLM request
+DEFAULT_TAG_BATCH_SIZE = 3
+
+# Speaker tag patterns, compiled once at import (they run on every line of
+# every episode)
+
+# Bracketed speaker line: [SPEAKER(ROLE, GENDER)]: content
+_BRACKET_SPEAKER_LINE_RE = re.compile(
+    r'^\[([A-Z가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+(?:\([^)]+\))?)\]\s*:\s*(.*)$'
+)
+# Legacy speaker line without brackets: SPEAKER(ROLE, GENDER): content
+_LEGACY_SPEAKER_LINE_RE = re.compile(
+    r'^([A-Z가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+(?:\([^)]+\))?)\s*:\s*(.*)$'
+)
+# Any bracketed speaker tag preceded by a non-newline, non-bracket character
+_INLINE_SPEAKER_TAG_RE = re.compile(r'([^\n\[])(\[[^\]]+\]:)')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+# Speaker tag with a Korean (possibly mixed Korean/Chinese) name: [NAME(ROLE, GENDER)]:
+_KOREAN_SPEAKER_TAG_RE = re.compile(r'\[([가-힣][가-힣\u4e00-\u9fff\s\(\)（）]*)\(([A-Z_]+),\s*([A-Z]+)\)\]:')
+# Hangul syllables and CJK ideographs, to pick apart mixed Korean/Chinese names
+_HANGUL_RE = re.compile(r'[\uac00-\ud7af]')
+_NON_HANGUL_RE = re.compile(r'[^\uac00-\ud7af]+')
+_NON_HAN_RE = re.compile(r'[^\u4e00-\u9fff]+')
+_HAN_RUN_RE = re.compile(r'[\u4e00-\u9fff]+')
+# Compound name with a gender indicator, e.g. "침입자 (남자)"
+_COMPOUND_NAME_RE = re.compile(r'^(.+?)\s*[\(（](.+?)[\)）]$')
+# Any speaker tag: [NAME(ROLE, GENDER)]: or [NARRATOR]:
+_SPEAKER_TAG_RE = re.compile(r'\[([^\]]+)\]:')
+# Speaker tag at the start of a line, followed by its content
+_SPEAKER_TAG_CONTENT_RE = re.compile(r'(\[[^\]]+\]:)\s*(.+)')
+# Opening and closing quote characters of dialogue per language
+_QUOTE_CHARS = {
+    'japanese': ('「', '」'),
+    'taiwanese': ('「', '」'),
+    'korean': ('"', '"'),
+}
+_DEFAULT_QUOTE_CHARS = _QUOTE_CHARS['korean']
+# Emotion tags like [calm] and punctuation, ignored when checking for narration
+_BRACKET_TAG_RE = re.compile(r'\[[^\]]+\]')
+_NARRATION_PUNCTUATION_RE = re.compile(r'[。、！？…\s]')
+# Speaker name (without role/gender) of a bracketed (group 1) or legacy
+# (group 2) tag at the start of any line of a text
+_SPEAKER_NAME_LINE_RE = re.compile(
+    r'^\s*(?:\[([가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+)(?:\([^)\n]+\))?\]'
+    r'|([가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+)(?:\([^)\n]+\))?):',
+    re.MULTILINE
+)
+
+
+# Loaded glossaries: {glossary_path: ((mtime_ns, size), glossary)}
+_glossary_cache: Dict[Path, tuple] = {}
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, used to detect changes since it was cached"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 
 def load_glossary(series_folder: Path, language: str) -> Dict:
     """
     Load glossary for a specific language.
+    The parsed glossary is reused until the file changes on disk (e.g. after
+    update_glossary_with_speakers), so callers must not modify it.
 
     Args:
         series_folder: Path to series folder
@@ -49,14 +129,70 @@ def load_glossary(series_folder: Path, language: str) -> Dict:
 
     glossary_path = series_folder / glossary_file
     if glossary_path.exists():
+        signature = _file_signature(glossary_path)
+        cached = _glossary_cache.get(glossary_path)
+        if cached and signature is not None and cached[0] == signature:
+            return cached[1]
         try:
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            glossary = load_json(glossary_path)
+            _glossary_cache[glossary_path] = (signature, glossary)
+            return glossary
         except Exception as e:
             print(f"  ⚠️  Failed to load glossary: {e}")
     return {'terms': []}
 
 
+@functools.lru_cache(maxsize=16)
+def _build_name_map(terms: tuple) -> Dict[str, str]:
+    """
+    Build the speaker name lookup for a glossary, including no-space variants.
+
+    Args:
+        terms: Tuple of (original, translation) pairs from the glossary
+
+    Returns:
+        Dict mapping Korean names to translations
+    """
+    name_map = {}
+    for original, translation in terms:
+        if original and translation:
+            name_map[original] = translation
+            # Also add normalized version (no spaces)
+            normalized = original.replace(' ', '')
+            if normalized != original:
+                name_map[normalized] = translation
+    return name_map
+
+
+# Longest Chinese fragment indexed by _build_chinese_index (name fragments
+# are a few characters; longer ones fall back to a scan)
+MAX_INDEXED_CHINESE_LENGTH = 8
+
+
+@functools.lru_cache(maxsize=16)
+def _build_chinese_index(terms: tuple) -> Dict[str, str]:
+    """
+    Invert a glossary's name map into {chinese_fragment: translation}.
+
+    Every run of CJK ideographs in each translation is indexed by all its
+    substrings (up to MAX_INDEXED_CHINESE_LENGTH characters), keeping the
+    first translation in name map order for each fragment.
+
+    Args:
+        terms: Tuple of (original, translation) pairs from the glossary
+
+    Returns:
+        Dict mapping Chinese fragments to the first translation containing them
+    """
+    index = {}
+    for translation in _build_name_map(terms).values():
+        for run in _HAN_RUN_RE.findall(translation):
+            for start in range(len(run)):
+                for end in range(start + 1, min(len(run), start + MAX_INDEXED_CHINESE_LENGTH) + 1):
+                    index.setdefault(run[start:end], translation)
+    return index
+
+
 def map_character_names(characters: List[Dict], glossary: Dict, language: str) -> List[Dict]:
     """
     Map character names to target language using glossary.
@@ -67,13 +203,11 @@ def map_character_names(characters: List[Dict], glossary: Dict, language: str) -
         language: Target language
 
     Returns:
-        Characters with translated names added
+        New character dicts with translated names added (input is not modified)
     """
     if language == 'korean':
         # Korean is source language, no mapping needed
-        for char in characters:
-            char['name_display'] = char['name']
-        return characters
+        return [{**char, 'name_display': char['name']} for char in characters]
 
     # Build lookup from glossary
     name_map = {}
@@ -83,25 +217,23 @@ def map_character_names(characters: List[Dict], glossary: Dict, language: str) -
         if original and translation:
             name_map[original] = translation
 
-    # Map character names
-    for char in characters:
-        korean_name = char.get('name', '')
-        if korean_name in name_map:
-            char['name_display'] = name_map[korean_name]
-        else:
-            # Keep original name if no translation found
-            char['name_display'] = korean_name
-
-        # Also map aliases
-        mapped_aliases = []
-        for alias in char.get('aliases', []):
-            if alias in name_map:
-                mapped_aliases.append(name_map[alias])
-            else:
-                mapped_aliases.append(alias)
-        char['aliases_display'] = mapped_aliases
-
-    return characters
+    if not name_map:
+        # Nothing to translate (no glossary yet): display the original names
+        return [
+            {**char, 'name_display': char.get('name', ''), 'aliases_display': list(char.get('aliases', []))}
+            for char in characters
+        ]
+
+    # Map character names (keeping the original name if no translation is
+    # found), and also map aliases
+    return [
+        {
+            **char,
+            'name_display': name_map.get(char.get('name', ''), char.get('name', '')),
+            'aliases_display': [name_map.get(alias, alias) for alias in char.get('aliases', [])],
+        }
+        for char in characters
+    ]
 
 
 def parse_speaker_line(line: str) -> tuple:
@@ -114,8 +246,6 @@ def parse_speaker_line(line: str) -> tuple:
     Returns:
         Tuple of (speaker_prefix, content) or (None, line) if no speaker
     """
-    import re
-
     # Pattern: [SPEAKER_NAME(ROLE, GENDER)]: or [SPEAKER_NAME]: or [NARRATOR]:
     # Also supports legacy format without brackets
     # Examples:
@@ -123,16 +253,24 @@ def parse_speaker_line(line: str) -> tuple:
     #   [NARRATOR]: 서술문
     #   [UNKNOWN(UNKNOWN)]: 대사
 
-    # New bracketed format: [SPEAKER(ROLE, GENDER)]:
-    bracket_pattern = r'^\[([A-Z가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+(?:\([^)]+\))?)\]\s*:\s*(.*)$'
-    match = re.match(bracket_pattern, line.strip())
+    stripped = line.strip()
 
-    if match:
-        return f"[{match.group(1)}]", match.group(2)
+    # Both formats need a ':' after the name; continuation and plain lines
+    # usually have none, so a substring check settles them without a regex
+    if ':' not in stripped:
+        return None, line
+
+    # New bracketed format: [SPEAKER(ROLE, GENDER)]:
+    # (the CJK class regexes only run when the first character allows a match;
+    # a legacy name never starts with '[')
+    if stripped.startswith('['):
+        match = _BRACKET_SPEAKER_LINE_RE.match(stripped)
+        if match:
+            return f"[{match.group(1)}]", match.group(2)
+        return None, line
 
     # Legacy format without brackets: SPEAKER(ROLE, GENDER):
-    legacy_pattern = r'^([A-Z가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+(?:\([^)]+\))?)\s*:\s*(.*)$'
-    match = re.match(legacy_pattern, line.strip())
+    match = _LEGACY_SPEAKER_LINE_RE.match(stripped)
 
     if match:
         return match.group(1), match.group(2)
@@ -150,18 +288,15 @@ def insert_linebreaks_before_speaker_tags(tagged_text: str) -> str:
     Returns:
         Text with line breaks inserted before each speaker tag
     """
-    import re
-
-    # Simple and flexible pattern for bracketed speaker tags
     # Matches: [anything]: when preceded by non-newline, non-bracket character
     # Examples: [NARRATOR]:, [민수(PROTAGONIST, MAN)]:, [남자 침입자(MINOR, MAN)]:
-    bracket_pattern = r'([^\n\[])(\[[^\]]+\]:)'
-
     # Insert double newline before each speaker tag (except at start)
-    result = re.sub(bracket_pattern, r'\1\n\n\2', tagged_text)
+    result = _INLINE_SPEAKER_TAG_RE.sub(r'\1\n\n\2', tagged_text)
 
-    # Clean up: remove multiple consecutive newlines (more than 2)
-    result = re.sub(r'\n{3,}', '\n\n', result)
+    # Clean up: remove multiple consecutive newlines (more than 2); the
+    # substring check skips the regex pass in the usual case of no such runs
+    if '\n\n\n' in result:
+        result = _EXCESS_NEWLINES_RE.sub('\n\n', result)
 
     # Clean up: remove leading newlines
     result = result.lstrip('\n')
@@ -186,31 +321,28 @@ def translate_speaker_tags_in_output(
     Returns:
         Text with Korean speaker names translated
     """
-    import re
-
     if target_language == 'korean':
         return tagged_text  # No translation needed
 
-    # Build name map from glossary (including normalized versions)
-    name_map = {}
-    for term in glossary.get('terms', []):
-        original = term.get('original', '')
-        translation = term.get('translation', '')
-        if original and translation:
-            name_map[original] = translation
-            # Also add normalized version (no spaces)
-            normalized = original.replace(' ', '')
-            if normalized != original:
-                name_map[normalized] = translation
+    # Every tag the name pattern matches ends in ")]:"; without one there is
+    # nothing to translate and the CJK class regex need not scan the text
+    if ')]:' not in tagged_text:
+        return tagged_text
+
+    # Name map from glossary (including normalized versions), built once per
+    # glossary content rather than once per episode
+    terms = tuple(
+        (term.get('original', ''), term.get('translation', ''))
+        for term in glossary.get('terms', [])
+    )
+    name_map = _build_name_map(terms)
 
     if not name_map:
         return tagged_text
 
-    # Pattern to find speaker tags with Korean names: [NAME(ROLE, GENDER)]:
-    # Korean characters: 가-힣, also handle spaces, parentheses, and mixed CJK chars
+    # Speaker tags with Korean names (_KOREAN_SPEAKER_TAG_RE) start with Korean
+    # and may contain Korean/Chinese/spaces/parentheses
     # Examples: [서연], [침입자 (남자)], [서 박사], [침入者 (남자)] (mixed Korean+Chinese)
-    # Pattern matches: starts with Korean, may contain Korean/Chinese/spaces/parentheses
-    pattern = r'\[([가-힣][가-힣\u4e00-\u9fff\s\(\)（）]*)\(([A-Z_]+),\s*([A-Z]+)\)\]:'
 
     # Gender suffix mapping for target languages
     gender_suffix_map = {
@@ -221,36 +353,26 @@ def translate_speaker_tags_in_output(
 
     def extract_korean_base(name: str) -> str:
         """Extract Korean characters from a potentially mixed string."""
-        korean_chars = ''.join(c for c in name if '\uac00' <= c <= '\ud7af')
-        return korean_chars
+        return _NON_HANGUL_RE.sub('', name)
 
-    def find_partial_translation(mixed_name: str, name_map: dict) -> str:
+    def find_partial_translation(mixed_name: str) -> str:
         """
         Find translation for a partially-translated mixed string.
         e.g., "침入者" (Korean 침 + Chinese 入者) -> should match "침입자" -> "侵入者"
         """
-        # Check if mixed_name contains both Korean and Chinese characters
-        has_korean = any('\uac00' <= c <= '\ud7af' for c in mixed_name)
-        has_chinese = any('\u4e00' <= c <= '\u9fff' for c in mixed_name)
+        # Only names containing both Korean and Chinese characters qualify
+        chinese_part = _NON_HAN_RE.sub('', mixed_name)
 
-        if not (has_korean and has_chinese):
+        if not chinese_part or not _HANGUL_RE.search(mixed_name):
             return None
 
-        # Try to find a glossary entry where the translation contains the Chinese part
-        chinese_part = ''.join(c for c in mixed_name if '\u4e00' <= c <= '\u9fff')
-
-        for original, translation in name_map.items():
-            # Check if the translation contains the Chinese part from mixed_name
-            if chinese_part and chinese_part in translation:
-                return translation
-
-        return None
-
-    def replace_korean_name(match):
-        full_name = match.group(1).strip()
-        role = match.group(2)
-        gender = match.group(3)
+        # First translation (in name map order) containing the Chinese part
+        if len(chinese_part) <= MAX_INDEXED_CHINESE_LENGTH:
+            return _build_chinese_index(terms).get(chinese_part)
+        return next((t for t in name_map.values() if chinese_part in t), None)
 
+    def translate_name(full_name: str) -> str:
+        """Translate the name part of a speaker tag (kept as-is if no match)"""
         # Try exact match first
         if full_name in name_map:
             translated = name_map[full_name]
@@ -260,7 +382,7 @@ def translate_speaker_tags_in_output(
         else:
             # Check for compound names like "침입자 (남자)" or "침入者 (남자)"
             # Extract base name and gender indicator
-            compound_match = re.match(r'^(.+?)\s*[\(（](.+?)[\)）]$', full_name)
+            compound_match = _COMPOUND_NAME_RE.match(full_name)
             if compound_match:
                 base_name = compound_match.group(1).strip()
                 gender_indicator = compound_match.group(2).strip()
@@ -272,7 +394,7 @@ def translate_speaker_tags_in_output(
                     translated_base = name_map[base_name.replace(' ', '')]
                 else:
                     # Try finding partial translation for mixed strings (e.g., "침入者" -> "侵入者")
-                    partial_trans = find_partial_translation(base_name, name_map)
+                    partial_trans = find_partial_translation(base_name)
                     if partial_trans:
                         translated_base = partial_trans
                     else:
@@ -298,9 +420,20 @@ def translate_speaker_tags_in_output(
                 else:
                     translated = full_name  # Keep original if no match
 
-        return f'[{translated}({role}, {gender})]:'
+        return translated
+
+    # The same few speakers are tagged throughout an episode, so each distinct
+    # name goes through the lookup chain above only once
+    translated_names = {}
+
+    def replace_korean_name(match):
+        full_name = match.group(1).strip()
+        translated = translated_names.get(full_name)
+        if translated is None:
+            translated = translated_names[full_name] = translate_name(full_name)
+        return f'[{translated}({match.group(2)}, {match.group(3)})]:'
 
-    return re.sub(pattern, replace_korean_name, tagged_text)
+    return _KOREAN_SPEAKER_TAG_RE.sub(replace_korean_name, tagged_text)
 
 
 def split_multiple_speakers_in_line(tagged_text: str) -> str:
@@ -314,20 +447,29 @@ def split_multiple_speakers_in_line(tagged_text: str) -> str:
     Returns:
         Text with each speaker on a separate line
     """
-    import re
+    # Every speaker tag ends in "]:", so with fewer than two of them no line
+    # can hold two tags
+    if tagged_text.count(']:') < 2:
+        return tagged_text
+
+    return '\n'.join(_split_speaker_lines(tagged_text.split('\n')))
 
-    # Pattern to match speaker tags: [NAME(ROLE, GENDER)]: or [NARRATOR]:
-    speaker_pattern = r'\[([^\]]+)\]:'
 
+def _split_speaker_lines(lines: List[str]) -> List[str]:
+    """
+    Line-list form of split_multiple_speakers_in_line: split every line that
+    holds more than one speaker tag. Returned lines contain no newlines.
+    """
     result_lines = []
-    for line in tagged_text.split('\n'):
+    for line in lines:
         stripped = line.strip()
-        if not stripped:
+        # Lines are prefiltered with str.count before the regex is run
+        if not stripped or stripped.count(']:') < 2:
             result_lines.append(line)
             continue
 
         # Find all speaker tags in the line
-        matches = list(re.finditer(speaker_pattern, stripped))
+        matches = list(_SPEAKER_TAG_RE.finditer(stripped))
 
         if len(matches) <= 1:
             # Only one or no speaker tag, keep as is
@@ -351,7 +493,7 @@ def split_multiple_speakers_in_line(tagged_text: str) -> str:
                     if i < len(matches) - 1:
                         result_lines.append('')
 
-    return '\n'.join(result_lines)
+    return result_lines
 
 
 def separate_dialogue_and_narration(tagged_text: str, language: str) -> str:
@@ -366,44 +508,68 @@ def separate_dialogue_and_narration(tagged_text: str, language: str) -> str:
     Returns:
         Text with dialogue and narration properly separated
     """
-    import re
+    return '\n'.join(_separate_dialogue_lines(tagged_text.split('\n'), language))
 
-    # Quote patterns per language
-    quote_patterns = {
-        'japanese': r'「[^」]+」',
-        'taiwanese': r'「[^」]+」',
-        'korean': r'"[^"]+"'
-    }
 
-    quote_pattern = quote_patterns.get(language, r'"[^"]+"')
+def _scan_last_quote(content: str, open_quote: str, close_quote: str) -> Optional[tuple]:
+    """
+    Find the last non-empty quotation in content, scanning left to right with
+    str.find (same matches as re.findall with r'「[^」]+」' / r'"[^"]+"').
+
+    Returns:
+        (start, end) slice of the last quotation including its quote
+        characters, or None if there is none
+    """
+    last = None
+    pos = content.find(open_quote)
+    while pos >= 0:
+        end = content.find(close_quote, pos + 1)
+        if end < 0:
+            break
+        if end == pos + 1:
+            # Empty quotes do not count; retry from the next character
+            pos = content.find(open_quote, pos + 1)
+            continue
+        last = (pos, end + 1)
+        pos = content.find(open_quote, end + 1)
+    return last
+
+
+def _separate_dialogue_lines(lines: List[str], language: str) -> List[str]:
+    """
+    Line-list form of separate_dialogue_and_narration. Returned lines
+    contain no newlines unless the input lines did.
+    """
+    open_quote, close_quote = _QUOTE_CHARS.get(language, _DEFAULT_QUOTE_CHARS)
 
     result_lines = []
-    for line in tagged_text.split('\n'):
+    for line in lines:
         stripped = line.strip()
         if not stripped:
             result_lines.append(line)
             continue
 
         # Check if line has speaker tag (not NARRATOR)
-        speaker_match = re.match(r'(\[[^\]]+\]:)\s*(.+)', stripped)
+        speaker_match = _SPEAKER_TAG_CONTENT_RE.match(stripped)
         if speaker_match and '[NARRATOR]' not in speaker_match.group(1):
             speaker_tag = speaker_match.group(1)
             content = speaker_match.group(2)
 
-            # Find all quoted dialogue
-            dialogues = re.findall(quote_pattern, content)
+            # Find the last quoted dialogue
+            last_quote = _scan_last_quote(content, open_quote, close_quote)
 
-            if dialogues:
-                # Extract text after last dialogue
-                last_dialogue = dialogues[-1]
-                last_idx = content.rfind(last_dialogue)
+            if last_quote:
+                # Extract text after last dialogue (rfind from the quotation
+                # itself: the same text may recur right after it, e.g. '"a"a"')
+                last_dialogue = content[last_quote[0]:last_quote[1]]
+                last_idx = content.rfind(last_dialogue, last_quote[0])
                 after_dialogue = content[last_idx + len(last_dialogue):].strip()
 
                 # Check if there's substantial narration after dialogue
                 # Remove emotion tags like [calm], [dramatic] for checking
-                narration_check = re.sub(r'\[[^\]]+\]', '', after_dialogue).strip()
+                narration_check = _BRACKET_TAG_RE.sub('', after_dialogue).strip()
                 # Remove punctuation for checking
-                narration_check = re.sub(r'[。、！？…\s]', '', narration_check)
+                narration_check = _NARRATION_PUNCTUATION_RE.sub('', narration_check)
 
                 if len(narration_check) > 2:  # Has actual narration text
                     # Keep dialogue with speaker (include everything up to and including last dialogue)
@@ -415,7 +581,7 @@ def separate_dialogue_and_narration(tagged_text: str, language: str) -> str:
 
         result_lines.append(line)
 
-    return '\n'.join(result_lines)
+    return result_lines
 
 
 def consolidate_consecutive_speakers(tagged_text: str) -> str:
@@ -487,6 +653,39 @@ def consolidate_consecutive_speakers(tagged_text: str) -> str:
     return '\n'.join(result)
 
 
+def post_process_tagged_text(tagged_text: str, glossary: Dict, target_lang: str) -> str:
+    """
+    Run the post-processing passes on raw speaker-tagging LLM output.
+
+    Pure text work with no I/O, so it can run in whichever worker thread
+    received the LLM response while other episodes are still waiting on
+    theirs.
+
+    Args:
+        tagged_text: Speaker-tagged text as returned by the LLM
+        glossary: Glossary data for the target language
+        target_lang: Target language
+
+    Returns:
+        Post-processed tagged text
+    """
+    # Post-process 1: Translate Korean speaker names to target language
+    tagged_text = translate_speaker_tags_in_output(
+        tagged_text, glossary, target_lang
+    )
+
+    # Post-process 2: Split lines with multiple speakers
+    # (steps 2 and 3 share one list of lines instead of
+    # joining and re-splitting the text in between)
+    lines = _split_speaker_lines(tagged_text.split('\n'))
+
+    # Post-process 3: Separate mixed dialogue/narration
+    lines = _separate_dialogue_lines(lines, target_lang)
+
+    # Post-process 4: Consolidate consecutive same-speaker lines
+    return consolidate_consecutive_speakers('\n'.join(lines))
+
+
 def extract_new_speakers_from_tagged(tagged_text: str, existing_names: set) -> List[str]:
     """
     Extract speaker names that appear as UNKNOWN or are not in existing glossary.
@@ -498,31 +697,41 @@ def extract_new_speakers_from_tagged(tagged_text: str, existing_names: set) -> L
     Returns:
         List of new speaker names to add to glossary
     """
-    import re
-
     new_speakers = set()
 
     # Find all speaker tags - supports both bracketed and legacy formats
     # Bracketed: [민수(PROTAGONIST, MAN)]: or [NARRATOR]:
     # Legacy: 민수(PROTAGONIST, MAN): or NARRATOR:
-    bracket_pattern = r'^\[([가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+)(?:\([^)]+\))?\]:'
-    legacy_pattern = r'^([가-힣\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]+)(?:\([^)]+\))?:'
+    # One MULTILINE scan of the whole text, without splitting it into lines
+    for match in _SPEAKER_NAME_LINE_RE.finditer(tagged_text):
+        speaker_name = match.group(1) or match.group(2)
+        # Check if it's not NARRATOR or already known
+        if speaker_name != 'NARRATOR' and speaker_name not in existing_names:
+            new_speakers.add(speaker_name)
 
-    for line in tagged_text.split('\n'):
-        stripped = line.strip()
-        # Try bracketed format first
-        match = re.match(bracket_pattern, stripped)
-        if not match:
-            # Try legacy format
-            match = re.match(legacy_pattern, stripped)
+    return list(new_speakers)
 
-        if match:
-            speaker_name = match.group(1)
-            # Check if it's not NARRATOR or already known
-            if speaker_name != 'NARRATOR' and speaker_name not in existing_names:
-                new_speakers.add(speaker_name)
 
-    return list(new_speakers)
+def _translate_speaker(speaker: str, target_language: str, llm_processor) -> tuple:
+    """
+    Translate one speaker name with its own LLM request.
+
+    Returns:
+        Tuple of (translated name or None, error or None)
+    """
+    try:
+        # Use LLM to translate the name
+        result = llm_processor.execute({
+            'text': speaker,
+            'operation': 'translate_term',
+            'params': {
+                'source_language': 'korean',
+                'target_language': target_language
+            }
+        })
+        return result.get('output', speaker).strip(), None
+    except Exception as e:
+        return None, e
 
 
 def update_glossary_with_speakers(
@@ -550,8 +759,7 @@ def update_glossary_with_speakers(
     glossary_data = {'terms': []}
     if glossary_path.exists():
         try:
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                glossary_data = json.load(f)
+            glossary_data = load_json(glossary_path)
         except Exception as e:
             print(f"  ⚠️  Could not load glossary: {e}")
 
@@ -563,21 +771,31 @@ def update_glossary_with_speakers(
 
     added_count = 0
 
-    # Translate each speaker name
-    for speaker in speakers_to_add:
+    # Translate all names in one request; if that fails or the response
+    # cannot be split, fall back to one request per name
+    translations = None
+    if len(speakers_to_add) > 1:
         try:
-            # Use LLM to translate the name
-            result = llm_processor.execute({
-                'text': speaker,
-                'operation': 'translate_term',
-                'params': {
-                    'source_language': 'korean',
-                    'target_language': target_language
-                }
-            })
-
-            translated = result.get('output', speaker).strip()
+            translations = llm_processor.translate_terms_batch(
+                speakers_to_add, 'korean', target_language
+            )
+        except Exception as e:
+            print(f"    ⚠️  Batch translation failed, translating individually: {e}")
 
+    if translations is not None:
+        outcomes = [(translated, None) for translated in translations]
+    else:
+        # Requests are network-bound, so send them concurrently; map() keeps
+        # the results in speaker order
+        with ThreadPoolExecutor(max_workers=min(SPEAKER_TRANSLATION_WORKERS, len(speakers_to_add))) as executor:
+            outcomes = list(executor.map(
+                lambda speaker: _translate_speaker(speaker, target_language, llm_processor),
+                speakers_to_add
+            ))
+
+    # Add each speaker name
+    for speaker, (translated, error) in zip(speakers_to_add, outcomes):
+        if error is None:
             # Add to glossary
             glossary_data['terms'].append({
                 'original': speaker,
@@ -588,9 +806,8 @@ def update_glossary_with_speakers(
             })
             added_count += 1
             print(f"    + Added: {speaker} → {translated}")
-
-        except Exception as e:
-            print(f"    ⚠️  Failed to translate '{speaker}': {e}")
+        else:
+            print(f"    ⚠️  Failed to translate '{speaker}': {error}")
             # Add with original name as fallback
             glossary_data['terms'].append({
                 'original': speaker,
@@ -607,8 +824,7 @@ def update_glossary_with_speakers(
             from datetime import datetime
             glossary_data['last_updated'] = datetime.now().isoformat()
 
-            with open(glossary_path, 'w', encoding='utf-8') as f:
-                json.dump(glossary_data, f, ensure_ascii=False, indent=2)
+            save_json(glossary_data, glossary_path)
 
             print(f"  💾 Updated glossary with {added_count} new speakers")
         except Exception as e:
@@ -617,6 +833,19 @@ def update_glossary_with_speakers(
     return added_count
 
 
+def _load_episode_content(ep_file: Path) -> tuple:
+    """
+    Read the content of one episode file.
+
+    Returns:
+        Tuple of (ep_file, content or None, error or None)
+    """
+    try:
+        return ep_file, load_json(ep_file).get('content', ''), None
+    except Exception as e:
+        return ep_file, None, e
+
+
 def extract_characters_from_series(series_folder: Path, llm_processor: LLMProcessor) -> List[Dict]:
     """
     Phase 1: Extract character dictionary from entire series.
@@ -652,17 +881,24 @@ def extract_characters_from_series(series_folder: Path, llm_processor: LLMProces
 
     print(f"  📊 Scanning {len(episodes)} episodes for characters...")
 
-    # Combine all episode text
-    combined_text = ""
-    for ep_file in episodes:
-        try:
-            with open(ep_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                content = data.get('content', '')
-                ep_num = ep_file.stem.replace('episode_', '')
-                combined_text += f"\n=== Episode {ep_num} ===\n{content}\n"
-        except Exception as e:
-            print(f"  ⚠️  Failed to load {ep_file.name}: {e}")
+    # Read episodes on a thread pool (I/O releases the GIL); map() keeps
+    # them in episode order
+    with ThreadPoolExecutor(max_workers=EPISODE_LOAD_WORKERS) as executor:
+        loaded = list(executor.map(_load_episode_content, episodes))
+
+    # Combine all episode text (collected in a list and joined once, instead
+    # of growing one string per episode). Contents are appended as-is, not
+    # formatted into per-episode strings, so each is copied only by the join.
+    parts = []
+    for ep_file, content, error in loaded:
+        if error is not None:
+            print(f"  ⚠️  Failed to load {ep_file.name}: {error}")
+            continue
+        ep_num = ep_file.stem.replace('episode_', '')
+        parts.extend((f"\n=== Episode {ep_num} ===\n", content, "\n"))
+    del loaded
+    combined_text = ''.join(parts)
+    del parts
 
     if not combined_text:
         print("  ❌ No content found to extract characters from")
@@ -702,11 +938,192 @@ def extract_characters_from_series(series_folder: Path, llm_processor: LLMProces
         return []
 
 
+def _is_speaker_tagged(output_file: Path) -> bool:
+    """Check whether an output episode file already has speaker tags applied"""
+    if not output_file.exists():
+        return False
+    try:
+        # The flag is near the end of the file, so a tail scan usually
+        # answers without parsing the whole episode
+        if json_tail_contains(output_file, '"speaker_tags_applied": true'):
+            return True
+        existing_data = load_json(output_file)
+        return bool(existing_data.get('metadata', {}).get('speaker_tags_applied'))
+    except Exception:
+        return False
+
+
+def _tag_speaker_batch(
+    texts: List[str],
+    target_lang: str,
+    char_dict_json: str,
+    llm_processor: LLMProcessor,
+    use_cache: bool = True,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> Optional[List[str]]:
+    """
+    Speaker-tag several short episode texts in one LLM request (cached like
+    single-episode requests).
+
+    Returns:
+        Tagged texts in input order, or None if the response could not be split
+    """
+    with limiter.slot() if limiter else nullcontext():
+        return cached_call(llm_processor, {
+            'texts': texts,
+            'operation': 'tag_speakers_batch',
+            'params': {
+                'character_dict': char_dict_json,
+                'language': target_lang
+            }
+        }, lambda: {
+            'output': llm_processor.tag_speakers_batch(texts, char_dict_json, language=target_lang)
+        }, enabled=use_cache)['output']
+
+
+def _tag_episode_speaker_group(
+    episode_files: List[Path],
+    target_folder: Path,
+    target_lang: str,
+    char_dict_json: str,
+    character_count: int,
+    glossary: Dict,
+    existing_glossary_names: frozenset,
+    llm_processor: LLMProcessor,
+    use_cache: bool = True,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> tuple:
+    """
+    Speaker-tag a group of episodes, sending the short, not yet tagged ones in
+    one batched request and tagging the rest one by one.
+
+    Returns:
+        Tuple of (_tag_episode_speakers results in group order, batch messages)
+    """
+    return process_episode_group(
+        episode_files,
+        lambda episode_file, batch_result: _tag_episode_speakers(
+            episode_file, target_folder, target_lang, char_dict_json, character_count,
+            glossary, existing_glossary_names, llm_processor,
+            batch_result=batch_result,
+            use_cache=use_cache,
+            limiter=limiter
+        ),
+        lambda texts: _tag_speaker_batch(
+            texts, target_lang, char_dict_json, llm_processor, use_cache, limiter
+        ),
+        is_done=lambda episode_file: _is_speaker_tagged(target_folder / episode_file.name),
+        label='speaker tagging'
+    )
+
+
+def _tag_episode_speakers(
+    episode_file: Path,
+    target_folder: Path,
+    target_lang: str,
+    char_dict_json: str,
+    character_count: int,
+    glossary: Dict,
+    existing_glossary_names: frozenset,
+    llm_processor: LLMProcessor,
+    batch_result: Optional[tuple] = None,
+    use_cache: bool = True,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> tuple:
+    """
+    Speaker-tag one episode, post-process it and save it to target_folder.
+
+    Runs in a worker thread; progress messages are returned instead of
+    printed so the caller can write them from the main thread.
+
+    Args:
+        char_dict_json: Character dictionary, already serialized for the prompt
+        character_count: Number of characters in the dictionary
+        batch_result: (episode_data, tagged_text) if the episode was
+            already tagged in a batched request
+        use_cache: Reuse cached LLM responses for identical requests
+        limiter: Shared limit on concurrent LLM requests (None = unlimited)
+
+    Returns:
+        Tuple of (episode_name, status, error, messages, new_speakers) where
+        status is 'processed', 'skipped' or 'failed'
+    """
+    messages = []
+    output_file = target_folder / episode_file.name
+
+    # Skip if already processed
+    if batch_result is None and _is_speaker_tagged(output_file):
+        messages.append(f"     ⏭️  Skipped {episode_file.name}")
+        return episode_file.name, 'skipped', None, messages, set()
+
+    try:
+        # Load episode
+        if batch_result is not None:
+            episode_data, tagged_text = batch_result
+        else:
+            episode_data, tagged_text = load_json(episode_file), None
+
+        content = episode_data['content']
+
+        # Tag speakers with retry logic (unless tagged in a batch)
+        max_retries = 3
+
+        if tagged_text is None:
+            for attempt in range(max_retries):
+                try:
+                    with limiter.slot() if limiter else nullcontext():
+                        tag_result = cached_execute(llm_processor, {
+                            'text': content,
+                            'operation': 'tag_speakers',
+                            'params': {
+                                'character_dict': char_dict_json,
+                                'language': target_lang
+                            }
+                        }, enabled=use_cache)
+                    tagged_text = tag_result['output']
+                    break
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        messages.append(f"     ⚠️  Retry {attempt + 1}/{max_retries} ({episode_file.name}): {e}")
+                        time.sleep(backoff_delay(attempt, e))
+                    else:
+                        raise
+
+        if tagged_text is None:
+            raise Exception("Speaker tagging failed after retries")
+
+        # Translate speaker names, split/separate lines, consolidate speakers
+        tagged_text = post_process_tagged_text(tagged_text, glossary, target_lang)
+
+        # Extract new speakers for glossary update
+        new_speakers = extract_new_speakers_from_tagged(
+            tagged_text, existing_glossary_names
+        )
+
+        # Save tagged episode
+        episode_data['content'] = tagged_text
+        episode_data['metadata']['speaker_tags_applied'] = True
+        episode_data['metadata']['speaker_tagging_language'] = target_lang
+        episode_data['metadata']['character_count'] = character_count
+        episode_data['metadata']['consolidated'] = True
+
+        save_json(episode_data, output_file)
+
+    except Exception as e:
+        messages.append(f"     ❌ Failed {episode_file.name}: {e}")
+        return episode_file.name, 'failed', str(e), messages, set()
+
+    return episode_file.name, 'processed', None, messages, new_speakers
+
+
 def run_stage_3a(
     series_folder: Path,
     target_languages: Optional[List[str]] = None,
     skip_phase1: bool = False,
-    max_episodes: int = None
+    max_episodes: int = None,
+    max_workers: int = DEFAULT_TAG_WORKERS,
+    batch_size: int = DEFAULT_TAG_BATCH_SIZE,
+    use_cache: bool = True
 ):
     """
     Run Stage 3a: Speaker Tagging for each target language.
@@ -716,6 +1133,10 @@ def run_stage_3a(
         target_languages: List of target languages (default: all 3)
         skip_phase1: Skip character extraction if dictionary exists
         max_episodes: Maximum number of episodes to process (None = all)
+        max_workers: Number of episode groups tagged in parallel (default: 8);
+            also the upper bound of the adaptive LLM request limit
+        batch_size: Number of short episodes tagged per LLM request (default: 3)
+        use_cache: Reuse cached LLM responses for identical per-episode requests
     """
     if target_languages is None:
         target_languages = TARGET_LANGUAGES
@@ -740,15 +1161,18 @@ def run_stage_3a(
 
     llm_processor = LLMProcessor()
 
+    # Tagging requests back off (halve concurrency) when the provider
+    # rate-limits and creep back up to max_workers while requests succeed
+    limiter = AdaptiveConcurrencyLimiter(max(1, max_workers))
+
     # Phase 1: Extract character dictionary
     characters = []
     if skip_phase1 and character_dict_path.exists():
         print("⏭️  Skipping Phase 1 - Loading existing character dictionary")
         try:
-            with open(character_dict_path, 'r', encoding='utf-8') as f:
-                char_data = json.load(f)
-                characters = char_data.get('characters', [])
-                print(f"   Loaded {len(characters)} characters")
+            char_data = load_json(character_dict_path)
+            characters = char_data.get('characters', [])
+            print(f"   Loaded {len(characters)} characters")
         except Exception as e:
             print(f"   ⚠️  Failed to load: {e}")
             print("   Running character extraction...")
@@ -769,8 +1193,7 @@ def run_stage_3a(
         'characters': characters
     }
 
-    with open(character_dict_path, 'w', encoding='utf-8') as f:
-        json.dump(char_dict_data, f, ensure_ascii=False, indent=2)
+    save_json(char_dict_data, character_dict_path)
 
     print()
     print(f"💾 Character dictionary saved: {character_dict_path.name}")
@@ -803,11 +1226,7 @@ def run_stage_3a(
 
         # Load glossary and map character names
         glossary = load_glossary(series_folder, target_lang)
-        mapped_characters = map_character_names(
-            [char.copy() for char in characters],
-            glossary,
-            target_lang
-        )
+        mapped_characters = map_character_names(characters, glossary, target_lang)
 
         # Format character dict for this language
         lang_char_dict = []
@@ -820,6 +1239,10 @@ def run_stage_3a(
                 'aliases': char.get('aliases_display', char.get('aliases', []))
             })
 
+        # Serialized once per language (same format tag_speakers would use)
+        # instead of once per episode request
+        char_dict_json = json.dumps(lang_char_dict, ensure_ascii=False, indent=2)
+
         # Get all episode files
         episodes = sorted(source_folder.glob('episode_*.json'))
 
@@ -843,98 +1266,44 @@ def run_stage_3a(
 
         # Track new speakers for glossary update
         all_new_speakers = set()
-        existing_glossary_names = {
+        # Read-only and shared by all tagging workers
+        existing_glossary_names = frozenset(
             t.get('original', '') for t in glossary.get('terms', [])
-        }
-
-        with tqdm(total=len(episodes), desc="  Tagging", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar:
-            for episode_file in episodes:
-                output_file = target_folder / episode_file.name
-
-                # Skip if already processed
-                if output_file.exists():
-                    try:
-                        with open(output_file, 'r', encoding='utf-8') as f:
-                            existing_data = json.load(f)
-                            if existing_data.get('metadata', {}).get('speaker_tags_applied'):
-                                pbar.write(f"     ⏭️  Skipped {episode_file.name}")
-                                skipped_episodes.append(episode_file.name)
-                                pbar.update(1)
-                                continue
-                    except Exception:
-                        pass
-
-                try:
-                    # Load episode
-                    with open(episode_file, 'r', encoding='utf-8') as f:
-                        episode_data = json.load(f)
-
-                    content = episode_data['content']
-
-                    # Tag speakers with retry logic
-                    max_retries = 3
-                    retry_delay = 10
-                    tagged_text = None
-
-                    for attempt in range(max_retries):
-                        try:
-                            tag_result = llm_processor.execute({
-                                'text': content,
-                                'operation': 'tag_speakers',
-                                'params': {
-                                    'character_dict': lang_char_dict,
-                                    'language': target_lang
-                                }
-                            })
-                            tagged_text = tag_result['output']
-                            break
-                        except Exception as e:
-                            if attempt < max_retries - 1:
-                                pbar.write(f"     ⚠️  Retry {attempt + 1}/{max_retries}: {e}")
-                                time.sleep(retry_delay)
-                            else:
-                                raise
-
-                    if tagged_text is None:
-                        raise Exception("Speaker tagging failed after retries")
-
-                    # Post-process 1: Translate Korean speaker names to target language
-                    tagged_text = translate_speaker_tags_in_output(
-                        tagged_text, glossary, target_lang
-                    )
-
-                    # Post-process 2: Split lines with multiple speakers
-                    tagged_text = split_multiple_speakers_in_line(tagged_text)
-
-                    # Post-process 3: Separate mixed dialogue/narration
-                    tagged_text = separate_dialogue_and_narration(tagged_text, target_lang)
-
-                    # Post-process 4: Consolidate consecutive same-speaker lines
-                    tagged_text = consolidate_consecutive_speakers(tagged_text)
-
-                    # Extract new speakers for glossary update
-                    new_speakers = extract_new_speakers_from_tagged(
-                        tagged_text, existing_glossary_names
-                    )
-                    all_new_speakers.update(new_speakers)
-
-                    # Save tagged episode
-                    episode_data['content'] = tagged_text
-                    episode_data['metadata']['speaker_tags_applied'] = True
-                    episode_data['metadata']['speaker_tagging_language'] = target_lang
-                    episode_data['metadata']['character_count'] = len(lang_char_dict)
-                    episode_data['metadata']['consolidated'] = True
-
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(episode_data, f, ensure_ascii=False, indent=2)
-
-                    processed_count += 1
-                    pbar.set_postfix_str(f"{episode_file.name}")
-                    pbar.update(1)
+        )
 
-                except Exception as e:
-                    pbar.write(f"     ❌ Failed {episode_file.name}: {e}")
-                    failed_episodes.append((episode_file.name, str(e)))
+        # Episode groups are independent, so tag them concurrently; short
+        # episodes within a group share one LLM request (and one copy of the
+        # character dictionary). New speakers are merged on the main thread.
+        groups = group_episodes(episodes, batch_size)
+
+        with tqdm(total=len(episodes), desc="  Tagging", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar, \
+                ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    _tag_episode_speaker_group,
+                    group, target_folder, target_lang, char_dict_json, len(lang_char_dict),
+                    glossary, existing_glossary_names, llm_processor, use_cache, limiter
+                )
+                for group in groups
+            ]
+
+            for future in as_completed(futures):
+                results, batch_messages = future.result()
+
+                # One write per group: each pbar.write clears and redraws the bar
+                group_messages = batch_messages + [message for result in results for message in result[3]]
+                if group_messages:
+                    pbar.write('\n'.join(group_messages))
+
+                for name, status, error, _, new_speakers in results:
+                    if status == 'skipped':
+                        skipped_episodes.append(name)
+                    elif status == 'failed':
+                        failed_episodes.append((name, error))
+                    else:
+                        all_new_speakers.update(new_speakers)
+                        processed_count += 1
+                        pbar.set_postfix_str(name)
                     pbar.update(1)
 
         # Update glossary with new speakers (from Korean tagging only)
@@ -1032,6 +1401,23 @@ This stage:
         default=None,
         help='Maximum number of episodes to process'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_TAG_WORKERS,
+        help=f'Number of episode groups tagged in parallel (default: {DEFAULT_TAG_WORKERS})'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_TAG_BATCH_SIZE,
+        help=f'Short episodes speaker-tagged per LLM request, 1 disables batching (default: {DEFAULT_TAG_BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the LLM instead of reusing cached responses'
+    )
 
     args = parser.parse_args()
     series_folder = Path(args.series_folder)
@@ -1044,6 +1430,9 @@ This stage:
         series_folder,
         target_languages=args.langs,
         skip_phase1=args.skip_extraction,
-        max_episodes=args.max_episodes
+        max_episodes=args.max_episodes,
+        max_workers=args.workers,
+        batch_size=args.batch_size,
+        use_cache=not args.no_cache
     )
     sys.exit(0 if success else 1)
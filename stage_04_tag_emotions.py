@@ -8,12 +8,17 @@ Output: 04_tagged/{language}/
 """
 
 import sys
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from itertools import zip_longest
 from pathlib import Path
 from typing import List, Optional
 from tqdm import tqdm
 from processors.llm_processor import LLMProcessor
+from processors.json_io import load_json, save_json, json_tail_contains
+from processors.response_cache import cached_execute
+from processors.backoff import backoff_delay, AdaptiveConcurrencyLimiter
 
 # Target languages
 TARGET_LANGUAGES = ['korean', 'japanese', 'taiwanese']
@@ -25,18 +30,136 @@ LANGUAGE_DISPLAY = {
     'taiwanese': '🇹🇼 Taiwanese'
 }
 
+# Episodes tagged concurrently (each is one network-bound LLM request)
+DEFAULT_TAG_WORKERS = 8
+
+
+def _is_emotion_tagged(output_file: Path) -> bool:
+    """Check whether an output episode file already has emotion tags applied"""
+    if not output_file.exists():
+        return False
+    try:
+        # The flag is near the end of the file, so a tail scan usually
+        # answers without parsing the whole episode
+        if json_tail_contains(output_file, '"emotion_tags_applied": true'):
+            return True
+        existing_data = load_json(output_file)
+        return bool(existing_data.get('metadata', {}).get('emotion_tags_applied'))
+    except Exception:
+        return False
+
+
+def _tag_episode(
+    episode_file: Path,
+    target_folder: Path,
+    target_lang: str,
+    llm_processor: LLMProcessor,
+    use_cache: bool = True,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> tuple:
+    """
+    Tag one episode with emotions and save it to target_folder.
+
+    Runs in a worker thread; progress messages are returned instead of
+    printed so the caller can write them from the main thread.
+
+    Args:
+        use_cache: Reuse cached LLM responses for identical requests
+        limiter: Shared limit on concurrent LLM requests (None = unlimited)
+
+    Returns:
+        Tuple of (episode_name, status, error, messages) where status is
+        'processed', 'skipped' or 'failed'
+    """
+    messages = []
+    output_file = target_folder / episode_file.name
+
+    # Skip if already processed
+    if _is_emotion_tagged(output_file):
+        messages.append(f"     ⏭️  Skipped {episode_file.name}")
+        return episode_file.name, 'skipped', None, messages
+
+    try:
+        # Load episode
+        episode_data = load_json(episode_file)
+
+        content = episode_data['content']
+
+        # Tag emotions with retry logic
+        max_retries = 3
+        tagged_text = None
+
+        for attempt in range(max_retries):
+            try:
+                with limiter.slot() if limiter else nullcontext():
+                    tag_result = cached_execute(llm_processor, {
+                        'text': content,
+                        'operation': 'tag',
+                        'params': {'language': target_lang}
+                    }, enabled=use_cache)
+                tagged_text = tag_result['output']
+                break
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    messages.append(f"     ⚠️  Retry {attempt + 1}/{max_retries} ({episode_file.name}): {e}")
+                    time.sleep(backoff_delay(attempt, e))
+                else:
+                    raise
+
+        if tagged_text is None:
+            raise Exception("Emotion tagging failed after retries")
+
+        # Save tagged episode
+        episode_data['content'] = tagged_text
+        episode_data['metadata']['emotion_tags_applied'] = True
+        episode_data['metadata']['emotion_tagging_language'] = target_lang
+
+        save_json(episode_data, output_file)
+
+    except Exception as e:
+        messages.append(f"     ❌ Failed {episode_file.name}: {e}")
+
+        # Save failed episode without emotion tags (preserve original content)
+        try:
+            episode_data = load_json(episode_file)
+
+            episode_data['metadata']['emotion_tags_applied'] = False
+            episode_data['metadata']['emotion_tagging_failed'] = True
+            episode_data['metadata']['emotion_tagging_error'] = str(e)[:200]  # Truncate long errors
+            episode_data['metadata']['emotion_tagging_language'] = target_lang
+
+            save_json(episode_data, output_file)
+
+            messages.append(f"     💾 Saved {episode_file.name} without emotion tags")
+        except Exception as save_error:
+            messages.append(f"     ⚠️  Could not save fallback: {save_error}")
+
+        return episode_file.name, 'failed', str(e), messages
+
+    return episode_file.name, 'processed', None, messages
+
 
 def run_stage_4(
     series_folder: Path,
     target_languages: Optional[List[str]] = None,
-    max_episodes: int = None
+    max_episodes: int = None,
+    max_workers: int = DEFAULT_TAG_WORKERS,
+    use_cache: bool = True
 ):
     """
     Run Stage 4: Emotion Tagging for each target language
 
+    Languages are independent, so episodes of all target languages are
+    tagged together in one worker pool.
+
     Args:
         series_folder: Path to series folder
         target_languages: List of target languages (default: all 3)
+        max_episodes: Maximum number of episodes to process (None = all)
+        max_workers: Number of episodes tagged in parallel, across all
+            languages (default: 8); also the upper bound of the adaptive
+            LLM request limit
+        use_cache: Reuse cached LLM responses for identical requests
     """
     if target_languages is None:
         target_languages = TARGET_LANGUAGES
@@ -75,6 +198,9 @@ def run_stage_4(
     llm_processor = LLMProcessor()
     overall_success = True
 
+    # Collect episodes per language: {target_lang: (target_folder, episodes)}
+    language_jobs = {}
+
     for target_lang in target_languages:
         print(f"\n{'='*60}")
         print(f"  Tagging Emotions for {LANGUAGE_DISPLAY.get(target_lang, target_lang)}")
@@ -104,106 +230,65 @@ def run_stage_4(
             episodes = episodes[:max_episodes]
 
         print(f"  📊 Episodes to tag: {len(episodes)}")
-
-        # Track progress
-        failed_episodes = []
-        skipped_episodes = []
-        processed_count = 0
-
-        with tqdm(total=len(episodes), desc="  Tagging", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar:
-            for episode_file in episodes:
-                output_file = target_folder / episode_file.name
-
-                # Skip if already processed
-                if output_file.exists():
-                    try:
-                        with open(output_file, 'r', encoding='utf-8') as f:
-                            existing_data = json.load(f)
-                            if existing_data.get('metadata', {}).get('emotion_tags_applied'):
-                                pbar.write(f"     ⏭️  Skipped {episode_file.name}")
-                                skipped_episodes.append(episode_file.name)
-                                pbar.update(1)
-                                continue
-                    except Exception:
-                        pass
-
-                try:
-                    # Load episode
-                    with open(episode_file, 'r', encoding='utf-8') as f:
-                        episode_data = json.load(f)
-
-                    content = episode_data['content']
-
-                    # Tag emotions with retry logic
-                    max_retries = 3
-                    retry_delay = 10
-                    tagged_text = None
-
-                    for attempt in range(max_retries):
-                        try:
-                            tag_result = llm_processor.execute({
-                                'text': content,
-                                'operation': 'tag',
-                                'params': {'language': target_lang}
-                            })
-                            tagged_text = tag_result['output']
-                            break
-                        except Exception as e:
-                            if attempt < max_retries - 1:
-                                pbar.write(f"     ⚠️  Retry {attempt + 1}/{max_retries}: {e}")
-                                time.sleep(retry_delay)
-                            else:
-                                raise
-
-                    if tagged_text is None:
-                        raise Exception("Emotion tagging failed after retries")
-
-                    # Save tagged episode
-                    episode_data['content'] = tagged_text
-                    episode_data['metadata']['emotion_tags_applied'] = True
-                    episode_data['metadata']['emotion_tagging_language'] = target_lang
-
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(episode_data, f, ensure_ascii=False, indent=2)
-
-                    processed_count += 1
-                    pbar.set_postfix_str(f"{episode_file.name}")
-                    pbar.update(1)
-
-                except Exception as e:
-                    pbar.write(f"     ❌ Failed {episode_file.name}: {e}")
-                    failed_episodes.append((episode_file.name, str(e)))
-
-                    # Save failed episode without emotion tags (preserve original content)
-                    try:
-                        with open(episode_file, 'r', encoding='utf-8') as f:
-                            episode_data = json.load(f)
-
-                        episode_data['metadata']['emotion_tags_applied'] = False
-                        episode_data['metadata']['emotion_tagging_failed'] = True
-                        episode_data['metadata']['emotion_tagging_error'] = str(e)[:200]  # Truncate long errors
-                        episode_data['metadata']['emotion_tagging_language'] = target_lang
-
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(episode_data, f, ensure_ascii=False, indent=2)
-
-                        pbar.write(f"     💾 Saved {episode_file.name} without emotion tags")
-                    except Exception as save_error:
-                        pbar.write(f"     ⚠️  Could not save fallback: {save_error}")
-
-                    pbar.update(1)
-
+        language_jobs[target_lang] = (target_folder, episodes)
+
+    # Track progress per language
+    failed_episodes = {target_lang: [] for target_lang in language_jobs}
+    skipped_episodes = {target_lang: [] for target_lang in language_jobs}
+    processed_count = {target_lang: 0 for target_lang in language_jobs}
+
+    # Languages share no state, so episodes of all languages go into one
+    # pool; submitting them round-robin keeps every language progressing
+    # instead of finishing one language before starting the next
+    per_language = [
+        [(target_lang, episode_file) for episode_file in episodes]
+        for target_lang, (_, episodes) in language_jobs.items()
+    ]
+    interleaved = [job for group in zip_longest(*per_language) for job in group if job is not None]
+
+    if interleaved:
+        print()
+        # Tagging requests back off (halve concurrency) when the provider
+        # rate-limits and creep back up to max_workers while requests succeed
+        limiter = AdaptiveConcurrencyLimiter(max(1, max_workers))
+        with tqdm(total=len(interleaved), desc="  Tagging", bar_format='{desc}: {n}/{total}|{bar}| [{elapsed}<{remaining}]') as pbar, \
+                ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    _tag_episode, episode_file, language_jobs[target_lang][0],
+                    target_lang, llm_processor, use_cache, limiter
+                ): target_lang
+                for target_lang, episode_file in interleaved
+            }
+
+            for future in as_completed(futures):
+                target_lang = futures[future]
+                name, status, error, messages = future.result()
+                # One write per episode: each pbar.write clears and redraws the bar
+                if messages:
+                    pbar.write('\n'.join(f"{message} [{target_lang}]" for message in messages))
+
+                if status == 'skipped':
+                    skipped_episodes[target_lang].append(name)
+                elif status == 'failed':
+                    failed_episodes[target_lang].append((name, error))
+                else:
+                    processed_count[target_lang] += 1
+                    pbar.set_postfix_str(f"{target_lang}/{name}")
+                pbar.update(1)
+
+    for target_lang in language_jobs:
         # Summary for this language
         print()
         print(f"  {LANGUAGE_DISPLAY.get(target_lang, target_lang)} Summary:")
-        print(f"    Processed: {processed_count}")
-        print(f"    Skipped: {len(skipped_episodes)}")
-        print(f"    Failed: {len(failed_episodes)}")
+        print(f"    Processed: {processed_count[target_lang]}")
+        print(f"    Skipped: {len(skipped_episodes[target_lang])}")
+        print(f"    Failed: {len(failed_episodes[target_lang])}")
 
-        if failed_episodes:
+        if failed_episodes[target_lang]:
             overall_success = False
             print(f"    ⚠️  Failed episodes:")
-            for ep_name, error in failed_episodes[:5]:
+            for ep_name, error in failed_episodes[target_lang][:5]:
                 print(f"       - {ep_name}: {error}")
 
     print()
@@ -260,6 +345,17 @@ Run stage_03a_speaker_tagging.py first for speaker-tagged input.
         default=None,
         help='Maximum number of episodes to process'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_TAG_WORKERS,
+        help=f'Number of episodes tagged in parallel across all languages (default: {DEFAULT_TAG_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the LLM instead of reusing cached responses'
+    )
 
     args = parser.parse_args()
     series_folder = Path(args.series_folder)
@@ -268,5 +364,11 @@ Run stage_03a_speaker_tagging.py first for speaker-tagged input.
         print(f"❌ Series folder not found: {series_folder}")
         sys.exit(1)
 
-    success = run_stage_4(series_folder, target_languages=args.langs, max_episodes=args.max_episodes)
+    success = run_stage_4(
+        series_folder,
+        target_languages=args.langs,
+        max_episodes=args.max_episodes,
+        max_workers=args.workers,
+        use_cache=not args.no_cache
+    )
     sys.exit(0 if success else 1)
@@ -8,26 +8,67 @@ Automatically generates voice using ElevenLabs Voice Design API
 import sys
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from processors.llm_processor import LLMProcessor
 from processors.voice_generator import VoiceGenerator
+from processors.episode_utils import list_episode_files
+from processors.json_io import load_json, save_json
 from processors.prompts import VOICE_TEMPLATE_NARRATIVE, VOICE_TEMPLATE_EMOTIONAL
 
-# Country code mapping for voice names
-COUNTRY_CODES = {
-    'korean': 'KR',
-    'japanese': 'JP',
-    'taiwanese': 'TW'
+# Per-language settings: flag emoji for progress output, country code for
+# voice names, and sample text for voice preview (min 100 chars required by
+# ElevenLabs API)
+LANGUAGE_CONFIG = {
+    'korean': {
+        'emoji': '🇰🇷',
+        'country_code': 'KR',
+        'sample_text': "안녕하세요, 여러분. 저는 오디오북 내레이터입니다. 오늘 여러분께 아름다운 이야기를 들려드리겠습니다. 따뜻하고 편안한 목소리로 여러분을 이야기 속 세계로 안내해 드릴게요. 함께 떠나볼까요?"
+    },
+    'japanese': {
+        'emoji': '🇯🇵',
+        'country_code': 'JP',
+        'sample_text': "こんにちは、皆さん。私はオーディオブックのナレーターです。今日は皆さんに美しい物語をお届けします。温かく落ち着いた声で、物語の世界へとご案内いたします。心に響く言葉を大切に紡ぎながら、一緒に旅に出かけましょう。どうぞ、ゆっくりとお聴きください。"
+    },
+    'taiwanese': {
+        'emoji': '🇹🇼',
+        'country_code': 'TW',
+        'sample_text': "大家好，我是有聲書的旁白。今天我要為大家講述一個美麗的故事。我會用溫暖舒適的聲音，帶領大家進入故事的世界。每一個字句都承載著情感與溫度，希望這段故事能夠觸動您的心靈。現在，請放鬆心情，讓我們一起開始這段美好的旅程吧。"
+    }
+}
+
+# Used for languages missing from LANGUAGE_CONFIG
+DEFAULT_LANGUAGE_CONFIG = {
+    'emoji': '🌏',
+    'country_code': 'XX',
+    'sample_text': LANGUAGE_CONFIG['korean']['sample_text']
+}
+
+# Default ElevenLabs voice settings written to every audio_config.json
+DEFAULT_VOICE_SETTINGS = {
+    'stability': 0.5,
+    'similarity_boost': 0.75,
+    'style': 0.0,
+    'use_speaker_boost': True
 }
 
-# Sample texts for voice preview (min 100 chars required by ElevenLabs API)
-SAMPLE_TEXTS = {
-    'korean': "안녕하세요, 여러분. 저는 오디오북 내레이터입니다. 오늘 여러분께 아름다운 이야기를 들려드리겠습니다. 따뜻하고 편안한 목소리로 여러분을 이야기 속 세계로 안내해 드릴게요. 함께 떠나볼까요?",
-    'japanese': "こんにちは、皆さん。私はオーディオブックのナレーターです。今日は皆さんに美しい物語をお届けします。温かく落ち着いた声で、物語の世界へとご案内いたします。心に響く言葉を大切に紡ぎながら、一緒に旅に出かけましょう。どうぞ、ゆっくりとお聴きください。",
-    'taiwanese': "大家好，我是有聲書的旁白。今天我要為大家講述一個美麗的故事。我會用溫暖舒適的聲音，帶領大家進入故事的世界。每一個字句都承載著情感與溫度，希望這段故事能夠觸動您的心靈。現在，請放鬆心情，讓我們一起開始這段美好的旅程吧。"
+# Default mixing settings for Stage 7
+DEFAULT_AUDIO_SETTINGS = {
+    'gap_duration_ms': 1000,
+    'music_volume': 0.3,
+    'fade_duration': 5.0,
+    'intro_music_duration': 30.0,
+    'outro_music_duration': 30.0,
+    'voice_start_delay': 5.0
 }
 
 
+def _list_lang_dirs(stage_04_tagged: Path) -> list:
+    """Sorted language folder names in 04_tagged/ (single os.scandir pass)"""
+    with os.scandir(stage_04_tagged) as entries:
+        return sorted(entry.name for entry in entries if entry.is_dir(follow_symlinks=False))
+
+
 def select_voice_template(template_type: str) -> str:
     """
     Select English voice template based on template type.
@@ -54,15 +95,13 @@ def parse_voice_description_output(output: str) -> tuple[str, str]:
     Returns:
         (description, characteristic) tuple
     """
-    if '---' in output:
-        parts = output.split('---')
-        description = parts[0].strip()
-        characteristic = parts[1].strip() if len(parts) > 1 else '내레이터'
-        # Clean up characteristic (remove quotes, extra whitespace)
-        characteristic = characteristic.strip('"\'').strip()
-        # Limit characteristic length
-        if len(characteristic) > 10:
-            characteristic = characteristic[:10]
+    head, separator, tail = output.partition('---')
+    if separator:
+        description = head.strip()
+        # Keyword ends at the next separator, if the model wrote one
+        characteristic = tail.partition('---')[0].strip()
+        # Clean up characteristic (remove quotes, extra whitespace) and limit length
+        characteristic = characteristic.strip('"\'').strip()[:10]
     else:
         # Fallback: use full output as description, default characteristic
         description = output.strip()
@@ -84,14 +123,14 @@ def select_source_stage(series_folder: Path):
         print("   Please run stage_04_tag_emotions.py first")
         return None, None
 
-    langs = sorted([d.name for d in stage_04_tagged.iterdir() if d.is_dir()])
+    langs = _list_lang_dirs(stage_04_tagged)
     if not langs:
         print(f"❌ No language folders found in {stage_04_tagged}")
         return None, None
 
     print("Available languages:")
     for i, lang in enumerate(langs, 1):
-        emoji = {'korean': '🇰🇷', 'japanese': '🇯🇵', 'taiwanese': '🇹🇼'}.get(lang, '🌏')
+        emoji = LANGUAGE_CONFIG.get(lang, DEFAULT_LANGUAGE_CONFIG)['emoji']
         print(f"  {i}. {emoji} {lang.replace('_', ' ').title()}")
     print()
 
@@ -137,7 +176,7 @@ def run_stage_5_preset(series_folder: Path, source_language: str = None):
         print("   Please run stage_04_tag_emotions.py first")
         return False
 
-    available_langs = sorted([d.name for d in stage_04_tagged.iterdir() if d.is_dir()])
+    available_langs = _list_lang_dirs(stage_04_tagged)
     if not available_langs:
         print(f"❌ No language folders found in {stage_04_tagged}")
         return False
@@ -168,8 +207,7 @@ def run_stage_5_preset(series_folder: Path, source_language: str = None):
         print(f"❌ series_metadata.json not found: {metadata_file}")
         return False
 
-    with open(metadata_file, 'r', encoding='utf-8') as f:
-        series_metadata = json.load(f)
+    series_metadata = load_json(metadata_file)
 
     # Language-specific voice_id mapping
     voice_id_map = {
@@ -221,8 +259,8 @@ def run_stage_5_preset(series_folder: Path, source_language: str = None):
 
     for lang in languages_to_process:
         print()
-        emoji = {'korean': '🇰🇷', 'japanese': '🇯🇵', 'taiwanese': '🇹🇼'}.get(lang, '🌏')
-        print(f"{emoji} Creating config for: {lang.upper()}")
+        lang_profile = LANGUAGE_CONFIG.get(lang, DEFAULT_LANGUAGE_CONFIG)
+        print(f"{lang_profile['emoji']} Creating config for: {lang.upper()}")
 
         # Get language-specific voice_id
         lang_voice_id = voice_id_map.get(lang)
@@ -233,33 +271,19 @@ def run_stage_5_preset(series_folder: Path, source_language: str = None):
         lang_output_dir = stage_05_audio / lang
         lang_output_dir.mkdir(parents=True, exist_ok=True)
 
-        country_code = COUNTRY_CODES.get(lang, 'XX')
         lang_config = {
             'series_name': series_folder.name,
             'source_language': lang,
-            'country_code': country_code,
+            'country_code': lang_profile['country_code'],
             'voice_id': lang_voice_id,
-            'voice_settings': {
-                'stability': 0.5,
-                'similarity_boost': 0.75,
-                'style': 0.0,
-                'use_speaker_boost': True
-            },
-            'audio_settings': {
-                'gap_duration_ms': 1000,
-                'music_volume': 0.3,
-                'fade_duration': 5.0,
-                'intro_music_duration': 30.0,
-                'outro_music_duration': 30.0,
-                'voice_start_delay': 5.0
-            },
+            'voice_settings': dict(DEFAULT_VOICE_SETTINGS),
+            'audio_settings': dict(DEFAULT_AUDIO_SETTINGS),
             'music_file': music_relative_path,
             'preset_mode': True
         }
 
         config_file = lang_output_dir / 'audio_config.json'
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(lang_config, f, ensure_ascii=False, indent=2)
+        save_json(lang_config, config_file)
 
         print(f"   ✅ Config saved: {lang}/audio_config.json")
 
@@ -287,6 +311,183 @@ def run_stage_5_preset(series_folder: Path, source_language: str = None):
     return True
 
 
+def _generate_background_music(voice_gen, music_prompt: str, music_path: Path) -> tuple:
+    """
+    Generate the shared background music with the ElevenLabs Music API.
+
+    Runs in a worker thread alongside the per-language voice design.
+
+    Returns:
+        Tuple of (music file name or None if generation failed, messages)
+    """
+    try:
+        voice_gen.generate_music(
+            prompt=music_prompt,
+            duration_ms=120000,
+            output_path=music_path
+        )
+    except Exception as e:
+        return None, [f"     ⚠️  Music generation failed: {e}"]
+
+    return music_path.name, [f"     ✅ Music generated: {music_path.name}"]
+
+
+def _setup_language_voice(
+    lang: str,
+    series_folder: Path,
+    stage_05_audio: Path,
+    series_summary: str,
+    genre: str,
+    llm_processor: LLMProcessor,
+    voice_gen,
+    music_prompt: str,
+    music_future,
+    voice_vars: dict = None
+) -> tuple:
+    """
+    Design the narrator voice for one language and save its audio_config.json.
+
+    Runs in a worker thread; output lines are returned instead of printed so
+    the caller can print each language as one block.
+
+    music_future: Future for the shared music generation (None if music is
+    not generated); awaited only before the config is written, so voice
+    design overlaps with it.
+    voice_vars: Variables from the multi-language extraction request; if
+    None, they are extracted for this language here.
+
+    Returns:
+        Tuple of (lang, voice_result or None if no episodes, messages)
+    """
+    messages = []
+    messages.append('')
+    messages.append(f"{'=' * 80}")
+    lang_profile = LANGUAGE_CONFIG.get(lang, DEFAULT_LANGUAGE_CONFIG)
+    messages.append(f"{lang_profile['emoji']} Processing: {lang.upper()}")
+    messages.append("=" * 80)
+    messages.append('')
+
+    source_stage = series_folder / '04_tagged' / lang
+    lang_output_dir = stage_05_audio / lang
+    lang_output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Get Episode 1 for this language (fall back to the first episode present)
+    episode_1_file = source_stage / 'episode_001.json'
+    if not episode_1_file.exists():
+        episodes = list_episode_files(source_stage)
+        if not episodes:
+            messages.append(f"  ❌ No episodes found for {lang}")
+            return lang, None, messages
+        episode_1_file = episodes[0]
+
+    episode_data = load_json(episode_1_file)
+    episode_title = episode_data.get('title', 'Episode 1')
+
+    messages.append(f"  📖 Using Episode 1: {episode_title}")
+
+    # Extract voice design variables for this language
+    if voice_vars:
+        messages.append(f"  🎤 Voice design variables for {lang} from multi-language request")
+    else:
+        messages.append(f"  🎤 Extracting voice design variables for {lang}...")
+        variables_result = llm_processor.execute({
+            'text': '',
+            'operation': 'extract_voice_variables',
+            'params': {
+                'series_summary': series_summary,
+                'genre': genre,
+                'target_language': lang
+            }
+        })
+
+        voice_vars = variables_result.get('metadata', {}).get('voice_variables')
+        if not voice_vars:
+            try:
+                voice_vars = json.loads(variables_result['output'])
+            except json.JSONDecodeError:
+                voice_vars = llm_processor._get_default_voice_variables(lang)
+
+    # Select template and assemble voice description
+    template_type = voice_vars.get('template_type', 'narrative')
+    template = select_voice_template(template_type)
+
+    try:
+        voice_description = template.format(**voice_vars)
+    except KeyError as e:
+        messages.append(f"     ⚠️  Missing variable {e}, using defaults")
+        default_vars = llm_processor._get_default_voice_variables(lang)
+        default_vars.update(voice_vars)
+        voice_description = template.format(**default_vars)
+
+    voice_characteristic = voice_vars.get('characteristic_keyword', 'Warm, Steady')
+
+    messages.append(f"     ✅ Variables: gender={voice_vars.get('gender')}, age={voice_vars.get('age')}")
+    messages.append(f"     📌 Nationality: {voice_vars.get('nationality')}")
+    messages.append(f"     📌 Characteristic: {voice_characteristic}")
+    messages.append('')
+    messages.append(f"  🎤 Voice Description:")
+    messages.append(f"     {voice_description[:150]}...")
+    messages.append('')
+
+    # Generate voice for this language
+    voice_id = None
+    if voice_gen:
+        messages.append(f"  🔊 Generating voice for {lang}...")
+        try:
+            voice_name = f"{lang_profile['country_code']}_{series_folder.name}_{voice_characteristic}"
+
+            result = voice_gen.design_and_save_voice(
+                name=voice_name,
+                voice_description=voice_description,
+                sample_text=lang_profile['sample_text'],
+                model="eleven_ttv_v3",
+                guidance_scale=3.0,
+                save_preview=True,
+                preview_path=lang_output_dir / 'voice_preview.mp3'
+            )
+
+            voice_id = result['voice_id']
+            messages.append(f"     ✅ Voice created: {voice_name}")
+            messages.append(f"     📌 Voice ID: {voice_id}")
+            messages.append(f"     🔊 Preview: {lang}/voice_preview.mp3")
+
+        except Exception as e:
+            messages.append(f"     ⚠️  Voice generation failed: {e}")
+    else:
+        messages.append(f"  ⚠️  Skipping voice generation (no API key or --skip-voice-api)")
+
+    # Save language-specific config (needs the shared music result)
+    music_file = music_future.result()[0] if music_future else None
+    lang_config = {
+        'series_name': series_folder.name,
+        'source_language': lang,
+        'country_code': lang_profile['country_code'],
+        'series_summary': series_summary,
+        'voice_description': voice_description,
+        'voice_characteristic': voice_characteristic,
+        'voice_variables': voice_vars,
+        'voice_template_type': template_type,
+        'voice_id': voice_id,
+        'voice_settings': dict(DEFAULT_VOICE_SETTINGS),
+        'audio_settings': dict(DEFAULT_AUDIO_SETTINGS),
+        'music_prompt': music_prompt,
+        'music_file': f'../background_music.mp3' if music_file else None,
+        'music_duration_ms': 120000 if music_file else None,
+        'created_from_episode': episode_title
+    }
+
+    config_file = lang_output_dir / 'audio_config.json'
+    save_json(lang_config, config_file)
+
+    messages.append(f"     ✅ Config saved: {lang}/audio_config.json")
+
+    return lang, {
+        'voice_id': voice_id,
+        'voice_name': f"{lang_profile['country_code']}_{series_folder.name}_{voice_characteristic}" if voice_id else None,
+        'config_file': str(config_file)
+    }, messages
+
+
 def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api: bool = False, use_preset: bool = False):
     """Run Stage 5: Audio Setup
 
@@ -312,7 +513,7 @@ def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api
         print("   Please run stage_04_tag_emotions.py first")
         return False
 
-    available_langs = sorted([d.name for d in stage_04_tagged.iterdir() if d.is_dir()])
+    available_langs = _list_lang_dirs(stage_04_tagged)
     if not available_langs:
         print(f"❌ No language folders found in {stage_04_tagged}")
         return False
@@ -350,8 +551,7 @@ def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api
 
     if series_metadata_file.exists():
         try:
-            with open(series_metadata_file, 'r', encoding='utf-8') as f:
-                series_metadata = json.load(f)
+            series_metadata = load_json(series_metadata_file)
             series_summary = series_metadata.get('synopsis', '')
             genre = series_metadata.get('genre', 'web novel')
             if series_summary:
@@ -363,17 +563,18 @@ def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api
     else:
         print(f"     ⚠️  series_metadata.json not found")
 
+    # One LLM client for the summary fallback, music prompt and all languages
+    llm_processor = LLMProcessor()
+
     # Fallback: Generate summary from first available episode
     if not series_summary:
         first_lang = languages_to_process[0]
         first_source = series_folder / '04_tagged' / first_lang
-        episodes = sorted(first_source.glob('episode_*.json'))
+        episodes = list_episode_files(first_source)
         if episodes:
-            with open(episodes[0], 'r', encoding='utf-8') as f:
-                episode_data = json.load(f)
+            episode_data = load_json(episodes[0])
             content = episode_data['content']
             print("  📝 Generating series summary from Episode 1 (fallback)...")
-            llm_processor = LLMProcessor()
             summary_result = llm_processor.execute({
                 'text': content,
                 'operation': 'summarize_series',
@@ -394,22 +595,22 @@ def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api
     print()
     print("-" * 80)
 
-    # Initialize processors
-    llm_processor = LLMProcessor()
+    # Initialize voice generator (shared by all language workers)
     elevenlabs_api_key = os.getenv('ELEVENLABS_API_KEY')
     voice_gen = None
     if not skip_voice_api and elevenlabs_api_key:
         voice_gen = VoiceGenerator(api_key=elevenlabs_api_key)
 
-    # Step 2: Generate background music (shared across all languages)
+    # Step 2: The music prompt and the voice variables for all languages are
+    # independent LLM requests, so send them concurrently
     music_prompt = None
     music_file = None
+    batched_voice_vars = {}
 
-    if voice_gen:
-        print()
-        print("  🎵 Generating background music (shared across all languages)...")
-        try:
-            music_result = llm_processor.execute({
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        music_prompt_future = None
+        if voice_gen:
+            music_prompt_future = executor.submit(llm_processor.execute, {
                 'text': '',
                 'operation': 'generate_music_prompt',
                 'params': {
@@ -417,167 +618,77 @@ def run_stage_5(series_folder: Path, source_language: str = None, skip_voice_api
                     'genre': genre
                 }
             })
+
+        voice_vars_future = None
+        if len(languages_to_process) > 1:
+            voice_vars_future = executor.submit(llm_processor.execute, {
+                'text': '',
+                'operation': 'extract_voice_variables_multi',
+                'params': {
+                    'series_summary': series_summary,
+                    'genre': genre,
+                    'target_languages': languages_to_process
+                }
+            })
+
+    if voice_vars_future:
+        print()
+        print("  🎤 Extracting voice design variables for all languages (one request)...")
+        try:
+            batched_voice_vars = voice_vars_future.result()['metadata']['voice_variables']
+            print(f"     ✅ Variables received for {len(batched_voice_vars)}/{len(languages_to_process)} languages")
+        except Exception as e:
+            print(f"     ⚠️  Multi-language extraction failed, extracting per language: {e}")
+
+    if music_prompt_future:
+        print()
+        print("  🎵 Generating background music (shared across all languages)...")
+        try:
+            music_result = music_prompt_future.result()
             music_prompt = music_result['output'].strip()
             print(f"     ✅ Music prompt generated ({len(music_prompt)} chars)")
             print()
             print("🎵 Music Prompt:", music_prompt[:100], "...")
             print()
-
-            music_path = stage_05_audio / 'background_music.mp3'
-            voice_gen.generate_music(
-                prompt=music_prompt,
-                duration_ms=120000,
-                output_path=music_path
-            )
-            music_file = 'background_music.mp3'
-            print(f"     ✅ Music generated: {music_file}")
         except Exception as e:
             print(f"     ⚠️  Music generation failed: {e}")
 
     print()
     print("=" * 80)
 
-    # Step 3: Process each language
+    # Step 3: Generate music and process each language
     voice_results = {}
 
-    for lang in languages_to_process:
-        print()
-        print(f"{'=' * 80}")
-        emoji = {'korean': '🇰🇷', 'japanese': '🇯🇵', 'taiwanese': '🇹🇼'}.get(lang, '🌏')
-        print(f"{emoji} Processing: {lang.upper()}")
-        print("=" * 80)
-        print()
-
-        source_stage = series_folder / '04_tagged' / lang
-        lang_output_dir = stage_05_audio / lang
-        lang_output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Get Episode 1 for this language
-        episodes = sorted(source_stage.glob('episode_*.json'))
-        if not episodes:
-            print(f"  ❌ No episodes found for {lang}")
-            continue
-
-        episode_1_file = next((e for e in episodes if 'episode_001' in e.name), episodes[0])
-        with open(episode_1_file, 'r', encoding='utf-8') as f:
-            episode_data = json.load(f)
-        episode_title = episode_data.get('title', 'Episode 1')
-
-        print(f"  📖 Using Episode 1: {episode_title}")
-
-        # Extract voice design variables for this language
-        print(f"  🎤 Extracting voice design variables for {lang}...")
-        variables_result = llm_processor.execute({
-            'text': '',
-            'operation': 'extract_voice_variables',
-            'params': {
-                'series_summary': series_summary,
-                'genre': genre,
-                'target_language': lang
-            }
-        })
-
-        voice_vars = variables_result.get('metadata', {}).get('voice_variables')
-        if not voice_vars:
-            try:
-                voice_vars = json.loads(variables_result['output'])
-            except json.JSONDecodeError:
-                voice_vars = llm_processor._get_default_voice_variables(lang)
-
-        # Select template and assemble voice description
-        template_type = voice_vars.get('template_type', 'narrative')
-        template = select_voice_template(template_type)
-
-        try:
-            voice_description = template.format(**voice_vars)
-        except KeyError as e:
-            print(f"     ⚠️  Missing variable {e}, using defaults")
-            default_vars = llm_processor._get_default_voice_variables(lang)
-            default_vars.update(voice_vars)
-            voice_description = template.format(**default_vars)
-
-        voice_characteristic = voice_vars.get('characteristic_keyword', 'Warm, Steady')
-
-        print(f"     ✅ Variables: gender={voice_vars.get('gender')}, age={voice_vars.get('age')}")
-        print(f"     📌 Nationality: {voice_vars.get('nationality')}")
-        print(f"     📌 Characteristic: {voice_characteristic}")
-        print()
-        print(f"  🎤 Voice Description:")
-        print(f"     {voice_description[:150]}...")
-        print()
-
-        # Generate voice for this language
-        voice_id = None
-        if voice_gen:
-            print(f"  🔊 Generating voice for {lang}...")
-            try:
-                sample_text = SAMPLE_TEXTS.get(lang, SAMPLE_TEXTS['korean'])
-                country_code = COUNTRY_CODES.get(lang, 'XX')
-                voice_name = f"{country_code}_{series_folder.name}_{voice_characteristic}"
-
-                result = voice_gen.design_and_save_voice(
-                    name=voice_name,
-                    voice_description=voice_description,
-                    sample_text=sample_text,
-                    model="eleven_ttv_v3",
-                    guidance_scale=3.0,
-                    save_preview=True,
-                    preview_path=lang_output_dir / 'voice_preview.mp3'
-                )
-
-                voice_id = result['voice_id']
-                print(f"     ✅ Voice created: {voice_name}")
-                print(f"     📌 Voice ID: {voice_id}")
-                print(f"     🔊 Preview: {lang}/voice_preview.mp3")
-
-            except Exception as e:
-                print(f"     ⚠️  Voice generation failed: {e}")
-        else:
-            print(f"  ⚠️  Skipping voice generation (no API key or --skip-voice-api)")
-
-        # Save language-specific config
-        country_code = COUNTRY_CODES.get(lang, 'XX')
-        lang_config = {
-            'series_name': series_folder.name,
-            'source_language': lang,
-            'country_code': country_code,
-            'series_summary': series_summary,
-            'voice_description': voice_description,
-            'voice_characteristic': voice_characteristic,
-            'voice_variables': voice_vars,
-            'voice_template_type': template_type,
-            'voice_id': voice_id,
-            'voice_settings': {
-                'stability': 0.5,
-                'similarity_boost': 0.75,
-                'style': 0.0,
-                'use_speaker_boost': True
-            },
-            'audio_settings': {
-                'gap_duration_ms': 1000,
-                'music_volume': 0.3,
-                'fade_duration': 5.0,
-                'intro_music_duration': 30.0,
-                'outro_music_duration': 30.0,
-                'voice_start_delay': 5.0
-            },
-            'music_prompt': music_prompt,
-            'music_file': f'../background_music.mp3' if music_file else None,
-            'music_duration_ms': 120000 if music_file else None,
-            'created_from_episode': episode_title
-        }
-
-        config_file = lang_output_dir / 'audio_config.json'
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(lang_config, f, ensure_ascii=False, indent=2)
-
-        print(f"     ✅ Config saved: {lang}/audio_config.json")
+    # Languages are independent (network-bound LLM + ElevenLabs calls), so
+    # set them up concurrently; each worker's output is printed as one block.
+    # Music generation runs alongside them: languages only need its result
+    # when writing their config.
+    with ThreadPoolExecutor(max_workers=len(languages_to_process) + 1) as executor:
+        music_future = None
+        if music_prompt is not None:
+            music_future = executor.submit(
+                _generate_background_music, voice_gen, music_prompt,
+                stage_05_audio / 'background_music.mp3'
+            )
 
-        voice_results[lang] = {
-            'voice_id': voice_id,
-            'voice_name': f"{country_code}_{series_folder.name}_{voice_characteristic}" if voice_id else None,
-            'config_file': str(config_file)
-        }
+        futures = [
+            executor.submit(
+                _setup_language_voice, lang, series_folder, stage_05_audio,
+                series_summary, genre, llm_processor, voice_gen, music_prompt, music_future,
+                batched_voice_vars.get(lang)
+            )
+            for lang in languages_to_process
+        ]
+
+        if music_future:
+            music_file, music_messages = music_future.result()
+            print('\n'.join(music_messages))
+
+        for future in as_completed(futures):
+            lang, result, messages = future.result()
+            print('\n'.join(messages))
+            if result is not None:
+                voice_results[lang] = result
 
     # Summary
     print()